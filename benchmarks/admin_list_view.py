@@ -0,0 +1,93 @@
+"""
+benchmarks/admin_list_view.py
+
+Compares per-cell list value lookups with the precompiled row renderer
+of the Flask-Admin model list view and times full list page renders.
+
+Usage: python benchmarks/admin_list_view.py [rows] [columns]
+
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib'))
+
+from flask import Flask, url_for
+from flask.ext.admin import Admin
+from flask.ext.admin.model import BaseModelView
+
+
+class Model(object):
+    def __init__(self, id, columns):
+        self.id = id
+
+        for i in range(columns):
+            setattr(self, 'col%d' % i, i if i % 3 else None)
+
+
+class BenchModelView(BaseModelView):
+    def __init__(self, data, columns):
+        self.data = data
+        self.column_list = ['col%d' % i for i in range(columns)]
+
+        super(BenchModelView, self).__init__(Model, endpoint='bench')
+
+    def get_pk_value(self, model):
+        return model.id
+
+    def scaffold_sortable_columns(self):
+        return dict()
+
+    def scaffold_form(self):
+        return None
+
+    def get_list(self, page, sort_field, sort_desc, search, filters):
+        return len(self.data), self.data
+
+
+def per_cell(view, data, return_url):
+    # What list template used to do for every row and cell
+    for row in data:
+        view.get_pk_value(row)
+        url_for('.edit_view', id=view.get_pk_value(row), url=return_url)
+        url_for('.delete_view', id=view.get_pk_value(row), url=return_url)
+
+        for c, _ in view._list_columns:
+            view.get_list_value(None, row, c)
+
+
+def batched(view, data, return_url):
+    edit_url = view._get_row_url('.edit_view', return_url)
+    delete_url = view._get_row_url('.delete_view', return_url)
+
+    for row, pk, values in view.get_list_rows(None, data):
+        edit_url(pk)
+        delete_url(pk)
+
+
+def main(rows=100, columns=15, number=50):
+    data = [Model(i, columns) for i in range(rows)]
+
+    app = Flask(__name__)
+    admin = Admin(app)
+    view = BenchModelView(data, columns)
+    admin.add_view(view)
+
+    print('%d rows, %d columns, %d runs' % (rows, columns, number))
+
+    with app.test_request_context('/admin/bench/'):
+        app.preprocess_request()
+        return_url = url_for('bench.index_view')
+
+        for func in (per_cell, batched):
+            t = timeit.timeit(lambda: func(view, data, return_url), number=number)
+            print('%-10s %8.3f ms/page' % (func.__name__, t * 1000 / number))
+
+    client = app.test_client()
+    t = timeit.timeit(lambda: client.get('/admin/bench/'), number=number)
+    print('%-10s %8.3f ms/page' % ('render', t * 1000 / number))
+
+
+if __name__ == '__main__':
+    main(*[int(v) for v in sys.argv[1:3]])
@@ -0,0 +1,66 @@
+"""
+benchmarks/flask_ext_imports.py
+
+Times the imports that go through the flask.ext import hook: the import of
+Flask-Admin in a fresh interpreter like on the start of an instance, and
+repeated imports of an extension that is not installed, like Flask-Admin
+does for Flask-BabelEx.  Pass the lib folder of another checkout to compare
+before and after a change.
+
+Usage: python benchmarks/flask_ext_imports.py [lib] [runs]
+
+"""
+import os
+import subprocess
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+STARTUP = '''
+import sys, time
+sys.path.insert(1, %(lib)r)
+start = time.time()
+from flask.ext.admin.base import MenuLink
+from flask_admin import Admin
+sys.stdout.write(repr(time.time() - start))
+'''
+
+MISSING_SETUP = '''
+import sys
+sys.path.insert(1, %(lib)r)
+import flask.ext
+'''
+
+MISSING = '''
+try:
+    import flask.ext.missing_extension
+except ImportError:
+    pass
+'''
+
+
+def main():
+    lib = len(sys.argv) > 1 and sys.argv[1] or os.path.join(HERE, '..', 'lib')
+    lib = os.path.abspath(lib)
+    runs = len(sys.argv) > 2 and int(sys.argv[2]) or 20
+    params = {'lib': lib}
+
+    # the first run writes the .pyc files
+    times = []
+    for x in range(runs + 1):
+        output = subprocess.check_output([sys.executable, '-c',
+                                          STARTUP % params])
+        times.append(float(output))
+    times = sorted(times[1:])
+    print('import flask.ext.admin in a new process: min %.2f ms, '
+          'median %.2f ms' % (times[0] * 1000, times[len(times) // 2] * 1000))
+
+    number = 1000
+    timer = timeit.Timer(MISSING, MISSING_SETUP % params)
+    best = min(timer.repeat(7, number)) / number
+    print('import of a missing extension: %.2f us' % (best * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+benchmarks/flask_jsonify.py
+
+Times JSON list responses of different sizes: jsonify pretty printed (the
+default), jsonify with JSONIFY_COMPACT, compact without sorted keys, and
+the streamed jsonify_iter.  Prints the time per response and its size.
+
+Usage: python benchmarks/flask_jsonify.py [sizes]
+
+"""
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib'))
+
+from flask import Flask, jsonify, jsonify_iter
+
+
+def make_records(count):
+    return [{'id': x, 'title': 'Todo number %d' % x, 'completed': x % 2 == 0,
+             'tags': ['home', 'work'], 'created': datetime(2013, 8, 1)}
+            for x in range(count)]
+
+
+def run(app, records, func):
+    with app.test_request_context():
+        response = func(records)
+        return sum(len(x) for x in response.iter_encoded())
+
+
+def main():
+    sizes = [int(x) for x in sys.argv[1:]] or [10, 1000, 10000]
+    modes = [
+        ('pretty', {}, lambda r: jsonify(items=r)),
+        ('compact', {'JSONIFY_COMPACT': True}, lambda r: jsonify(items=r)),
+        ('compact unsorted', {'JSONIFY_COMPACT': True,
+                              'JSON_SORT_KEYS': False},
+         lambda r: jsonify(items=r)),
+        ('iter compact', {'JSONIFY_COMPACT': True},
+         lambda r: jsonify_iter(r)),
+        ('iter unsorted', {'JSONIFY_COMPACT': True, 'JSON_SORT_KEYS': False},
+         lambda r: jsonify_iter(r)),
+    ]
+
+    print('%-18s %8s %12s %12s' % ('mode', 'records', 'ms', 'bytes'))
+    for size in sizes:
+        records = make_records(size)
+        number = max(1, 2000 // size)
+        for name, config, func in modes:
+            app = Flask(__name__)
+            app.config.update(config)
+            length = run(app, records, func)
+            best = min(timeit.repeat(lambda: run(app, records, func),
+                                     repeat=7, number=number)) / number
+            print('%-18s %8d %12.3f %12d' % (name, size, best * 1000, length))
+
+
+if __name__ == '__main__':
+    main()
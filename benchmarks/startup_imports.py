@@ -0,0 +1,104 @@
+"""
+benchmarks/startup_imports.py
+
+Reports how long importing every module takes when a module is imported
+into a fresh interpreter, to find what makes the cold start of an instance
+slow.  The self time of a module excludes the modules it imports itself.
+
+The App Engine SDK is put on the path like in test.py so that the
+application modules can be imported; set APP_ENGINE_SDK to its location.
+
+Usage: python benchmarks/startup_imports.py [module] [count]
+
+"""
+import os
+import sys
+import time
+import __builtin__
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_ENGINE_SDK = os.environ.get(
+    'APP_ENGINE_SDK', 'C:\Program Files (x86)\Google\google_appengine')
+LIBS = ['yaml-3.10',
+        'protorpc',
+        'jinja2-2.6'
+        ]
+
+sys.path.insert(1, os.path.join(HERE, '..'))
+sys.path.insert(1, os.path.join(HERE, '..', 'lib'))
+sys.path.append(APP_ENGINE_SDK)
+for LIB in LIBS:
+    sys.path.append(os.path.join(APP_ENGINE_SDK, 'lib', LIB))
+
+
+class ImportProfiler(object):
+    """Wraps ``__import__`` and records the total and the self time of
+    every import that loaded a new module.
+    """
+
+    def __init__(self):
+        self.timings = []
+        self._stack = []
+        self._original_import = None
+
+    def install(self):
+        self._original_import = __builtin__.__import__
+        __builtin__.__import__ = self._import
+
+    def uninstall(self):
+        __builtin__.__import__ = self._original_import
+
+    def _import(self, name, globals=None, locals=None, fromlist=None,
+                level=-1):
+        count = len(sys.modules)
+        # time spent in nested imports is subtracted from the self time
+        self._stack.append(0.0)
+        start = time.time()
+        try:
+            return self._original_import(name, globals, locals, fromlist,
+                                         level)
+        finally:
+            total = time.time() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            if len(sys.modules) > count:
+                self.timings.append((total - nested, total,
+                                     self._module_name(name, globals),
+                                     len(self._stack)))
+
+    def _module_name(self, name, globals):
+        if name in sys.modules or not globals:
+            return name
+        package = globals.get('__package__') or \
+            globals.get('__name__', '').rpartition('.')[0]
+        if package and package + '.' + name.lstrip('.') in sys.modules:
+            return package + '.' + name.lstrip('.')
+        return name
+
+
+def main():
+    module = len(sys.argv) > 1 and sys.argv[1] or 'main'
+    count = len(sys.argv) > 2 and int(sys.argv[2]) or 30
+
+    profiler = ImportProfiler()
+    profiler.install()
+    start = time.time()
+    try:
+        __import__(module)
+    finally:
+        profiler.uninstall()
+    total = time.time() - start
+
+    print('importing %s took %.1f ms, %d modules loaded' % (
+        module, total * 1000, len(profiler.timings)))
+    print('')
+    print('%10s %10s  %s' % ('self ms', 'total ms', 'module'))
+    for self_time, total_time, name, depth in sorted(profiler.timings,
+                                                     reverse=True)[:count]:
+        print('%10.2f %10.2f  %s%s' % (self_time * 1000, total_time * 1000,
+                                       '  ' * depth, name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+benchmarks/werkzeug_compress.py
+
+Measures the CPU cost and the bytes saved by the compression middleware
+for every zlib compression level.  The payloads are an admin style HTML
+list page and a JSON list response, each sent once as a whole and once
+streamed in small chunks.
+
+Usage: python benchmarks/werkzeug_compress.py [rows]
+
+"""
+import os
+import sys
+import json
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(1, os.path.join(HERE, '..', 'lib'))
+
+from werkzeug.wrappers import Response
+from werkzeug.contrib.compress import CompressionMiddleware
+
+
+def make_html(rows):
+    lines = ['<html><body><table class="table table-striped">']
+    for x in range(rows):
+        lines.append('<tr><td><input type="checkbox" name="rowid" '
+                     'value="%d"></td><td><a href="/admin/todo/edit/?id=%d">'
+                     'Todo item number %d</a></td><td>%s</td>'
+                     '<td>2013-07-%02d</td></tr>' % (
+                         x, x, x, x % 3 and 'open' or 'done', x % 28 + 1))
+    lines.append('</table></body></html>')
+    return [line.encode('utf-8') + b'\n' for line in lines]
+
+
+def make_json(rows):
+    items = [{'id': x, 'title': 'Todo item number %d' % x,
+              'completed': bool(x % 3), 'created': '2013-07-%02d' % (x % 28 + 1)}
+             for x in range(rows)]
+    data = json.dumps({'items': items}, indent=2).encode('utf-8')
+    return [data[x:x + 512] for x in range(0, len(data), 512)]
+
+
+def make_app(chunks, mimetype, streamed):
+    def app(environ, start_response):
+        if streamed:
+            response = Response(iter(chunks), mimetype=mimetype)
+        else:
+            response = Response(b''.join(chunks), mimetype=mimetype)
+        return response(environ, start_response)
+    return app
+
+
+def run(app):
+    environ = {'REQUEST_METHOD': 'GET', 'HTTP_ACCEPT_ENCODING': 'gzip'}
+    size = [0]
+    def start_response(status, headers, exc_info=None):
+        pass
+    app_iter = app(environ, start_response)
+    for chunk in app_iter:
+        size[0] += len(chunk)
+    getattr(app_iter, 'close', lambda: None)()
+    return size[0]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    payloads = [('html', make_html(rows), 'text/html'),
+                ('json', make_json(rows), 'application/json')]
+    print('%-6s %-9s %5s %10s %9s %12s' % ('type', 'mode', 'level',
+                                            'bytes', 'saved', 'us/response'))
+    for name, chunks, mimetype in payloads:
+        original = sum(len(x) for x in chunks)
+        for streamed in False, True:
+            app = make_app(chunks, mimetype, streamed)
+            mode = streamed and 'streamed' or 'whole'
+            best = min(timeit.repeat(lambda: run(app), number=20, repeat=3))
+            print('%-6s %-9s %5s %10d %8.1f%% %12.1f' % (
+                name, mode, '-', original, 0, best / 20 * 1e6))
+            for level in range(1, 10):
+                wrapped = CompressionMiddleware(app, compress_level=level)
+                size = run(wrapped)
+                best = min(timeit.repeat(lambda: run(wrapped), number=20,
+                                         repeat=3))
+                print('%-6s %-9s %5d %10d %8.1f%% %12.1f' % (
+                    name, mode, level, size, 100.0 - size * 100.0 / original,
+                    best / 20 * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+benchmarks/werkzeug_headers.py
+
+Times the header lookups a typical request and response go through
+with werkzeug's Headers and EnvironHeaders.
+
+Usage: python benchmarks/werkzeug_headers.py [number]
+
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib'))
+
+from werkzeug.datastructures import Headers, EnvironHeaders
+from werkzeug.test import create_environ
+from werkzeug.wrappers import Response
+
+
+RESPONSE_HEADERS = [
+    ('Content-Type', 'text/html; charset=utf-8'),
+    ('Content-Length', '1234'),
+    ('Cache-Control', 'private'),
+    ('Vary', 'Cookie'),
+    ('X-Frame-Options', 'SAMEORIGIN'),
+    ('Set-Cookie', 'session=abc; HttpOnly; Path=/'),
+    ('Set-Cookie', 'csrf=def; Path=/'),
+    ('Date', 'Mon, 19 Oct 2026 10:00:00 GMT'),
+]
+
+RESPONSE_PROBES = ['content-length', 'etag', 'cache-control', 'date',
+                   'last-modified', 'content-type', 'location',
+                   'content-encoding', 'vary', 'x-missing'] * 2
+
+REQUEST_PROBES = ['Host', 'User-Agent', 'Accept', 'Accept-Encoding',
+                  'Cookie', 'If-None-Match', 'If-Modified-Since',
+                  'Content-Type', 'Content-Length', 'X-Requested-With']
+
+
+def response_workload():
+    headers = Headers(RESPONSE_HEADERS)
+    for name in RESPONSE_PROBES:
+        name in headers
+        headers.get(name)
+    headers.getlist('set-cookie')
+    headers.set('Content-Length', '4321')
+    headers.add('ETag', '"abc"')
+    headers.get('etag')
+
+
+def response_object_workload():
+    response = Response('x' * 1234, headers=RESPONSE_HEADERS[2:7])
+    response.add_etag()
+    response.get_wsgi_headers(ENVIRON)
+
+
+ENVIRON = create_environ('/admin/todo/', 'http://localhost/', headers=[
+    ('User-Agent', 'Mozilla/5.0'), ('Accept', 'text/html'),
+    ('Accept-Encoding', 'gzip'), ('Cookie', 'session=abc'),
+])
+
+
+def request_workload():
+    headers = EnvironHeaders(ENVIRON)
+    for name in REQUEST_PROBES:
+        headers.get(name)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, func in (('response headers', response_workload),
+                       ('response object', response_object_workload),
+                       ('environ headers', request_workload)):
+        best = min(timeit.repeat(func, number=number, repeat=3))
+        print('%-18s %8.2f us' % (name, best / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
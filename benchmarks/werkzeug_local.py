@@ -0,0 +1,67 @@
+"""
+benchmarks/werkzeug_local.py
+
+Measures the cost of a single access to the Flask context locals: the
+topmost item of a LocalStack, resolving the request proxy, an attribute
+access through it, and the same access while the proxy is bound with
+bind_proxies.  Pass the lib folder of another checkout to compare before
+and after a change.
+
+Usage: python benchmarks/werkzeug_local.py [lib]
+
+"""
+import os
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = len(sys.argv) > 1 and sys.argv[1] or os.path.join(HERE, '..', 'lib')
+
+sys.path.insert(1, os.path.abspath(LIB))
+
+import flask
+from flask import Flask, request
+
+try:
+    from werkzeug.local import bind_proxies
+except ImportError:
+    bind_proxies = None
+
+
+STATEMENTS = [
+    ('stack top', '_request_ctx_stack.top'),
+    ('request proxy', 'request._get_current_object()'),
+    ('request.args', 'request.args'),
+    ('real request.args', 'real_request.args'),
+]
+
+SETUP = 'from __main__ import _request_ctx_stack, request, real_request'
+
+_request_ctx_stack = flask._request_ctx_stack
+real_request = None
+
+
+def measure(stmt, number=200000):
+    timer = timeit.Timer(stmt, SETUP)
+    return min(timer.repeat(7, number)) / number
+
+
+def main():
+    global real_request
+    app = Flask(__name__)
+    ctx = app.test_request_context('/?page=1')
+    ctx.push()
+    real_request = request._get_current_object()
+
+    results = [(name, measure(stmt)) for name, stmt in STATEMENTS]
+    if bind_proxies is not None:
+        with bind_proxies(request):
+            results.append(('bound request.args', measure('request.args')))
+
+    for name, seconds in results:
+        print('%-20s %8.0f ns' % (name, seconds * 1e9))
+    ctx.pop()
+
+
+if __name__ == '__main__':
+    main()
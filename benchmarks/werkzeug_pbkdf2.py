@@ -0,0 +1,50 @@
+"""
+benchmarks/werkzeug_pbkdf2.py
+
+Compares the native hashlib PBKDF2 path of werkzeug.security with the
+pure Python fallback and times cached password hash checks.
+
+Usage: python benchmarks/werkzeug_pbkdf2.py [iterations] [repeat]
+
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib'))
+
+from werkzeug import security
+from werkzeug.security import generate_password_hash, check_password_hash, \
+     PasswordHashCache
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    sha1 = security._hash_funcs['sha1']
+
+    def python():
+        security._pbkdf2_bin_python(b'password', b'saltsalt', iterations,
+                                    None, sha1)
+
+    def native():
+        security.pbkdf2_bin(b'password', b'saltsalt', iterations)
+
+    pwhash = generate_password_hash('password', 'pbkdf2:sha1:%d' % iterations)
+    cache = PasswordHashCache()
+
+    def cached():
+        check_password_hash(pwhash, 'password', cache=cache)
+
+    print('pbkdf2 sha1, %d iterations, best of 3 x %d' % (iterations, repeat))
+    if security._builtin_pbkdf2_hmac is None:
+        print('hashlib.pbkdf2_hmac is not available, both paths are Python')
+
+    for name, func in (('python', python), ('native', native),
+                       ('cached check', cached)):
+        best = min(timeit.repeat(func, number=repeat, repeat=3))
+        print('%-14s %8.3f ms' % (name, best / repeat * 1000))
+
+
+if __name__ == '__main__':
+    main()
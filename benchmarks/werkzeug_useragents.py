@@ -0,0 +1,66 @@
+"""
+benchmarks/werkzeug_useragents.py
+
+Times werkzeug's user agent parser on the corpus in useragents.txt.  The
+traffic mix repeats a few popular user agents much more often than the
+rest, like real traffic does.
+
+Usage: python benchmarks/werkzeug_useragents.py [requests]
+
+"""
+import os
+import sys
+import random
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(1, os.path.join(HERE, '..', 'lib'))
+
+from werkzeug.useragents import UserAgentParser
+
+
+def load_corpus():
+    with open(os.path.join(HERE, 'useragents.txt')) as f:
+        return [line.rstrip('\n') for line in f if line.strip()]
+
+
+def make_traffic(corpus, size):
+    rng = random.Random(42)
+    weights = [1.0 / (rank + 1) for rank in range(len(corpus))]
+    total = sum(weights)
+    traffic = []
+    for _ in range(size):
+        pick = rng.random() * total
+        for ua, weight in zip(corpus, weights):
+            pick -= weight
+            if pick <= 0:
+                break
+        traffic.append(ua)
+    return traffic
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    corpus = load_corpus()
+    traffic = make_traffic(corpus, size)
+    parser = UserAgentParser()
+    uncached = UserAgentParser()
+    uncached.cache_size = 0
+
+    def run_uncached():
+        for ua in traffic:
+            uncached(ua)
+
+    def run_cached():
+        for ua in traffic:
+            parser(ua)
+
+    print('%d user agents, %d requests' % (len(corpus), size))
+    for name, func in (('uncached', run_uncached),
+                       ('cached', run_cached)):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print('%-12s %8.2f us per request' % (name, best / size * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+benchmarks/wtforms_forms.py
+
+Times wtforms form instantiation, processing and validation for forms with
+10, 50 and 200 fields, the way Flask-Admin creates its create and edit
+forms on every request: once from submitted form data and once from a
+model object.
+
+Usage: python benchmarks/wtforms_forms.py [repeat]
+
+"""
+import os
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(1, os.path.join(HERE, '..', 'lib'))
+
+from werkzeug.datastructures import MultiDict
+from wtforms import Form, fields, validators
+
+
+def make_form(size):
+    attrs = {}
+    for x in range(size):
+        if x % 3 == 0:
+            field = fields.IntegerField(validators=[validators.Optional()])
+        elif x % 3 == 1:
+            field = fields.TextField(validators=[validators.InputRequired(),
+                                                 validators.Length(max=50)])
+        else:
+            field = fields.BooleanField()
+        attrs['field_%d' % x] = field
+    return type('Form%d' % size, (Form,), attrs)
+
+
+def make_formdata(size):
+    data = MultiDict()
+    for x in range(size):
+        if x % 3 == 0:
+            data['field_%d' % x] = str(x)
+        elif x % 3 == 1:
+            data['field_%d' % x] = 'value %d' % x
+        else:
+            data['field_%d' % x] = 'y'
+    return data
+
+
+class Model(object):
+    pass
+
+
+def make_obj(size):
+    obj = Model()
+    for x in range(size):
+        setattr(obj, 'field_%d' % x, x)
+    return obj
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for size in (10, 50, 200):
+        form_class = make_form(size)
+        formdata = make_formdata(size)
+        obj = make_obj(size)
+
+        def submit():
+            form = form_class(formdata)
+            assert form.validate(), form.errors
+
+        def edit():
+            form_class(obj=obj)
+
+        for name, func in (('submit', submit), ('edit', edit)):
+            best = min(timeit.repeat(func, number=repeat, repeat=7))
+            print('%3d fields %-8s %8.1f us per form' % (
+                size, name, best / repeat * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+compile_templates.py
+
+Precompiles the templates of the app and Flask-Admin into
+compiled_templates.zip, which settings.py picks up when it exists.
+
+The compiled code only works with the Jinja2 version it was compiled with,
+so this uses the Jinja2 of the App Engine SDK that matches the version in
+app.yaml.  Run it again whenever a template changes.
+
+Usage: python compile_templates.py
+
+"""
+import os
+import sys
+
+APP_ENGINE_SDK = os.environ.get(
+    'APP_ENGINE_SDK', 'C:\Program Files (x86)\Google\google_appengine')
+LIBS = ['jinja2-2.6',
+        'yaml-3.10'
+        ]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TARGET = os.path.join(HERE, 'compiled_templates.zip')
+
+sys.path.insert(1, APP_ENGINE_SDK)
+for LIB in LIBS:
+    sys.path.insert(1, os.path.join(APP_ENGINE_SDK, 'lib', LIB))
+sys.path.insert(1, os.path.join(HERE, 'lib'))
+
+
+def main():
+    # compile against the template folders, not an older bundle; settings.py
+    # looks for it when main is imported
+    if os.path.exists(TARGET):
+        os.remove(TARGET)
+
+    from flask.templating import precompile_templates
+    from main import flask_app
+
+    precompile_templates(flask_app, TARGET,
+                         filter_func=lambda name: not name.startswith('.'))
+    print('Compiled templates to %s' % TARGET)
+
+
+if __name__ == '__main__':
+    main()
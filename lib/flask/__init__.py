@@ -44,6 +44,7 @@ from . import json
 # This was the only thing that flask used to export at one point and it had
 # a more generic name.
 jsonify = json.jsonify
+jsonify_iter = json.jsonify_iter
 
 # backwards compat, goes away in 1.0
 from .sessions import SecureCookieSession as Session
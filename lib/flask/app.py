@@ -17,6 +17,8 @@ from itertools import chain
 from functools import update_wrapper
 
 from werkzeug.datastructures import ImmutableDict
+from jinja2 import BytecodeCache, FileSystemBytecodeCache, \
+     MemcachedBytecodeCache
 from werkzeug.routing import Map, Rule, RequestRedirect, BuildError
 from werkzeug.exceptions import HTTPException, InternalServerError, \
      MethodNotAllowed, BadRequest
@@ -285,14 +287,21 @@ class Flask(_PackageBoundObject):
         'SESSION_COOKIE_PATH':                  None,
         'SESSION_COOKIE_HTTPONLY':              True,
         'SESSION_COOKIE_SECURE':                False,
+        'SESSION_REFRESH_WINDOW':               None,
         'MAX_CONTENT_LENGTH':                   None,
         'SEND_FILE_MAX_AGE_DEFAULT':            12 * 60 * 60, # 12 hours
+        'SEND_FILE_BUFFER_SIZE':                64 * 1024,
         'TRAP_BAD_REQUEST_ERRORS':              False,
         'TRAP_HTTP_EXCEPTIONS':                 False,
         'PREFERRED_URL_SCHEME':                 'http',
         'JSON_AS_ASCII':                        True,
         'JSON_SORT_KEYS':                       True,
         'JSONIFY_PRETTYPRINT_REGULAR':          True,
+        'JSONIFY_COMPACT':                      False,
+        'TEMPLATES_BYTECODE_CACHE':             None,
+        'TEMPLATES_PRECOMPILED_PATH':           None,
+        'TEMPLATES_BIND_PROXIES':               False,
+        'TEMPLATES_CACHE_SIZE':                 None,
     })
 
     #: The rule object to use for URL rules created.  This is used by
@@ -647,6 +656,11 @@ class Flask(_PackageBoundObject):
         options = dict(self.jinja_options)
         if 'autoescape' not in options:
             options['autoescape'] = self.select_jinja_autoescape
+        if 'bytecode_cache' not in options:
+            options['bytecode_cache'] = self.create_jinja_bytecode_cache()
+        if 'cache_size' not in options and \
+           self.config['TEMPLATES_CACHE_SIZE'] is not None:
+            options['cache_size'] = self.config['TEMPLATES_CACHE_SIZE']
         rv = Environment(self, **options)
         rv.globals.update(
             url_for=url_for,
@@ -662,6 +676,28 @@ class Flask(_PackageBoundObject):
         rv.filters['tojson'] = json.tojson_filter
         return rv
 
+    def create_jinja_bytecode_cache(self):
+        """Creates the Jinja2 bytecode cache from the
+        ``TEMPLATES_BYTECODE_CACHE`` configuration value.  If the value is a
+        string it is the directory of a
+        :class:`~jinja2.FileSystemBytecodeCache`, a
+        :class:`~jinja2.BytecodeCache` is used as it is and any other object
+        is expected to be a cache like the ones in
+        :mod:`werkzeug.contrib.cache` and is wrapped in a
+        :class:`~jinja2.MemcachedBytecodeCache`.  Returns `None` if the
+        value is not set.
+
+        .. versionadded:: 0.10.2
+        """
+        cache = self.config['TEMPLATES_BYTECODE_CACHE']
+        if cache is None:
+            return None
+        if isinstance(cache, string_types):
+            return FileSystemBytecodeCache(cache)
+        if isinstance(cache, BytecodeCache):
+            return cache
+        return MemcachedBytecodeCache(cache)
+
     def create_global_jinja_loader(self):
         """Creates the loader for the Jinja2 environment.  Can be used to
         override just the loader and keeping the rest unchanged.  It's
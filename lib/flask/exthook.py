@@ -16,6 +16,10 @@
 
     This is used by `flask.ext`.
 
+    The importer remembers which of the module choices an extension was
+    found under and which extensions could not be found at all, so that
+    repeated imports do not have to try all the choices again.
+
     :copyright: (c) 2011 by Armin Ronacher.
     :license: BSD, see LICENSE for more details.
 """
@@ -35,6 +39,10 @@ class ExtensionImporter(object):
         self.wrapper_module = wrapper_module
         self.prefix = wrapper_module + '.'
         self.prefix_cutoff = wrapper_module.count('.') + 1
+        # extension name -> the module choice it was found under
+        self._resolved = {}
+        # module name -> the sys.path it could not be found on
+        self._missing = {}
 
     def __eq__(self, other):
         return self.__class__.__module__ == other.__class__.__module__ and \
@@ -56,7 +64,9 @@ class ExtensionImporter(object):
         if fullname in sys.modules:
             return sys.modules[fullname]
         modname = fullname.split('.', self.prefix_cutoff)[self.prefix_cutoff]
-        for path in self.module_choices:
+        if self._missing.get(modname) == sys.path:
+            raise ImportError('No module named %s' % fullname)
+        for path in self.get_module_choices(modname):
             realname = path % modname
             try:
                 __import__(realname)
@@ -83,9 +93,23 @@ class ExtensionImporter(object):
             module = sys.modules[fullname] = sys.modules[realname]
             if '.' not in modname:
                 setattr(sys.modules[self.wrapper_module], modname, module)
+            self._resolved[modname.split('.', 1)[0]] = path
+            self._missing.pop(modname, None)
             return module
+        # a copy, the check above has to notice changes to the path
+        self._missing[modname] = list(sys.path)
         raise ImportError('No module named %s' % fullname)
 
+    def get_module_choices(self, modname):
+        """Returns the module choices for `modname` in the order they
+        should be tried.  Submodules of an extension are looked up under
+        the choice the extension itself was found under first.
+        """
+        resolved = self._resolved.get(modname.split('.', 1)[0])
+        if resolved is None:
+            return self.module_choices
+        return [resolved] + [x for x in self.module_choices if x != resolved]
+
     def is_important_traceback(self, important_module, tb):
         """Walks a traceback's frames and checks if any of the frames
         originated in the given important module.  If that is the case then we
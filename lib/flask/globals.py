@@ -38,7 +38,7 @@ def _find_app():
 # context locals
 _request_ctx_stack = LocalStack()
 _app_ctx_stack = LocalStack()
-current_app = LocalProxy(_find_app)
-request = LocalProxy(partial(_lookup_req_object, 'request'))
-session = LocalProxy(partial(_lookup_req_object, 'session'))
-g = LocalProxy(partial(_lookup_app_object, 'g'))
+current_app = LocalProxy(_find_app, bindable=True)
+request = LocalProxy(partial(_lookup_req_object, 'request'), bindable=True)
+session = LocalProxy(partial(_lookup_req_object, 'session'), bindable=True)
+g = LocalProxy(partial(_lookup_app_object, 'g'), bindable=True)
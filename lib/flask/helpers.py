@@ -11,6 +11,7 @@
 
 import os
 import sys
+import uuid
 import pkgutil
 import posixpath
 import mimetypes
@@ -26,7 +27,7 @@ except ImportError:
     from urlparse import quote as url_quote
 
 from werkzeug.datastructures import Headers
-from werkzeug.exceptions import NotFound
+from werkzeug.exceptions import NotFound, RequestedRangeNotSatisfiable
 
 # this was moved in 0.7
 try:
@@ -409,7 +410,7 @@ def get_flashed_messages(with_categories=False, category_filter=[]):
 
 def send_file(filename_or_fp, mimetype=None, as_attachment=False,
               attachment_filename=None, add_etags=True,
-              cache_timeout=None, conditional=False):
+              cache_timeout=None, conditional=False, buffer_size=None):
     """Sends the contents of a file to the client.  This will use the
     most efficient method available and configured.  By default it will
     try to use the WSGI server's file_wrapper support.  Alternatively
@@ -445,6 +446,12 @@ def send_file(filename_or_fp, mimetype=None, as_attachment=False,
     .. versionchanged:: 0.9
        cache_timeout pulls its default from application config, when None.
 
+    .. versionchanged:: 0.10.2
+       Conditional responses for files sent by filename support ``Range``
+       and ``If-Range`` requests and are answered with
+       ``206 Partial Content``, also for multiple ranges.  The
+       `buffer_size` parameter was added.
+
     :param filename_or_fp: the filename of the file to send.  This is
                            relative to the :attr:`~Flask.root_path` if a
                            relative path is specified.
@@ -466,8 +473,12 @@ def send_file(filename_or_fp, mimetype=None, as_attachment=False,
                           (default), this value is set by
                           :meth:`~Flask.get_send_file_max_age` of
                           :data:`~flask.current_app`.
+    :param buffer_size: the number of bytes read from the file at once.
+                        When `None` (default), the value of the
+                        ``SEND_FILE_BUFFER_SIZE`` config key is used.
     """
     mtime = None
+    size = None
     if isinstance(filename_or_fp, string_types):
         filename = filename_or_fp
         file = None
@@ -516,11 +527,16 @@ def send_file(filename_or_fp, mimetype=None, as_attachment=False,
         headers['Content-Length'] = os.path.getsize(filename)
         data = None
     else:
+        if buffer_size is None:
+            buffer_size = current_app.config['SEND_FILE_BUFFER_SIZE']
         if file is None:
             file = open(filename, 'rb')
             mtime = os.path.getmtime(filename)
-            headers['Content-Length'] = os.path.getsize(filename)
-        data = wrap_file(request.environ, file)
+            size = os.path.getsize(filename)
+            headers['Content-Length'] = size
+            if conditional:
+                headers['Accept-Ranges'] = 'bytes'
+        data = wrap_file(request.environ, file, buffer_size)
 
     rv = current_app.response_class(data, mimetype=mimetype, headers=headers,
                                     direct_passthrough=True)
@@ -552,9 +568,114 @@ def send_file(filename_or_fp, mimetype=None, as_attachment=False,
             # ignore the 304 status code for x-sendfile.
             if rv.status_code == 304:
                 rv.headers.pop('x-sendfile', None)
+
+    if conditional and size is not None and rv.status_code == 200:
+        ranges = _get_requested_ranges(rv, size)
+        if ranges is not None:
+            _make_partial_response(rv, file, size, ranges, buffer_size)
     return rv
 
 
+def _get_requested_ranges(rv, size):
+    """Returns the byte ranges of a file of `size` bytes that were
+    requested with a ``Range`` header as ``(start, stop)`` tuples or `None`
+    if the whole file has to be sent.  ``If-Range`` is checked against
+    the etag and last modification date of the response `rv`.  If none
+    of the ranges can be satisfied
+    :exc:`~werkzeug.exceptions.RequestedRangeNotSatisfiable` is raised.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    rng = request.range
+    if rng is None or rng.units != 'bytes':
+        return None
+    if 'HTTP_IF_RANGE' in request.environ:
+        if_range = request.if_range
+        if if_range.etag is not None:
+            etag, weak = rv.get_etag()
+            if weak or etag != if_range.etag:
+                return None
+        elif if_range.date is None or rv.last_modified is None or \
+             rv.last_modified > if_range.date:
+            return None
+    ranges = []
+    for start, stop in rng.ranges:
+        if stop is None:
+            stop = size
+            if start < 0:
+                start = max(size + start, 0)
+        stop = min(stop, size)
+        if start < stop:
+            ranges.append((start, stop))
+    if not ranges:
+        exc = RequestedRangeNotSatisfiable()
+        exc.response = current_app.response_class(status=416, headers={
+            'Content-Range': 'bytes */%d' % size})
+        raise exc
+    if ranges == [(0, size)]:
+        return None
+    return ranges
+
+
+def _make_partial_response(rv, file, size, ranges, buffer_size):
+    """Turns the full file response `rv` into a ``206 Partial Content``
+    response for the given byte ranges of `file`.
+    """
+    rv.status_code = 206
+    rv.call_on_close(file.close)
+    if len(ranges) == 1:
+        start, stop = ranges[0]
+        rv.headers['Content-Range'] = 'bytes %d-%d/%d' % (start, stop - 1,
+                                                          size)
+        rv.headers['Content-Length'] = stop - start
+        file.seek(start)
+        if stop == size:
+            # the range reaches the end of the file, so the file wrapper
+            # of the server can still send it without copying.
+            rv.response = wrap_file(request.environ, file, buffer_size)
+        else:
+            rv.response = _iter_file_ranges(file, [(start, stop, None)],
+                                            buffer_size)
+        return
+
+    boundary = uuid.uuid4().hex
+    parts = []
+    length = 0
+    for start, stop in ranges:
+        part_header = ('--%s\r\nContent-Type: %s\r\n'
+                       'Content-Range: bytes %d-%d/%d\r\n\r\n' % (
+                       boundary, rv.mimetype, start, stop - 1, size)) \
+            .encode('latin1')
+        if parts:
+            part_header = b'\r\n' + part_header
+        parts.append((start, stop, part_header))
+        length += len(part_header) + stop - start
+    footer = ('\r\n--%s--\r\n' % boundary).encode('latin1')
+    rv.headers['Content-Type'] = 'multipart/byteranges; boundary=%s' % boundary
+    rv.headers['Content-Length'] = length + len(footer)
+    rv.response = _iter_file_ranges(file, parts, buffer_size, footer)
+
+
+def _iter_file_ranges(file, ranges, buffer_size, footer=None):
+    """Yields the ``(start, stop, header)`` ranges of `file` in chunks of
+    at most `buffer_size` bytes, each preceded by its header (if not
+    `None`), followed by the `footer`.
+    """
+    for start, stop, header in ranges:
+        if header is not None:
+            yield header
+        file.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = file.read(min(buffer_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    if footer is not None:
+        yield footer
+
+
 def safe_join(directory, filename):
     """Safely join `directory` and `filename`.
 
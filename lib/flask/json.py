@@ -10,6 +10,7 @@
 """
 import io
 import uuid
+from itertools import islice
 from datetime import datetime
 from .globals import current_app, request
 from ._compat import text_type, PY2
@@ -18,7 +19,9 @@ from werkzeug.http import http_date
 from jinja2 import Markup
 
 # Use the same json implementation as itsdangerous on which we
-# depend anyways.
+# depend anyways.  That is simplejson if it is installed, its C speedups
+# also work with sorted keys, and the json module of the standard library
+# otherwise.
 try:
     from itsdangerous import simplejson as _json
 except ImportError:
@@ -32,7 +35,10 @@ _slash_escape = '\\/' not in _json.dumps('/')
 
 __all__ = ['dump', 'dumps', 'load', 'loads', 'htmlsafe_dump',
            'htmlsafe_dumps', 'JSONDecoder', 'JSONEncoder',
-           'jsonify']
+           'jsonify', 'jsonify_iter']
+
+#: the separators of compact JSON responses
+_compact_separators = (',', ':')
 
 
 def _wrap_reader_for_text(fp, encoding):
@@ -212,17 +218,74 @@ def jsonify(*args, **kwargs):
     This function's response will be pretty printed if it was not requested
     with ``X-Requested-With: XMLHttpRequest`` to simplify debugging unless
     the ``JSONIFY_PRETTYPRINT_REGULAR`` config parameter is set to false.
+    If ``JSONIFY_COMPACT`` is enabled the response is never pretty printed
+    and has no whitespace after the separators.  With the json module of
+    the standard library only responses without indentation and sorted
+    keys are encoded by its C speedups, so set ``JSON_SORT_KEYS`` to false
+    as well if the order of the keys does not matter.
 
     .. versionadded:: 0.2
+
+    .. versionchanged:: 0.10.2
+       Added the ``JSONIFY_COMPACT`` config parameter.
+    """
+    if current_app.config['JSONIFY_COMPACT']:
+        rv = dumps(dict(*args, **kwargs), separators=_compact_separators)
+    else:
+        indent = None
+        if current_app.config['JSONIFY_PRETTYPRINT_REGULAR'] \
+            and not request.is_xhr:
+            indent = 2
+        rv = dumps(dict(*args, **kwargs), indent=indent)
+    return current_app.response_class(rv, mimetype='application/json')
+
+
+def jsonify_iter(iterable, batch_size=100, **kwargs):
+    """Creates a streamed :class:`~flask.Response` with a JSON array of the
+    items of `iterable`.  The items are encoded while the response is sent,
+    so a large result never has to be kept in memory as a whole::
+
+        @app.route('/todos.json')
+        def list_todos():
+            return jsonify_iter(todo.to_dict() for todo in Todo.query)
+
+    The items are encoded by the application's JSON encoder like with
+    :func:`dumps`, the keyword arguments are passed to it.  The array is
+    not indented and uses the compact separators if ``JSONIFY_COMPACT`` is
+    enabled.  `batch_size` items are encoded at once and sent as one
+    chunk.
+
+    As the status is sent before the first item is encoded, an error
+    while encoding cannot be turned into an error response anymore.  Like
+    with :func:`jsonify` keep in mind that top level arrays are not safe
+    for responses that old browsers could load with a ``<script>`` tag,
+    see :ref:`json-security`.
+
+    .. versionadded:: 0.10.2
     """
-    indent = None
-    if current_app.config['JSONIFY_PRETTYPRINT_REGULAR'] \
-        and not request.is_xhr:
-        indent = 2
-    return current_app.response_class(dumps(dict(*args, **kwargs),
-        indent=indent),
+    _dump_arg_defaults(kwargs)
+    if current_app.config['JSONIFY_COMPACT']:
+        kwargs.setdefault('separators', _compact_separators)
+    cls = kwargs.pop('cls')
+    # one encoder for all items, the generator has no application context
+    encoder = cls(**kwargs)
+    return current_app.response_class(
+        _iter_json_array(iter(iterable), encoder, batch_size),
         mimetype='application/json')
 
 
+def _iter_json_array(iterator, encoder, batch_size):
+    separator = '['
+    while 1:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            break
+        # encoding a list of items at once is a lot faster than encoding
+        # them one by one, the brackets are stripped again.
+        yield separator + encoder.encode(batch)[1:-1]
+        separator = encoder.item_separator
+    yield separator == '[' and '[]' or ']'
+
+
 def tojson_filter(obj, **kwargs):
     return Markup(htmlsafe_dumps(obj, **kwargs))
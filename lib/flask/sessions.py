@@ -3,21 +3,32 @@
     flask.sessions
     ~~~~~~~~~~~~~~
 
-    Implements cookie based sessions based on itsdangerous.
+    Implements cookie based sessions based on itsdangerous and server side
+    sessions stored in a werkzeug cache.
 
     :copyright: (c) 2012 by Armin Ronacher.
     :license: BSD, see LICENSE for more details.
 """
 
+import os
 import uuid
+import time
 import hashlib
+import binascii
 from datetime import datetime
 from werkzeug.http import http_date, parse_date
 from werkzeug.datastructures import CallbackDict
+from werkzeug.local import LocalProxy
 from . import Markup, json
 from ._compat import iteritems, text_type
 
-from itsdangerous import URLSafeTimedSerializer, BadSignature
+from itsdangerous import URLSafeTimedSerializer, Signer, BadSignature, \
+     base64_decode, bytes_to_int
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 
 def total_seconds(td):
@@ -101,6 +112,22 @@ class TaggedJSONSerializer(object):
 session_json_serializer = TaggedJSONSerializer()
 
 
+class PickleSerializer(object):
+    """A serializer that stores values in the compact binary format of the
+    highest available pickle protocol.  Only use this for data that never
+    leaves the server.
+    """
+
+    def dumps(self, value):
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, value):
+        return pickle.loads(value)
+
+
+session_pickle_serializer = PickleSerializer()
+
+
 class SecureCookieSession(CallbackDict, SessionMixin):
     """Baseclass for sessions based on signed cookies."""
 
@@ -111,6 +138,56 @@ class SecureCookieSession(CallbackDict, SessionMixin):
         self.modified = False
 
 
+class LazySession(LocalProxy):
+    """Stands in for the session of a request until it is used.  `loader`
+    is called without arguments on the first access and has to return the
+    session, every operation is then forwarded to it.  Converting it with
+    ``dict(session)`` works like for the session itself.  `issued` is the
+    (unverified) time the cookie was signed and is used to decide when it
+    needs to be refreshed.
+
+    .. versionadded:: 0.10.2
+    """
+    __slots__ = ('_loader', '_session', 'issued')
+
+    def __init__(self, loader, issued=None):
+        LocalProxy.__init__(self, None)
+        object.__setattr__(self, '_loader', loader)
+        object.__setattr__(self, '_session', None)
+        object.__setattr__(self, 'issued', issued)
+
+    @property
+    def loaded(self):
+        """`True` once the session was loaded."""
+        return self._session is not None
+
+    def _get_current_object(self):
+        rv = self._session
+        if rv is None:
+            rv = self._loader()
+            object.__setattr__(self, '_session', rv)
+            object.__setattr__(self, '_loader', None)
+        return rv
+
+
+class CacheSession(CallbackDict, SessionMixin):
+    """Baseclass for sessions stored in a cache.  `sid` is the session id
+    and `stored` the unix timestamp of the last time the session was
+    written to the cache or `None` for new sessions.
+
+    .. versionadded:: 0.10.2
+    """
+
+    def __init__(self, initial=None, sid=None, stored=None):
+        def on_update(self):
+            self.modified = True
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.stored = stored
+        self.new = stored is None
+        self.modified = False
+
+
 class NullSession(SecureCookieSession):
     """Class used to generate nicer error messages if sessions are not
     available.  Will still allow read-only access to the empty session
@@ -281,17 +358,66 @@ class SecureCookieSessionInterface(SessionInterface):
     #: such as datetime objects or tuples.
     serializer = session_json_serializer
     session_class = SecureCookieSession
+    #: the class that stands in for a session that is loaded from a
+    #: cookie.  The default defers verifying and decoding the cookie into
+    #: a :attr:`session_class` until the session is used.  If this is set
+    #: to `None` the cookie is decoded when the request starts.
+    #:
+    #: .. versionadded:: 0.10.2
+    lazy_session_class = LazySession
 
     def get_signing_serializer(self, app):
         if not app.secret_key:
             return None
-        signer_kwargs = dict(
-            key_derivation=self.key_derivation,
-            digest_method=self.digest_method
-        )
-        return URLSafeTimedSerializer(app.secret_key, salt=self.salt,
-                                      serializer=self.serializer,
-                                      signer_kwargs=signer_kwargs)
+        # Serializers keep the derived signing key around, so the last one
+        # is reused until the configuration changes.
+        params = (app.secret_key, self.salt, self.digest_method,
+                  self.key_derivation, self.serializer)
+        cached = getattr(self, '_serializer', None)
+        if cached is None or cached[0] != params:
+            signer_kwargs = dict(
+                key_derivation=self.key_derivation,
+                digest_method=self.digest_method
+            )
+            cached = self._serializer = (params, URLSafeTimedSerializer(
+                app.secret_key, salt=self.salt, serializer=self.serializer,
+                signer_kwargs=signer_kwargs))
+        return cached[1]
+
+    def get_cookie_issued(self, app, value):
+        """Returns the time the session cookie `value` was signed without
+        verifying the signature or `None` if it cannot be read.
+        """
+        try:
+            timestamp = value.rsplit('.', 2)[1]
+            return self.get_signing_serializer(app).make_signer() \
+                .timestamp_to_datetime(bytes_to_int(base64_decode(timestamp)))
+        except Exception:
+            return None
+
+    def should_set_cookie(self, app, session):
+        """Used by :meth:`save_session` to decide if the cookie has to be
+        sent again.  By default (``SESSION_REFRESH_WINDOW`` is `None`) the
+        cookie is sent with every response.  If a window is configured the
+        cookie is only sent if the session was modified or if it was signed
+        so long ago that less than the window is left of its lifetime.
+
+        Changes to mutable values in the session such as
+        ``session['items'].append(item)`` are not noticed by the session.
+        With a window they are only saved if :attr:`SessionMixin.modified`
+        is set to `True` explicitly.
+
+        .. versionadded:: 0.10.2
+        """
+        window = app.config['SESSION_REFRESH_WINDOW']
+        issued = getattr(session, 'issued', None)
+        if window is None or issued is None:
+            return True
+        # An untouched lazy session cannot have been modified.
+        if getattr(session, 'loaded', True) and session.modified:
+            return True
+        age = datetime.utcnow() - issued
+        return age >= app.permanent_session_lifetime - window
 
     def open_session(self, app, request):
         s = self.get_signing_serializer(app)
@@ -301,15 +427,22 @@ class SecureCookieSessionInterface(SessionInterface):
         if not val:
             return self.session_class()
         max_age = total_seconds(app.permanent_session_lifetime)
-        try:
-            data = s.loads(val, max_age=max_age)
+        def load():
+            try:
+                data = s.loads(val, max_age=max_age)
+            except BadSignature:
+                data = None
             return self.session_class(data)
-        except BadSignature:
-            return self.session_class()
+        if self.lazy_session_class is None:
+            return load()
+        return self.lazy_session_class(load, self.get_cookie_issued(app, val))
 
     def save_session(self, app, session, response):
         domain = self.get_cookie_domain(app)
         path = self.get_cookie_path(app)
+        # Checked first so that an untouched lazy session stays unloaded.
+        if not self.should_set_cookie(app, session):
+            return
         if not session:
             if session.modified:
                 response.delete_cookie(app.session_cookie_name,
@@ -324,4 +457,128 @@ class SecureCookieSessionInterface(SessionInterface):
                             domain=domain, path=path, secure=secure)
 
 
+class CacheSessionInterface(SessionInterface):
+    """A session interface that keeps the session data on the server in a
+    :class:`werkzeug.contrib.cache.BaseCache` and only stores a signed
+    session id in the cookie.  This keeps the cookie small no matter how
+    much is stored in the session::
+
+        from werkzeug.contrib.cache import MemcachedCache
+        app.session_interface = CacheSessionInterface(MemcachedCache())
+
+    The cache object is created once and used for all requests so cache
+    clients can keep their connections open.
+
+    Sessions are only written back to the cache if they were modified or
+    if less than the ``SESSION_REFRESH_WINDOW`` of their lifetime is left.
+    In the latter case the timeout in the cache and the cookie expiration
+    are extended (a sliding expiration).  If the window is `None` (the
+    default) unmodified sessions are never written and expire a lifetime
+    after they were last changed.  See
+    :meth:`SecureCookieSessionInterface.should_set_cookie` for changes to
+    mutable values in the session.
+
+    .. versionadded:: 0.10.2
+
+    :param cache: the cache used to store the sessions.
+    :param key_prefix: the prefix for the cache keys of the sessions.
+    """
+
+    #: the salt that is applied on top of the secret key when signing
+    #: the session id.
+    salt = 'cache-session'
+    #: the hash function to use for the signature.  The default is sha1
+    digest_method = staticmethod(hashlib.sha1)
+    #: the serializer for the session data stored in the cache.
+    serializer = session_pickle_serializer
+    session_class = CacheSession
+    pickle_based = True
+
+    def __init__(self, cache, key_prefix='session:'):
+        self.cache = cache
+        self.key_prefix = key_prefix
+        self._signer = None
+
+    def get_signer(self, app):
+        """Returns the signer for the session id cookie or `None` if no
+        secret key is set on the application.
+        """
+        if not app.secret_key:
+            return None
+        # like the signing serializer, only the last signer is kept
+        params = (app.secret_key, self.salt, self.digest_method)
+        cached = self._signer
+        if cached is None or cached[0] != params:
+            cached = self._signer = (params, Signer(
+                app.secret_key, salt=self.salt, key_derivation='hmac',
+                digest_method=self.digest_method))
+        return cached[1]
+
+    def generate_sid(self):
+        """Returns a new random session id."""
+        return binascii.hexlify(os.urandom(20)).decode('ascii')
+
+    def get_cache_key(self, sid):
+        return self.key_prefix + sid
+
+    def should_store(self, app, session):
+        """Used by :meth:`save_session` to decide if the session has to be
+        written to the cache (and the cookie sent) again.
+        """
+        if session.modified or session.stored is None:
+            return True
+        window = app.config['SESSION_REFRESH_WINDOW']
+        if window is None:
+            return False
+        age = time.time() - session.stored
+        return age >= total_seconds(app.permanent_session_lifetime - window)
+
+    def open_session(self, app, request):
+        signer = self.get_signer(app)
+        if signer is None:
+            return None
+        val = request.cookies.get(app.session_cookie_name)
+        if val:
+            try:
+                sid = signer.unsign(val).decode('ascii')
+            except (BadSignature, UnicodeError):
+                sid = None
+            if sid:
+                rv = self.cache.get(self.get_cache_key(sid))
+                if rv is not None:
+                    # the cache may hand out anything, start a new session
+                    # instead of failing the request if it cannot be read
+                    try:
+                        stored, data = self.serializer.loads(rv)
+                    except Exception:
+                        pass
+                    else:
+                        return self.session_class(data, sid=sid,
+                                                  stored=stored)
+        return self.session_class(sid=self.generate_sid())
+
+    def save_session(self, app, session, response):
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if not session:
+            if session.modified:
+                if not session.new:
+                    self.cache.delete(self.get_cache_key(session.sid))
+                response.delete_cookie(app.session_cookie_name,
+                                       domain=domain, path=path)
+            return
+        if not self.should_store(app, session):
+            return
+        timeout = total_seconds(app.permanent_session_lifetime)
+        val = self.serializer.dumps((int(time.time()), dict(session)))
+        self.cache.set(self.get_cache_key(session.sid), val, timeout=timeout)
+        httponly = self.get_cookie_httponly(app)
+        secure = self.get_cookie_secure(app)
+        expires = self.get_expiration_time(app, session)
+        cookie = self.get_signer(app).sign(session.sid.encode('ascii'))
+        response.set_cookie(app.session_cookie_name, cookie.decode('ascii'),
+                            expires=expires, httponly=httponly,
+                            domain=domain, path=path, secure=secure)
+
+
 from flask.debughelpers import UnexpectedUnicodeError
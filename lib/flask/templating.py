@@ -9,10 +9,13 @@
     :license: BSD, see LICENSE for more details.
 """
 import posixpath
-from jinja2 import BaseLoader, Environment as BaseEnvironment, \
-     TemplateNotFound
+from jinja2 import BaseLoader, ChoiceLoader, ModuleLoader, \
+     Environment as BaseEnvironment, TemplateNotFound
 
-from .globals import _request_ctx_stack, _app_ctx_stack
+from werkzeug.local import bind_proxies
+
+from .globals import _request_ctx_stack, _app_ctx_stack, current_app, \
+     request, session, g
 from .signals import template_rendered
 from .module import blueprint_is_module
 from ._compat import itervalues, iteritems
@@ -42,6 +45,10 @@ class Environment(BaseEnvironment):
     def __init__(self, app, **options):
         if 'loader' not in options:
             options['loader'] = app.create_global_jinja_loader()
+            precompiled_path = app.config['TEMPLATES_PRECOMPILED_PATH']
+            if precompiled_path and not app.debug:
+                options['loader'] = ChoiceLoader([
+                    ModuleLoader(precompiled_path), options['loader']])
         BaseEnvironment.__init__(self, **options)
         self.app = app
 
@@ -49,12 +56,49 @@ class Environment(BaseEnvironment):
 class DispatchingJinjaLoader(BaseLoader):
     """A loader that looks for templates in the application and all
     the blueprint folders.
+
+    Outside of debug mode the loader that found a template is remembered,
+    so that loading the same template again does not have to ask all the
+    loaders before it.  The remembered loaders are forgotten if a
+    blueprint is registered.
+
+    .. versionchanged:: 0.10.2
+       Added the cache of resolved template names.
     """
 
     def __init__(self, app):
         self.app = app
+        self._loader_cache = {}
+        self._blueprint_count = None
 
     def get_source(self, environment, template):
+        if self.app.debug:
+            return self._get_source_uncached(environment, template)
+
+        if self._blueprint_count != len(self.app.blueprints):
+            self._loader_cache.clear()
+            self._blueprint_count = len(self.app.blueprints)
+
+        cached = self._loader_cache.get(template)
+        if cached is not None:
+            loader, local_name = cached
+            try:
+                return loader.get_source(environment, local_name)
+            except TemplateNotFound:
+                # the template was removed, look for it again
+                self._loader_cache.pop(template, None)
+
+        for loader, local_name in self._iter_loaders(template):
+            try:
+                rv = loader.get_source(environment, local_name)
+            except TemplateNotFound:
+                continue
+            self._loader_cache[template] = (loader, local_name)
+            return rv
+
+        raise TemplateNotFound(template)
+
+    def _get_source_uncached(self, environment, template):
         for loader, local_name in self._iter_loaders(template):
             try:
                 return loader.get_source(environment, local_name)
@@ -105,9 +149,47 @@ class DispatchingJinjaLoader(BaseLoader):
         return list(result)
 
 
+def precompile_templates(app, target, zip='deflated', extensions=None,
+                         filter_func=None):
+    """Compiles all templates of the application, its blueprints and
+    extensions such as Flask-Admin into Python code and stores it in
+    `target`.  This is meant to run as a build step before deploying, the
+    result is picked up by setting ``TEMPLATES_PRECOMPILED_PATH`` to
+    `target`.  Templates that are not in the precompiled bundle are still
+    loaded from the template folders.
+
+    The compiled code only works with the Jinja2 version it was compiled
+    with and the same environment settings, so the bundle has to be built
+    again whenever either of them or a template changes.
+
+    .. versionadded:: 0.10.2
+
+    :param app: the application whose templates should be compiled.
+    :param target: a directory or the filename of a zip archive.
+    :param zip: the compression of the zip archive, ``'deflated'`` or
+                ``'stored'``.  Set it to `None` to write the modules into
+                the directory `target` instead.
+    :param extensions: a list of file extensions of the templates that
+                       are compiled.  Defaults to all templates.
+    :param filter_func: a callable that is called with the name of every
+                        template and returns `True` if it should be
+                        compiled.
+    """
+    app.jinja_env.compile_templates(target, extensions=extensions,
+                                    filter_func=filter_func, zip=zip,
+                                    ignore_errors=False)
+
+
 def _render(template, context, app):
     """Renders the template and fires the signal"""
-    rv = template.render(context)
+    if app.config['TEMPLATES_BIND_PROXIES']:
+        proxies = [current_app, g]
+        if _request_ctx_stack.top is not None:
+            proxies.extend((request, session))
+        with bind_proxies(*proxies):
+            rv = template.render(context)
+    else:
+        rv = template.render(context)
     template_rendered.send(app, template=template, context=context)
     return rv
 
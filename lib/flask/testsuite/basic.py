@@ -14,13 +14,16 @@ import uuid
 import flask
 import pickle
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from threading import Thread
 from flask.testsuite import FlaskTestCase, emits_module_deprecation_warning
 from flask._compat import text_type
 from werkzeug.exceptions import BadRequest, NotFound
 from werkzeug.http import parse_date
 from werkzeug.routing import BuildError
+from werkzeug.contrib.cache import SimpleCache
+from itsdangerous import Signer, BadSignature
+from flask.sessions import CacheSessionInterface
 
 
 class BasicFunctionalityTestCase(FlaskTestCase):
@@ -342,6 +345,199 @@ class BasicFunctionalityTestCase(FlaskTestCase):
         self.assert_equal(rv['u'], the_uuid)
         self.assert_equal(rv['t'], (1, 2, 3))
 
+    def test_session_serializer_cache(self):
+        app = flask.Flask(__name__)
+        app.secret_key = 'development-key'
+        interface = app.session_interface
+        s = interface.get_signing_serializer(app)
+        self.assert_true(interface.get_signing_serializer(app) is s)
+        self.assert_true(s.make_signer() is s.make_signer())
+        self.assert_true(s.make_signer('other') is not s.make_signer('other'))
+        val = s.dumps({'foo': 42})
+
+        app.secret_key = 'other-key'
+        s2 = interface.get_signing_serializer(app)
+        self.assert_true(s2 is not s)
+        self.assert_equal(s2.loads(s2.dumps({'foo': 42})), {'foo': 42})
+        self.assert_raises(BadSignature, s2.loads, val)
+
+        signer = Signer('development-key')
+        val = signer.sign(b'x')
+        self.assert_equal(signer.unsign(val), b'x')
+        signer.salt = 'other-salt'
+        self.assert_raises(BadSignature, signer.unsign, val)
+
+    def test_session_lazy_loading(self):
+        app = flask.Flask(__name__)
+        app.secret_key = 'development-key'
+        app.testing = True
+        app.config['SESSION_REFRESH_WINDOW'] = timedelta(days=1)
+
+        @app.route('/set')
+        def set_value():
+            flask.session['value'] = 42
+            return ''
+        @app.route('/get')
+        def get_value():
+            return text_type(flask.session['value'])
+        @app.route('/ignore')
+        def ignore():
+            return text_type(flask.session.loaded)
+        @app.route('/dict')
+        def as_dict():
+            session = flask.session._get_current_object()
+            return text_type(len(dict(session)))
+
+        c = app.test_client()
+        rv = c.get('/set')
+        self.assert_in('set-cookie', rv.headers)
+        rv = c.get('/ignore')
+        self.assert_equal(rv.data, b'False')
+        self.assert_not_in('set-cookie', rv.headers)
+        rv = c.get('/get')
+        self.assert_equal(rv.data, b'42')
+        self.assert_not_in('set-cookie', rv.headers)
+        self.assert_equal(c.get('/dict').data, b'1')
+
+        app.config['SESSION_REFRESH_WINDOW'] = app.permanent_session_lifetime
+        rv = c.get('/ignore')
+        self.assert_in('set-cookie', rv.headers)
+        self.assert_equal(c.get('/get').data, b'42')
+
+        app.config['SESSION_REFRESH_WINDOW'] = None
+        self.assert_in('set-cookie', c.get('/get').headers)
+
+        c.set_cookie('localhost', app.session_cookie_name, 'invalid')
+        rv = c.get('/ignore')
+        self.assert_equal(rv.data, b'False')
+        self.assert_equal(c.get('/dict').data, b'0')
+
+    def test_session_refresh_window_mutations(self):
+        app = flask.Flask(__name__)
+        app.secret_key = 'development-key'
+        app.testing = True
+
+        @app.route('/create')
+        def create():
+            flask.session['items'] = []
+            return ''
+        @app.route('/append')
+        def append():
+            flask.session['items'].append(len(flask.session['items']))
+            if 'modified' in flask.request.args:
+                flask.session.modified = True
+            return ''
+        @app.route('/items')
+        def items():
+            return text_type(flask.session['items'])
+
+        c = app.test_client()
+        c.get('/create')
+        c.get('/append')
+        self.assert_equal(c.get('/items').data, b'[0]')
+
+        # with a window mutations have to be marked as modifications
+        app.config['SESSION_REFRESH_WINDOW'] = timedelta(days=1)
+        c.get('/append')
+        self.assert_equal(c.get('/items').data, b'[0]')
+        c.get('/append?modified=1')
+        self.assert_equal(c.get('/items').data, b'[0, 1]')
+
+    def test_session_custom_class_lazy(self):
+        class CustomSession(flask.sessions.SecureCookieSession):
+            pass
+
+        class CustomSessionInterface(flask.sessions.SecureCookieSessionInterface):
+            session_class = CustomSession
+
+        app = flask.Flask(__name__)
+        app.secret_key = 'development-key'
+        app.testing = True
+        app.session_interface = CustomSessionInterface()
+
+        @app.route('/')
+        def index():
+            session = flask.session._get_current_object()
+            if isinstance(session, flask.sessions.LazySession):
+                session = session._get_current_object()
+            session['value'] = 42
+            return type(session).__name__
+
+        c = app.test_client()
+        self.assert_equal(c.get('/').data, b'CustomSession')
+        self.assert_equal(c.get('/').data, b'CustomSession')
+
+    def test_cache_session_interface(self):
+        class CountingCache(SimpleCache):
+            sets = 0
+            def set(self, *args, **kwargs):
+                self.sets += 1
+                return SimpleCache.set(self, *args, **kwargs)
+
+        cache = CountingCache()
+        app = flask.Flask(__name__)
+        app.secret_key = 'development-key'
+        app.testing = True
+        app.session_interface = CacheSessionInterface(cache)
+        app.config['SESSION_REFRESH_WINDOW'] = timedelta(days=1)
+
+        @app.route('/set')
+        def set_value():
+            flask.session['value'] = flask.Markup('<em>42</em>')
+            return ''
+        @app.route('/get')
+        def get_value():
+            return flask.session.get('value', 'missing')
+        @app.route('/clear')
+        def clear():
+            flask.session.clear()
+            return ''
+
+        c = app.test_client()
+        self.assert_equal(c.get('/get').data, b'missing')
+        self.assert_equal(cache.sets, 0)
+        rv = c.get('/set')
+        self.assert_equal(cache.sets, 1)
+        cookie = rv.headers['set-cookie']
+        self.assert_not_in('<em>', cookie)
+        rv = c.get('/get')
+        self.assert_equal(rv.data, b'<em>42</em>')
+        self.assert_not_in('set-cookie', rv.headers)
+        self.assert_equal(cache.sets, 1)
+
+        # the refresh window is reached
+        app.config['SESSION_REFRESH_WINDOW'] = app.permanent_session_lifetime
+        self.assert_in('set-cookie', c.get('/get').headers)
+        self.assert_equal(cache.sets, 2)
+
+        # without a window unmodified sessions are never written
+        app.config['SESSION_REFRESH_WINDOW'] = None
+        rv = c.get('/get')
+        self.assert_equal(rv.data, b'<em>42</em>')
+        self.assert_not_in('set-cookie', rv.headers)
+        self.assert_equal(cache.sets, 2)
+        c.get('/set')
+        self.assert_equal(cache.sets, 3)
+
+        sid = list(cache._cache)[0]
+        c.get('/clear')
+        self.assert_true(cache.get(sid) is None)
+        self.assert_equal(c.get('/get').data, b'missing')
+
+        c.set_cookie('localhost', app.session_cookie_name,
+                     sid[len('session:'):])
+        self.assert_equal(c.get('/get').data, b'missing')
+
+        # unreadable data in the cache starts a new session
+        c.get('/set')
+        sid = list(cache._cache)[0]
+        cache.set(sid, b'garbage')
+        rv = c.get('/get')
+        self.assert_equal(rv.status_code, 200)
+        self.assert_equal(rv.data, b'missing')
+        self.assert_true(app.session_interface.get_signer(app) is
+                         app.session_interface.get_signer(app))
+
     def test_flashes(self):
         app = flask.Flask(__name__)
         app.secret_key = 'testkey'
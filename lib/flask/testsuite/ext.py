@@ -127,6 +127,39 @@ class ExtImportHookTestCase(FlaskTestCase):
                 next = next.tb_next
             self.assert_in('flask_broken/__init__.py', next.tb_frame.f_code.co_filename)
 
+    def get_importer(self):
+        from flask.exthook import ExtensionImporter
+        for item in sys.meta_path:
+            if isinstance(item, ExtensionImporter):
+                return item
+
+    def test_flaskext_resolved_choice_cache(self):
+        importer = self.get_importer()
+        import flask.ext.oldext_package
+        self.assert_equal(importer.get_module_choices('oldext_package'),
+                          ['flaskext.%s', 'flask_%s'])
+        self.assert_equal(importer.get_module_choices('oldext_package.x'),
+                          ['flaskext.%s', 'flask_%s'])
+        self.assert_equal(importer.get_module_choices('newext_simple'),
+                          ['flask_%s', 'flaskext.%s'])
+
+    def test_flaskext_missing_cache(self):
+        importer = self.get_importer()
+        for x in range(2):
+            with self.assert_raises(ImportError):
+                import flask.ext.missing_extension
+            self.assert_in('missing_extension', importer._missing)
+
+        # changing the path looks for the extension again
+        sys.path.append('/missing_path')
+        try:
+            with self.assert_raises(ImportError):
+                import flask.ext.missing_extension
+            self.assert_equal(importer._missing['missing_extension'][-1],
+                              '/missing_path')
+        finally:
+            sys.path.remove('/missing_path')
+
 
 def suite():
     suite = unittest.TestSuite()
@@ -10,6 +10,7 @@
 """
 
 import os
+import uuid
 import flask
 import unittest
 from logging import StreamHandler
@@ -65,6 +66,47 @@ class JSONTestCase(FlaskTestCase):
             self.assert_equal(rv.mimetype, 'application/json')
             self.assert_equal(flask.json.loads(rv.data), d)
 
+    def test_jsonify_compact(self):
+        d = dict(a=23, b=42, c=[1, 2, 3])
+        app = flask.Flask(__name__)
+        @app.route('/')
+        def index():
+            return flask.jsonify(d)
+        c = app.test_client()
+        self.assert_in(b'\n  ', c.get('/').data)
+        app.config['JSONIFY_COMPACT'] = True
+        rv = c.get('/')
+        self.assert_equal(rv.mimetype, 'application/json')
+        self.assert_equal(rv.data, b'{"a":23,"b":42,"c":[1,2,3]}')
+
+    def test_jsonify_iter(self):
+        app = flask.Flask(__name__)
+        @app.route('/')
+        def index():
+            size = int(flask.request.args.get('batch_size', 100))
+            return flask.jsonify_iter(({'id': x, 'uuid': uuid.UUID(int=x)}
+                                       for x in range(100)),
+                                      batch_size=size)
+        c = app.test_client()
+        expected = [{'id': x, 'uuid': str(uuid.UUID(int=x))}
+                    for x in range(100)]
+        rv = c.get('/')
+        self.assert_equal(rv.mimetype, 'application/json')
+        self.assert_true(rv.is_streamed)
+        self.assert_equal(flask.json.loads(rv.data), expected)
+        self.assert_equal(rv.data[:9], b'[{"id": 0')
+
+        app.config['JSONIFY_COMPACT'] = True
+        chunks = list(c.get('/?batch_size=30').response)
+        self.assert_equal(len(chunks), 5)
+        data = b''.join(chunks)
+        self.assert_equal(flask.json.loads(data), expected)
+        self.assert_equal(data[:8], b'[{"id":0')
+
+        with app.test_request_context():
+            rv = flask.jsonify_iter(iter([]))
+            self.assert_equal(rv.get_data(), b'[]')
+
     def test_json_as_unicode(self):
         app = flask.Flask(__name__)
 
@@ -220,6 +262,59 @@ class SendfileTestCase(FlaskTestCase):
             self.assert_equal(rv.mimetype, 'text/html')
             rv.close()
 
+    def test_send_file_range_request(self):
+        app = flask.Flask(__name__)
+        @app.route('/')
+        def index():
+            return flask.send_file('static/index.html', conditional=True)
+        with app.open_resource('static/index.html') as f:
+            data = f.read()
+        size = len(data)
+        c = app.test_client()
+
+        rv = c.get('/')
+        self.assert_equal(rv.status_code, 200)
+        self.assert_equal(rv.headers['Accept-Ranges'], 'bytes')
+        etag = rv.headers['ETag']
+        last_modified = rv.headers['Last-Modified']
+
+        rv = c.get('/', headers={'Range': 'bytes=4-15'})
+        self.assert_equal(rv.status_code, 206)
+        self.assert_equal(rv.data, data[4:16])
+        self.assert_equal(rv.headers['Content-Range'],
+                          'bytes 4-15/%d' % size)
+        self.assert_equal(rv.headers['Content-Length'], '12')
+
+        rv = c.get('/', headers={'Range': 'bytes=-10'})
+        self.assert_equal(rv.status_code, 206)
+        self.assert_equal(rv.data, data[-10:])
+
+        rv = c.get('/', headers={'Range': 'bytes=0-1,5-'})
+        self.assert_equal(rv.status_code, 206)
+        self.assert_equal(rv.mimetype, 'multipart/byteranges')
+        self.assert_equal(int(rv.headers['Content-Length']), len(rv.data))
+        boundary = rv.mimetype_params['boundary'].encode('ascii')
+        parts = rv.data.split(b'--' + boundary)
+        self.assert_equal(len(parts), 4)
+        self.assert_equal(parts[1].split(b'\r\n\r\n', 1)[1], data[:2] + b'\r\n')
+        self.assert_in(('Content-Range: bytes 5-%d/%d' %
+                        (size - 1, size)).encode('ascii'), parts[2])
+        self.assert_equal(parts[2].split(b'\r\n\r\n', 1)[1], data[5:] + b'\r\n')
+        self.assert_equal(parts[3], b'--\r\n')
+
+        rv = c.get('/', headers={'Range': 'bytes=0-1', 'If-Range': etag})
+        self.assert_equal(rv.status_code, 206)
+        rv = c.get('/', headers={'Range': 'bytes=0-1',
+                                 'If-Range': last_modified})
+        self.assert_equal(rv.status_code, 206)
+        rv = c.get('/', headers={'Range': 'bytes=0-1', 'If-Range': '"nope"'})
+        self.assert_equal(rv.status_code, 200)
+        self.assert_equal(rv.data, data)
+
+        rv = c.get('/', headers={'Range': 'bytes=%d-' % (size + 10)})
+        self.assert_equal(rv.status_code, 416)
+        self.assert_equal(rv.headers['Content-Range'], 'bytes */%d' % size)
+
     def test_send_file_object(self):
         app = flask.Flask(__name__)
         with catch_warnings() as captured:
@@ -9,9 +9,14 @@
     :license: BSD, see LICENSE for more details.
 """
 
+import os
 import flask
+import shutil
+import tempfile
 import unittest
+from jinja2 import DictLoader
 from flask.testsuite import FlaskTestCase
+from flask.templating import precompile_templates
 
 
 class TemplatingTestCase(FlaskTestCase):
@@ -295,6 +300,138 @@ class TemplatingTestCase(FlaskTestCase):
         rv = app.test_client().get('/')
         self.assert_equal(rv.data, b'<h1>Jameson</h1>')
 
+    def test_bytecode_cache(self):
+        from werkzeug.contrib.cache import SimpleCache
+        cache = SimpleCache()
+        app = flask.Flask(__name__)
+        app.config['TEMPLATES_BYTECODE_CACHE'] = cache
+        with app.test_request_context():
+            rv = flask.render_template('simple_template.html',
+                                       whiskey='Talisker')
+        self.assert_equal(rv, '<h1>Talisker</h1>')
+        self.assert_equal(len(cache._cache), 1)
+
+        # a new application loads the bytecode from the cache
+        app = flask.Flask(__name__)
+        app.config['TEMPLATES_BYTECODE_CACHE'] = cache
+        bcc = app.jinja_env.bytecode_cache
+        loaded = []
+        def load_bytecode(bucket):
+            rv = bcc.__class__.load_bytecode(bcc, bucket)
+            loaded.append(bucket.code is not None)
+            return rv
+        bcc.load_bytecode = load_bytecode
+        with app.test_request_context():
+            rv = flask.render_template('simple_template.html',
+                                       whiskey='Jameson')
+        self.assert_equal(rv, '<h1>Jameson</h1>')
+        self.assert_equal(loaded, [True])
+
+        folder = tempfile.mkdtemp()
+        try:
+            app = flask.Flask(__name__)
+            app.config['TEMPLATES_BYTECODE_CACHE'] = folder
+            with app.test_request_context():
+                flask.render_template('simple_template.html')
+            self.assert_equal(len(os.listdir(folder)), 1)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_precompiled_templates(self):
+        templates = {'index.html': '{% extends "layout.html" %}'
+                                   '{% block body %}{{ value }}{% endblock %}',
+                     'layout.html': '<p>{% block body %}{% endblock %}'}
+        class MyFlask(flask.Flask):
+            def create_global_jinja_loader(self):
+                return DictLoader(templates)
+        folder = tempfile.mkdtemp()
+        try:
+            target = os.path.join(folder, 'templates.zip')
+            precompile_templates(MyFlask(__name__), target)
+
+            # the precompiled code is used even if the source changed
+            templates['index.html'] = 'changed'
+            app = MyFlask(__name__)
+            app.config['TEMPLATES_PRECOMPILED_PATH'] = target
+            with app.test_request_context():
+                rv = flask.render_template('index.html', value='<42>')
+            self.assert_equal(rv, '<p>&lt;42&gt;')
+
+            # templates that were not compiled are still loaded
+            templates['new.html'] = 'new'
+            with app.test_request_context():
+                self.assert_equal(flask.render_template('new.html'), 'new')
+        finally:
+            shutil.rmtree(folder)
+
+    def test_templates_bind_proxies(self):
+        app = flask.Flask(__name__)
+        app.config['TEMPLATES_BIND_PROXIES'] = True
+        templates = {'macros.html': '{% macro arg() %}'
+                                    '{{ request.args.x }}{{ g.y }}'
+                                    '{% endmacro %}'}
+        app.jinja_loader = DictLoader(templates)
+        @app.route('/')
+        def index():
+            flask.g.y = 42
+            return flask.render_template_string(
+                '{% import "macros.html" as m %}{{ m.arg() }}')
+        rv = app.test_client().get('/?x=23')
+        self.assert_equal(rv.data, b'2342')
+        with app.app_context():
+            flask.g.y = 42
+            rv = flask.render_template_string('{{ g.y }}')
+            self.assert_equal(rv, '42')
+        for proxy in flask.request, flask.g:
+            self.assert_equal(proxy._LocalProxy__bound, {})
+
+    def test_loader_cache(self):
+        app = flask.Flask(__name__)
+        calls = []
+        class CountingLoader(DictLoader):
+            def get_source(self, environment, template):
+                calls.append(self.mapping)
+                return DictLoader.get_source(self, environment, template)
+        first = CountingLoader({})
+        second = CountingLoader({'index.html': 'Hello'})
+        loaders = [first, second]
+        class MyLoader(flask.templating.DispatchingJinjaLoader):
+            def _iter_loaders(self, template):
+                for loader in loaders:
+                    yield loader, template
+        loader = MyLoader(app)
+
+        self.assert_equal(loader.get_source(app.jinja_env, 'index.html')[0],
+                          'Hello')
+        self.assert_equal(len(calls), 2)
+        del calls[:]
+        self.assert_equal(loader.get_source(app.jinja_env, 'index.html')[0],
+                          'Hello')
+        self.assert_equal(calls, [second.mapping])
+
+        # a removed template is looked up again
+        del calls[:]
+        second.mapping.clear()
+        first.mapping['index.html'] = 'Moved'
+        self.assert_equal(loader.get_source(app.jinja_env, 'index.html')[0],
+                          'Moved')
+        self.assert_equal(len(calls), 2)
+
+        # misses are not cached and debug mode always asks all loaders
+        with self.assert_raises(flask.templating.TemplateNotFound):
+            loader.get_source(app.jinja_env, 'missing.html')
+        self.assert_not_in('missing.html', loader._loader_cache)
+        app.debug = True
+        del calls[:]
+        loader.get_source(app.jinja_env, 'index.html')
+        self.assert_equal(len(calls), 1)
+        first.mapping.clear()
+        second.mapping['index.html'] = 'Back'
+        del calls[:]
+        self.assert_equal(loader.get_source(app.jinja_env, 'index.html')[0],
+                          'Back')
+        self.assert_equal(len(calls), 2)
+
 
 def suite():
     suite = unittest.TestSuite()
@@ -1,7 +1,7 @@
 try:
     from .helpers import get_current_view
 
-    from flask.ext.babelex import Domain
+    from flask.ext.babelex import Domain, get_locale as _get_locale
 
     from flask.ext.admin import translations
 
@@ -24,6 +24,10 @@ try:
     gettext = domain.gettext
     ngettext = domain.ngettext
     lazy_gettext = domain.lazy_gettext
+
+    def get_locale():
+        locale = _get_locale()
+        return str(locale) if locale is not None else None
 except ImportError:
     def gettext(string, **variables):
         return string % variables
@@ -33,3 +37,6 @@ except ImportError:
 
     def lazy_gettext(string, **variables):
         return gettext(string, **variables)
+
+    def get_locale():
+        return None
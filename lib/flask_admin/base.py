@@ -1,7 +1,10 @@
+from collections import OrderedDict
 from functools import wraps
 from re import sub
+from threading import Lock
 
-from flask import Blueprint, render_template, url_for, abort, g
+from flask import (Blueprint, render_template, url_for, abort, g,
+                   has_app_context, request, current_app)
 from flask.ext.admin import babel
 from flask.ext.admin._compat import with_metaclass
 from flask.ext.admin import helpers as h
@@ -45,6 +48,32 @@ def expose_plugview(url='/'):
     return wrap
 
 
+def _request_cached(key, func):
+    """
+        Call `func` once per request and remember the result in the
+        application context globals.
+
+        If `func` raises an exception, nothing is cached.
+
+        :param key:
+            Cache key
+        :param func:
+            Function to call
+    """
+    if not has_app_context():
+        return func()
+
+    cache = getattr(g, '_admin_request_cache', None)
+
+    if cache is None:
+        cache = g._admin_request_cache = dict()
+
+    if key not in cache:
+        cache[key] = func()
+
+    return cache[key]
+
+
 # Base views
 def _wrap_view(f):
     @wraps(f)
@@ -221,10 +250,16 @@ class BaseView(with_metaclass(AdminViewMeta, BaseViewClass)):
                                    static_folder=self.static_folder,
                                    static_url_path=self.static_url_path)
 
+        # Flask requires same function object for every rule of the endpoint
+        view_funcs = dict()
+
         for url, name, methods in self._urls:
+            if name not in view_funcs:
+                view_funcs[name] = getattr(self, name)
+
             self.blueprint.add_url_rule(url,
                                         name,
-                                        getattr(self, name),
+                                        view_funcs[name],
                                         methods=methods)
 
         return self.blueprint
@@ -284,6 +319,18 @@ class BaseView(with_metaclass(AdminViewMeta, BaseViewClass)):
         """
         return True
 
+    def _is_accessible(self):
+        """
+            Return `is_accessible` result memoized for the current request.
+        """
+        return _request_cached((id(self), 'accessible'), self.is_accessible)
+
+    def _is_visible(self):
+        """
+            Return `is_visible` result memoized for the current request.
+        """
+        return _request_cached((id(self), 'visible'), self.is_visible)
+
     def _handle_view(self, name, **kwargs):
         """
             This method will be executed before calling any view method.
@@ -296,7 +343,7 @@ class BaseView(with_metaclass(AdminViewMeta, BaseViewClass)):
             :param kwargs:
                 View function arguments
         """
-        if not self.is_accessible():
+        if not self._is_accessible():
             return abort(404)
 
     @property
@@ -383,13 +430,13 @@ class MenuItem(object):
         if self._view is None:
             return False
 
-        return self._view.is_visible()
+        return self._view._is_visible()
 
     def is_accessible(self):
         if self._view is None:
             return False
 
-        return self._view.is_accessible()
+        return self._view._is_accessible()
 
     def is_category(self):
         return self._view is None
@@ -421,6 +468,12 @@ class Admin(object):
     """
         Collection of the admin views. Also manages menu structure.
     """
+    menu_cache_size = 100
+    """
+        Maximum number of rendered menus kept by the menu cache. The least
+        recently used menu is dropped when it is full.
+    """
+
     def __init__(self, app=None, name=None,
                  url=None, subdomain=None,
                  index_view=None,
@@ -461,6 +514,8 @@ class Admin(object):
         self._menu = []
         self._menu_categories = dict()
         self._menu_links = []
+        self._menu_cache = OrderedDict()
+        self._menu_cache_lock = Lock()
 
         if name is None:
             name = 'Admin'
@@ -479,6 +534,9 @@ class Admin(object):
         # Localizations
         self.locale_selector_func = None
 
+        # Menu cache
+        self.menu_role_func = None
+
         # Register with application
         if app is not None:
             self._init_extension()
@@ -498,6 +556,9 @@ class Admin(object):
             self.app.register_blueprint(view.create_blueprint(self))
             self._add_view_to_menu(view)
 
+        with self._menu_cache_lock:
+            self._menu_cache.clear()
+
     def add_link(self, link):
         """
             Add link to menu links collection.
@@ -538,6 +599,76 @@ class Admin(object):
 
         self.locale_selector_func = f
 
+    def menu_role(self, f):
+        """
+            Installs a role function for the current ``Admin`` instance and
+            enables the rendered menu cache.
+
+            Rendered menu HTML is cached per role, active view, script root,
+            locale and, if ``SERVER_NAME`` is set, host. At most
+            `menu_cache_size` menus are kept. The function should return a
+            hashable value
+            which is the same for all users that see the same menu (for
+            example, their role or permission set).
+
+            Example::
+
+                admin = Admin(app)
+
+                @admin.menu_role
+                def admin_menu_role():
+                    return current_user.role
+
+            Please note that accessibility and visibility of the menu items
+            is not checked on the cache hit.
+        """
+        if self.menu_role_func is not None:
+            raise Exception(u'Can not add menu_role second time.')
+
+        self.menu_role_func = f
+
+    def render_menu(self, view, render):
+        """
+            Render main menu for the view using the rendered menu cache.
+
+            :param view:
+                Active view
+            :param render:
+                Function that renders menu HTML
+        """
+        if self.menu_role_func is None:
+            return render()
+
+        # Menu URLs are relative unless SERVER_NAME is set, in which case
+        # routing has already checked the host against it. Labels depend
+        # on the locale.
+        if current_app.config['SERVER_NAME']:
+            host = request.host
+        else:
+            host = None
+
+        key = (self.menu_role_func(), view.endpoint,
+               host, request.script_root, babel.get_locale())
+
+        cache = self._menu_cache
+
+        with self._menu_cache_lock:
+            html = cache.pop(key, None)
+
+            if html is not None:
+                cache[key] = html
+                return html
+
+        html = render()
+
+        with self._menu_cache_lock:
+            cache[key] = html
+
+            while len(cache) > self.menu_cache_size:
+                cache.popitem(last=False)
+
+        return html
+
     def _add_view_to_menu(self, view):
         """
             Add a view to the menu tree
@@ -3,8 +3,9 @@ import os.path as op
 import platform
 import re
 import shutil
+import stat
+import time
 
-from operator import itemgetter
 from werkzeug import secure_filename
 
 from flask import flash, url_for, redirect, abort, request
@@ -17,6 +18,14 @@ from flask.ext.admin.base import BaseView, expose
 from flask.ext.admin.actions import action, ActionsMixin
 from flask.ext.admin.babel import gettext, lazy_gettext
 
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
 
 class NameForm(form.BaseForm):
     """
@@ -126,6 +135,22 @@ class FileAdmin(BaseView, ActionsMixin):
                 editable_extensions = ('md', 'html', 'txt')
     """
 
+    page_size = None
+    """
+        Number of directory entries per list page. If set to `None`, all
+        entries are displayed on one page.
+
+        File sizes are only read for the entries of the displayed page, so
+        set it for directories with a lot of files.
+    """
+
+    listing_cache_size = 100
+    """
+        Maximum number of cached directory listings. Listing is cached by
+        the directory modification time, so it is read again after files are
+        added, removed or renamed. Set to 0 to disable caching.
+    """
+
     list_template = 'admin/file/list.html'
     """
         File list template
@@ -180,6 +205,8 @@ class FileAdmin(BaseView, ActionsMixin):
 
         self._on_windows = platform.system() == 'Windows'
 
+        self._listing_cache = dict()
+
         # Convert allowed_extensions to set for quick validation
         if (self.allowed_extensions and
             not isinstance(self.allowed_extensions, set)):
@@ -281,6 +308,83 @@ class FileAdmin(BaseView, ActionsMixin):
         """
         file_data.save(path)
 
+    def _scan_directory(self, directory):
+        """
+            Return list of ``(name, is_dir)`` tuples for the directory
+            entries, directories first, sorted by name.
+
+            Uses `scandir` when available, which usually does not need to
+            stat entries at all, and a single `os.stat` per entry otherwise.
+
+            :param directory:
+                Directory to scan
+        """
+        entries = []
+
+        if scandir is not None:
+            for entry in scandir(directory):
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                entries.append((entry.name, is_dir))
+        else:
+            for name in os.listdir(directory):
+                try:
+                    is_dir = stat.S_ISDIR(os.stat(op.join(directory, name)).st_mode)
+                except OSError:
+                    is_dir = False
+
+                entries.append((name, is_dir))
+
+        entries.sort(key=lambda e: (not e[1], e[0]))
+
+        return entries
+
+    def _get_listing(self, directory):
+        """
+            Return cached directory listing, see `_scan_directory`.
+
+            Cached listing is used while directory modification time stays
+            the same. Listings of directories modified in the last couple of
+            seconds are not cached, as file system time resolution might not
+            be enough to notice next change.
+
+            :param directory:
+                Directory path
+        """
+        if not self.listing_cache_size:
+            return self._scan_directory(directory)
+
+        mtime = os.stat(directory).st_mtime
+
+        cached = self._listing_cache.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        entries = self._scan_directory(directory)
+
+        if time.time() - mtime > 2:
+            if len(self._listing_cache) >= self.listing_cache_size:
+                self._listing_cache.clear()
+
+            self._listing_cache[directory] = (mtime, entries)
+
+        return entries
+
+    def _get_file_size(self, path):
+        """
+            Return file size or 0 if file is not accessible anymore.
+
+            :param path:
+                Full file path
+        """
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
+
     def _get_dir_url(self, endpoint, path, **kwargs):
         """
             Return prettified URL
@@ -293,7 +397,7 @@ class FileAdmin(BaseView, ActionsMixin):
                 Additional arguments
         """
         if not path:
-            return url_for(endpoint)
+            return url_for(endpoint, **kwargs)
         else:
             if self._on_windows:
                 path = path.replace('\\', '/')
@@ -433,18 +537,26 @@ class FileAdmin(BaseView, ActionsMixin):
 
             items.append(('..', parent_path, True, 0))
 
-        for f in os.listdir(directory):
-            fp = op.join(directory, f)
-            rel_path = op.join(path, f)
+        entries = [(f, op.join(path, f), is_dir)
+                   for f, is_dir in self._get_listing(directory)]
+        entries = [e for e in entries if self.is_accessible_path(e[1])]
+
+        # Pagination
+        page = request.args.get('page', 0, type=int)
+        num_pages = 1
 
-            if self.is_accessible_path(rel_path):
-                items.append((f, rel_path, op.isdir(fp), op.getsize(fp)))
+        if self.page_size:
+            num_pages = max((len(entries) + self.page_size - 1) // self.page_size, 1)
+            page = min(max(page, 0), num_pages - 1)
+            entries = entries[page * self.page_size:(page + 1) * self.page_size]
 
-        # Sort by name
-        items.sort(key=itemgetter(0))
+        # Sizes are only needed for displayed files
+        for f, rel_path, is_dir in entries:
+            size = 0 if is_dir else self._get_file_size(op.join(directory, f))
+            items.append((f, rel_path, is_dir, size))
 
-        # Sort by type
-        items.sort(key=itemgetter(2), reverse=True)
+        def pager_url(p):
+            return self._get_dir_url('.index', path, page=p or None)
 
         # Generate breadcrumbs
         accumulator = []
@@ -462,6 +574,9 @@ class FileAdmin(BaseView, ActionsMixin):
                            get_dir_url=self._get_dir_url,
                            get_file_url=self._get_file_url,
                            items=items,
+                           page=page,
+                           num_pages=num_pages,
+                           pager_url=pager_url,
                            actions=actions,
                            actions_confirmation=actions_confirmation)
 
@@ -119,6 +119,7 @@ class ModelView(BaseModelView):
         super(ModelView, self).__init__(model, name, category, endpoint, url)
 
         self._primary_key = self.scaffold_pk()
+        self._eager_load_depth = self.scaffold_eager_loads()
 
     def _get_model_fields(self, model=None):
         """
@@ -258,6 +259,18 @@ class ModelView(BaseModelView):
 
         return form_class
 
+    def scaffold_eager_loads(self):
+        """
+            Return reference dereferencing depth for `select_related`, based
+            on the longest related model path used by the list view.
+        """
+        paths = self.get_eager_load_paths()
+
+        if not paths:
+            return 0
+
+        return max(len(p.split('.')) for p in paths)
+
     def get_query(self):
         """
         Returns the QuerySet for this view.  By default, it returns all the
@@ -331,10 +344,32 @@ class ModelView(BaseModelView):
         query = query.limit(self.page_size)
 
         if execute:
-            query = query.all()
+            if self._eager_load_depth:
+                query = query.select_related(self._eager_load_depth)
+            else:
+                query = query.all()
 
         return count, query
 
+    def get_export_data(self, sort_column, sort_desc, search, filters):
+        """
+            Return documents for the export, fetched from the server in
+            batches of `export_batch_size`.
+
+            :param sort_column:
+                Sort column
+            :param sort_desc:
+                Sort descending
+            :param search:
+                Search criteria
+            :param filters:
+                List of applied filters
+        """
+        count, query = self.get_list(None, sort_column, sort_desc,
+                                     search, filters, execute=False)
+
+        return query.limit(0).batch_size(self.export_batch_size)
+
     def get_one(self, id):
         """
             Return a single model instance by its ID
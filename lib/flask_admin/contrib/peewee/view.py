@@ -7,7 +7,8 @@ from flask.ext.admin._compat import string_types
 from flask.ext.admin.babel import gettext, ngettext, lazy_gettext
 from flask.ext.admin.model import BaseModelView
 
-from peewee import PrimaryKeyField, ForeignKeyField, Field, CharField, TextField
+from peewee import (PrimaryKeyField, ForeignKeyField, Field, CharField,
+                    TextField, JOIN_LEFT_OUTER)
 
 from flask.ext.admin.actions import action
 from flask.ext.admin.contrib.peewee import filters
@@ -134,6 +135,7 @@ class ModelView(BaseModelView):
         super(ModelView, self).__init__(model, name, category, endpoint, url)
 
         self._primary_key = self.scaffold_pk()
+        self._eager_models = self.scaffold_eager_loads()
 
     def _get_model_fields(self, model=None):
         if model is None:
@@ -241,6 +243,24 @@ class ModelView(BaseModelView):
 
         return form_class
 
+    def scaffold_eager_loads(self):
+        """
+            Return list of the related models which should be selected
+            together with the list view rows. Only direct foreign keys
+            of the model can be loaded this way. If there are any, the list
+            query selects them from the model instead of using `get_query`.
+        """
+        models = []
+
+        for path in self.get_eager_load_paths():
+            field = getattr(self.model, path.split('.')[0], None)
+
+            # Backrefs and deeper levels are still loaded lazily
+            if isinstance(field, ForeignKeyField) and field.rel_model not in models:
+                models.append(field.rel_model)
+
+        return models
+
     def _handle_join(self, query, field, joins):
         if field.model_class != self.model:
             model_name = field.model_class.__name__
@@ -268,10 +288,22 @@ class ModelView(BaseModelView):
 
     def get_list(self, page, sort_column, sort_desc, search, filters,
                  execute=True):
-        query = self.get_query()
-
         joins = set()
 
+        # The selection of a query can not be changed once it is created,
+        # so related models which are loaded eagerly are selected and
+        # joined up front
+        if self._eager_models:
+            query = self.model.select(self.model, *self._eager_models)
+
+            for model in self._eager_models:
+                query = query.switch(self.model).join(model, JOIN_LEFT_OUTER)
+                joins.add(model.__name__)
+
+            query = query.switch(self.model)
+        else:
+            query = self.get_query()
+
         # Search
         if self._search_supported and search:
             values = search.split(' ')
@@ -328,6 +360,13 @@ class ModelView(BaseModelView):
 
         return count, query
 
+    def get_export_data(self, sort_column, sort_desc, search, filters):
+        count, query = self.get_list(None, sort_column, sort_desc,
+                                     search, filters, execute=False)
+
+        # Iterate without caching fetched rows on the query object
+        return query.limit(None).iterator()
+
     def get_one(self, id):
         return self.model.get(**{self._primary_key: id})
 
@@ -225,6 +225,25 @@ class ModelView(BaseModelView):
 
         return count, results
 
+    def get_export_data(self, sort_column, sort_desc, search, filters):
+        """
+            Return documents for the export, fetched from the server in
+            batches of `export_batch_size`.
+
+            :param sort_column:
+                Sort column
+            :param sort_desc:
+                Sort descending
+            :param search:
+                Search criteria
+            :param filters:
+                List of applied fiters
+        """
+        count, results = self.get_list(None, sort_column, sort_desc,
+                                       search, filters, execute=False)
+
+        return results.limit(0).batch_size(self.export_batch_size)
+
     def _get_valid_id(self, id):
         try:
             return ObjectId(id)
@@ -0,0 +1,157 @@
+from sqlalchemy import or_, func, select, String, Unicode, Text, UnicodeText
+
+from flask.ext.admin._compat import as_unicode, string_types
+from flask.ext.admin.model.ajax import AjaxModelLoader, DEFAULT_PAGE_SIZE
+
+from .tools import get_primary_key, parse_like_term
+
+
+class QueryAjaxModelLoader(AjaxModelLoader):
+    """
+        Ajax model loader for SQLAlchemy models.
+
+        Supported options:
+
+        `fields`
+            Names of the text columns that are searched. If not provided,
+            all text columns of the model are used.
+
+        `page_size`
+            Maximum number of models returned for one lookup.
+    """
+    def __init__(self, name, session, model, **options):
+        """
+            Constructor.
+
+            :param name:
+                Field name
+            :param session:
+                SQLAlchemy session
+            :param model:
+                Model class
+            :param options:
+                Loader options
+        """
+        super(QueryAjaxModelLoader, self).__init__(name, options)
+
+        self.session = session
+        self.model = model
+
+        self.pk = get_primary_key(model)
+
+        if self.pk is None:
+            raise Exception('Model %s does not have primary key.' % model.__name__)
+
+        self._fields = self._process_fields(options.get('fields'))
+
+    def _process_fields(self, fields):
+        mapper = self.model._sa_class_manager.mapper
+
+        if fields is None:
+            return [c for c in mapper.columns
+                    if isinstance(c.type, (String, Unicode, Text, UnicodeText))]
+
+        result = []
+
+        for field in fields:
+            if isinstance(field, string_types):
+                attr = getattr(self.model, field, None)
+
+                if attr is None:
+                    raise ValueError('%s.%s does not exist.' % (self.model, field))
+
+                result.append(attr)
+            else:
+                result.append(field)
+
+        return result
+
+    def format(self, model):
+        if model is None:
+            return None
+
+        return (getattr(model, self.pk), as_unicode(model))
+
+    def _coerce_pk(self, pk):
+        """
+            Convert submitted primary key to the type of the primary key
+            column. Returns `None` if it can not be converted, so databases
+            which check the parameter types do not fail the query.
+        """
+        column = getattr(self.model, self.pk).property.columns[0]
+
+        if isinstance(column.type, (String, Unicode, Text, UnicodeText)):
+            return pk
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return pk
+
+        try:
+            return python_type(pk)
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+
+    def get_one(self, pk):
+        pk = self._coerce_pk(pk)
+
+        if pk is None:
+            return None
+
+        return self.session.query(self.model).get(pk)
+
+    def get_many(self, pks):
+        pks = [pk for pk in (self._coerce_pk(pk) for pk in pks) if pk is not None]
+
+        if not pks:
+            return []
+
+        pk_column = getattr(self.model, self.pk)
+        return self.session.query(self.model).filter(pk_column.in_(pks)).all()
+
+    def get_list(self, term, offset=0, limit=DEFAULT_PAGE_SIZE):
+        query = self.session.query(self.model)
+
+        if term and self._fields:
+            stmt = parse_like_term(term)
+            query = query.filter(or_(*[field.ilike(stmt) for field in self._fields]))
+
+        pk_column = getattr(self.model, self.pk)
+        return query.order_by(pk_column).offset(offset).limit(limit).all()
+
+    def count(self):
+        """
+            Return the number of rows of the model. Runs on its own
+            connection, so the session transaction is left alone.
+        """
+        mapper = self.model._sa_class_manager.mapper
+        bind = self.session.get_bind(mapper)
+        return bind.scalar(select([func.count()]).select_from(mapper.mapped_table))
+
+
+def create_ajax_loader(model, session, name, field_name, options):
+    """
+        Create an Ajax loader for the model relation `field_name`.
+
+        :param model:
+            Model class
+        :param session:
+            SQLAlchemy session
+        :param name:
+            Loader name
+        :param field_name:
+            Relation name
+        :param options:
+            Loader options
+    """
+    attr = getattr(model, field_name, None)
+
+    if attr is None:
+        raise ValueError('Model %s does not have field %s.' % (model, field_name))
+
+    if not hasattr(attr, 'property') or not hasattr(attr.property, 'direction'):
+        raise ValueError('%s.%s is not a relation.' % (model, field_name))
+
+    remote_model = attr.prop.mapper.class_
+    return QueryAjaxModelLoader(name, session, remote_model, **options)
@@ -7,8 +7,12 @@ from wtforms import widgets
 from wtforms.fields import SelectFieldBase
 from wtforms.validators import ValidationError
 
+from sqlalchemy import bindparam
+from sqlalchemy.orm import class_mapper, object_mapper
+from sqlalchemy.orm.attributes import instance_state
+
 from .tools import get_primary_key
-from flask.ext.admin._compat import text_type, string_types
+from flask.ext.admin._compat import text_type, string_types, iteritems
 from flask.ext.admin.model.fields import InlineFieldList, InlineModelFormField
 
 
@@ -214,32 +218,276 @@ class InlineModelFormList(InlineFieldList):
     def display_row_controls(self, field):
         return field.get_pk() is not None
 
-    def populate_obj(self, obj, name):
-        values = getattr(obj, name, None)
+    def process(self, formdata, data=None):
+        res = super(InlineModelFormList, self).process(formdata, data)
 
-        if values is None:
-            return
+        if self.entries:
+            self._share_object_lists()
 
-        # Create primary key map
-        pk_map = dict((str(getattr(v, self._pk)), v) for v in values)
+        return res
 
-        # Handle request data
-        for field in self.entries:
-            field_id = field.get_pk()
+    def _share_object_lists(self):
+        """
+            All rows have the same related model selects. Load their choices
+            once and share them, instead of running the query for every row.
+        """
+        forms = [entry.form for entry in self.entries]
+        forms.append(self.template.form)
 
-            if field_id in pk_map:
-                model = pk_map[field_id]
+        shared = {}
 
-                if self.should_delete(field):
-                    self.session.delete(model)
+        for form in forms:
+            for name, field in iteritems(form._fields):
+                if not isinstance(field, QuerySelectField) or field.query is not None:
                     continue
+
+                if name not in shared:
+                    shared[name] = field._get_object_list()
+                else:
+                    field._object_list = shared[name]
+
+    def populate_obj(self, obj, name):
+        state = instance_state(obj)
+        prop = state.manager.mapper.get_property(name)
+        bulk = self._can_bulk_save(state, prop)
+
+        # The form usually loaded the relationship already. If it did not,
+        # only the submitted rows are loaded.
+        if name in state.dict or not bulk:
+            values = getattr(obj, name, None)
+
+            if values is None:
+                return
+
+            pk_map = dict((str(getattr(v, self._pk)), v) for v in values)
+        else:
+            values = None
+            pk_map = self._load_models(obj, name)
+
+        inserts = []
+        updates = []
+        deletes = []
+
+        # Diff the submitted rows against the existing ones in one pass.
+        # Nothing is flushed before all rows are handled.
+        with self.session.no_autoflush:
+            for field in self.entries:
+                model = pk_map.get(field.get_pk())
+
+                if model is not None:
+                    if self.should_delete(field):
+                        deletes.append(model)
+                        continue
+
+                    updates.append(model)
+                else:
+                    model = self.model()
+
+                    if values is not None:
+                        values.append(model)
+                    else:
+                        self._set_parent_key(obj, prop, model)
+
+                    inserts.append(model)
+
+                field.populate_obj(model, None)
+
+                self.inline_view.on_model_change(field, model)
+
+            if bulk and self._bulk_save(obj, prop, inserts, updates, deletes):
+                return
+
+            # Let the session save the rows
+            for model in deletes:
+                self.session.delete(model)
+
+            if values is None:
+                values = getattr(obj, name)
+
+                for model in inserts:
+                    values.append(model)
+
+    def _can_bulk_save(self, state, prop):
+        """
+            Check if the rows can be written with one statement per operation
+            instead of being saved by the session.
+        """
+        if not getattr(self.inline_view, 'bulk_save', False):
+            return False
+
+        if prop.direction.name != 'ONETOMANY' or prop.secondary is not None:
+            return False
+
+        # New parents get their primary key when they are flushed
+        if not state.has_identity:
+            return False
+
+        mapper = class_mapper(self.model)
+
+        if (mapper.inherits is not None or
+                mapper.version_id_col is not None or
+                len(mapper.primary_key) != 1):
+            return False
+
+        # Deleting rows would have to cascade to other rows
+        for rel in mapper.relationships:
+            if rel.cascade.delete or rel.cascade.delete_orphan:
+                return False
+
+        return True
+
+    def _load_models(self, obj, name):
+        """
+            Load the submitted rows of the relationship with one query.
+        """
+        pks = [pk for pk in (field.get_pk() for field in self.entries) if pk]
+
+        if not pks:
+            return {}
+
+        query = (self.session.query(self.model)
+                 .with_parent(obj, name)
+                 .filter(getattr(self.model, self._pk).in_(pks)))
+
+        return dict((str(getattr(v, self._pk)), v) for v in query)
+
+    def _get_parent_key(self, obj, prop):
+        """
+            Return list of (child column, value) pairs that point a row to
+            its parent.
+        """
+        parent_mapper = object_mapper(obj)
+
+        return [(remote, getattr(obj, parent_mapper.get_property_by_column(local).key))
+                for local, remote in prop.local_remote_pairs]
+
+    def _set_parent_key(self, obj, prop, model):
+        """
+            Point a new row to its parent without loading the relationship.
+        """
+        mapper = class_mapper(self.model)
+
+        for column, value in self._get_parent_key(obj, prop):
+            setattr(model, mapper.get_property_by_column(column).key, value)
+
+    def _get_changes(self, model, is_new):
+        """
+            Return dictionary of the changed column values of the row, or
+            `None` if the changes can not be written without the session.
+        """
+        mapper = class_mapper(self.model)
+        state = instance_state(model)
+        values = {}
+
+        for prop in mapper.column_attrs:
+            column = prop.columns[0]
+
+            if is_new:
+                if prop.key in state.dict:
+                    values[column.key] = state.dict[prop.key]
             else:
-                model = self.model()
-                values.append(model)
+                added = state.attrs[prop.key].history.added
+
+                if added:
+                    values[column.key] = added[0]
+
+        for rel in mapper.relationships:
+            history = state.attrs[rel.key].history
+
+            if not history.added and not history.deleted:
+                continue
+
+            if rel.direction.name != 'MANYTOONE':
+                return None
+
+            target = getattr(model, rel.key)
+
+            if target is not None and not instance_state(target).has_identity:
+                return None
+
+            for local, remote in rel.local_remote_pairs:
+                if target is None:
+                    values[local.key] = None
+                else:
+                    remote_key = object_mapper(target).get_property_by_column(remote).key
+                    values[local.key] = getattr(target, remote_key)
+
+        return values
+
+    def _bulk_save(self, obj, prop, inserts, updates, deletes):
+        """
+            Write the rows with one statement per operation and kind of change.
+            Returns `False` without writing anything if the rows have to be
+            saved by the session.
+        """
+        mapper = class_mapper(self.model)
+        table = mapper.local_table
+        pk_column = mapper.primary_key[0]
+
+        # The session would only fill in the foreign key to the parent on
+        # flush, so it is set explicitly
+        parent_key = self._get_parent_key(obj, prop)
+
+        insert_rows = []
+        for model in inserts:
+            values = self._get_changes(model, True)
+
+            if values is None:
+                return False
+
+            for column, value in parent_key:
+                values[column.key] = value
+
+            insert_rows.append(values)
+
+        update_rows = []
+        for model in updates:
+            values = self._get_changes(model, False)
+
+            if values is None:
+                return False
+
+            if values:
+                values['_pk'] = getattr(model, self._pk)
+                update_rows.append(values)
+
+        for rows in _group_by_keys(insert_rows):
+            self.session.execute(table.insert(), rows, mapper=mapper)
+
+        for rows in _group_by_keys(update_rows):
+            stmt = table.update().where(pk_column == bindparam('_pk'))
+            self.session.execute(stmt, rows, mapper=mapper)
+
+        if deletes:
+            pks = [getattr(model, self._pk) for model in deletes]
+            stmt = table.delete().where(pk_column.in_(pks))
+            self.session.execute(stmt, mapper=mapper)
+
+        # Bring the session in line with the database
+        for model in inserts + deletes:
+            if model in self.session:
+                self.session.expunge(model)
+
+        for model in updates:
+            self.session.expire(model)
+
+        if inserts or deletes:
+            self.session.expire(obj, [prop.key])
+
+        return True
+
+
+def _group_by_keys(rows):
+    """
+        Split rows into lists of rows with the same keys, which can be
+        written with one executemany call.
+    """
+    groups = {}
 
-            field.populate_obj(model, None)
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
 
-            self.inline_view.on_model_change(field, model)
+    return groups.values()
 
 
 def get_pk_from_identity(obj):
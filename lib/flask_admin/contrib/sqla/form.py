@@ -1,5 +1,7 @@
 from wtforms import fields, validators
+from wtforms.fields.core import UnboundField
 from sqlalchemy import Boolean, Column
+from sqlalchemy.exc import SQLAlchemyError
 
 from flask.ext.admin import form
 from flask.ext.admin.form import Select2Field
@@ -7,11 +9,13 @@ from flask.ext.admin.model.form import (converts, ModelConverterBase,
                                         InlineFormAdmin, InlineModelConverterBase,
                                         FieldPlaceholder)
 from flask.ext.admin.model.helpers import prettify_name
+from flask.ext.admin.model.fields import AjaxSelectField, AjaxSelectMultipleField
 from flask.ext.admin._backwards import get_property
 from flask.ext.admin._compat import iteritems
 
 from .validators import Unique
 from .fields import QuerySelectField, QuerySelectMultipleField, InlineModelFormList
+from .ajax import QueryAjaxModelLoader
 
 try:
     # Field has better input parsing capabilities.
@@ -20,6 +24,60 @@ except ImportError:
     from wtforms.fields import DateTimeField
 
 
+class AjaxThresholdField(UnboundField):
+    """
+        Unbound relation field which turns into an AJAX select if the related
+        table has more than `threshold` rows, and into a regular select
+        otherwise.
+
+        The rows are counted once, when the form is used for the first time,
+        so the database is not queried when the views are created. The
+        loader is only added to `ajax_refs`, which exposes it through the
+        lookup endpoint, if the field turns into an AJAX select.
+    """
+    def __init__(self, loader, threshold, ajax_field, select_field, ajax_refs):
+        UnboundField.creation_counter += 1
+        self.creation_counter = UnboundField.creation_counter
+
+        self.loader = loader
+        self.threshold = threshold
+        self.ajax_field = ajax_field
+        self.select_field = select_field
+        self.ajax_refs = ajax_refs
+        self._field = None
+
+    def _get_field(self):
+        if self._field is None:
+            try:
+                count = self.loader.count()
+            except (SQLAlchemyError, RuntimeError):
+                # Try again on the next use
+                return self.select_field
+
+            if count > self.threshold:
+                self._field = self.ajax_field
+                self.ajax_refs[self.loader.name] = self.loader
+            else:
+                self._field = self.select_field
+
+        return self._field
+
+    @property
+    def field_class(self):
+        return self._get_field().field_class
+
+    @property
+    def args(self):
+        return self._get_field().args
+
+    @property
+    def kwargs(self):
+        return self._get_field().kwargs
+
+    def bind(self, *args, **kwargs):
+        return self._get_field().bind(*args, **kwargs)
+
+
 class AdminModelConverter(ModelConverterBase):
     """
         SQLAlchemy model to form converter
@@ -84,6 +142,57 @@ class AdminModelConverter(ModelConverterBase):
         # Contribute model-related parameters
         if 'allow_blank' not in kwargs:
             kwargs['allow_blank'] = local_column.nullable
+
+        # Override field type if necessary
+        override = self._get_field_override(prop.key)
+
+        # Skip backrefs
+        if prop.direction.name == 'ONETOMANY' and not local_column.foreign_keys and \
+           getattr(self.view, 'column_hide_backrefs', False) and not override:
+            return None
+
+        # Inline forms do not have a lookup endpoint
+        ajax_refs = getattr(self.view, '_form_ajax_refs', None)
+
+        if not override and ajax_refs is not None:
+            loader = ajax_refs.get(prop.key)
+
+            if loader is not None:
+                return self._create_ajax_field(prop, loader, kwargs)
+
+            threshold = getattr(self.view, 'form_ajax_threshold', None)
+
+            if threshold is not None:
+                loader = QueryAjaxModelLoader(prop.key, self.session, remote_model)
+
+                ajax_field = self._create_ajax_field(prop, loader, kwargs)
+                select_field = self._create_select_field(prop, kwargs, None)
+                field = AjaxThresholdField(loader, threshold, ajax_field,
+                                           select_field, ajax_refs)
+
+                # Lets the view register the loader before a lookup
+                thresholds = getattr(self.view, '_form_ajax_thresholds', None)
+
+                if thresholds is not None:
+                    thresholds[prop.key] = field
+
+                return field
+
+        return self._create_select_field(prop, kwargs, override)
+
+    def _create_ajax_field(self, prop, loader, kwargs):
+        kwargs = dict(kwargs)
+
+        if prop.direction.name == 'MANYTOONE':
+            return AjaxSelectField(loader, **kwargs)
+
+        kwargs.pop('allow_blank')
+        return AjaxSelectMultipleField(loader, **kwargs)
+
+    def _create_select_field(self, prop, kwargs, override):
+        remote_model = prop.mapper.class_
+        kwargs = dict(kwargs)
+
         if 'query_factory' not in kwargs:
             kwargs['query_factory'] = lambda: self.session.query(remote_model)
 
@@ -95,20 +204,12 @@ class AdminModelConverter(ModelConverterBase):
             elif prop.direction.name == 'MANYTOMANY':
                 kwargs['widget'] = form.Select2Widget(multiple=True)
 
-        # Override field type if necessary
-        override = self._get_field_override(prop.key)
         if override:
             return override(**kwargs)
 
         if prop.direction.name == 'MANYTOONE':
             return QuerySelectField(**kwargs)
-        elif prop.direction.name == 'ONETOMANY':
-            # Skip backrefs
-            if not local_column.foreign_keys and getattr(self.view, 'column_hide_backrefs', False):
-                return None
-
-            return QuerySelectMultipleField(**kwargs)
-        elif prop.direction.name == 'MANYTOMANY':
+        elif prop.direction.name in ('ONETOMANY', 'MANYTOMANY'):
             return QuerySelectMultipleField(**kwargs)
 
     def convert(self, model, mapper, prop, field_args, hidden_pk):
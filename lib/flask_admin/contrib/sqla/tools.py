@@ -1,3 +1,6 @@
+from sqlalchemy import event
+
+
 def parse_like_term(term):
     if term.startswith('^'):
         stmt = '%s%%' % term[1:]
@@ -25,3 +28,32 @@ def get_primary_key(model):
                     return p.key
 
     return None
+
+
+class QueryCounter(object):
+    """
+        Count statements executed by the SQLAlchemy engine.
+
+        Listener stays attached to the engine, so create one counter per
+        engine and reuse it.
+
+        :param engine:
+            Engine to listen to
+    """
+    def __init__(self, engine):
+        self.active = False
+        self.count = 0
+
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        if self.active:
+            self.count += 1
+
+    def start(self):
+        self.count = 0
+        self.active = True
+
+    def stop(self):
+        self.active = False
+        return self.count
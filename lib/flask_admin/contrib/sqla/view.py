@@ -1,21 +1,29 @@
 import logging
 
 from sqlalchemy.orm.attributes import InstrumentedAttribute
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, contains_eager, lazyload
 from sqlalchemy.sql.expression import desc
 from sqlalchemy import or_, Column, func
 
 from flask import flash
 
-from flask.ext.admin._compat import string_types
+from flask.ext.admin._compat import string_types, iteritems
 from flask.ext.admin.babel import gettext, ngettext, lazy_gettext
 from flask.ext.admin.model import BaseModelView
 from flask.ext.admin.actions import action
 from flask.ext.admin._backwards import ObsoleteAttr
 
+from flask.ext.admin.model.ajax import AjaxModelLoader
 from flask.ext.admin.contrib.sqla import form, filters, tools
+from .ajax import create_ajax_loader
 from .typefmt import DEFAULT_FORMATTERS
 
+try:
+    # SQLAlchemy 1.2+
+    from sqlalchemy.orm import selectinload as collectionload
+except ImportError:
+    from sqlalchemy.orm import subqueryload as collectionload
+
 
 class ModelView(BaseModelView):
     """
@@ -231,6 +239,15 @@ class ModelView(BaseModelView):
                 ]
     """
 
+    form_ajax_threshold = None
+    """
+        If set, relations to tables with more rows than this are rendered as
+        AJAX select fields, even if they are not listed in `form_ajax_refs`.
+        Rows are counted once, when the form is used for the first time, and
+        the lookup endpoint only serves the relations that switched.
+        Disabled by default.
+    """
+
     def __init__(self, model, session,
                  name=None, category=None, endpoint=None, url=None):
         """
@@ -256,6 +273,10 @@ class ModelView(BaseModelView):
 
         self._filter_joins = dict()
 
+        self._query_counter = None
+
+        self._form_ajax_thresholds = dict()
+
         if self.form_choices is None:
             self.form_choices = {}
 
@@ -273,6 +294,8 @@ class ModelView(BaseModelView):
         else:
             self._auto_joins = self.column_select_related_list
 
+        self._eager_joins, self._eager_collections = self.scaffold_eager_loads()
+
     # Internal API
     def _get_model_iterator(self, model=None):
         """
@@ -524,6 +547,37 @@ class ModelView(BaseModelView):
 
         return form_class
 
+    def _process_ajax_references(self):
+        """
+            Process `form_ajax_refs` and generate model loaders that
+            will be used by the `ajax_lookup` view.
+        """
+        result = {}
+
+        if self.form_ajax_refs:
+            for name, options in iteritems(self.form_ajax_refs):
+                if isinstance(options, dict):
+                    result[name] = create_ajax_loader(self.model, self.session, name, name, options)
+                elif isinstance(options, AjaxModelLoader):
+                    result[name] = options
+                else:
+                    raise ValueError('%s.form_ajax_refs can not handle %s types' % (self, type(options)))
+
+        return result
+
+    def _get_ajax_loader(self, name):
+        """
+            Relations over `form_ajax_threshold` register their loader when
+            the form is used first, which may not have happened in this
+            process yet.
+        """
+        field = self._form_ajax_thresholds.get(name)
+
+        if field is not None:
+            field._get_field()
+
+        return super(ModelView, self)._get_ajax_loader(name)
+
     def scaffold_inline_form_models(self, form_class):
         """
             Contribute inline models to the form
@@ -569,6 +623,95 @@ class ModelView(BaseModelView):
 
         return joined
 
+    def scaffold_eager_loads(self):
+        """
+            Plan eager loading for the related models used by the list view.
+
+            Goes through `get_eager_load_paths` and returns a tuple of two
+            lists of dotted paths: many-to-one paths, which are loaded with
+            `joinedload` (or `contains_eager` if the table is already joined
+            for filtering), and paths which go through collections, which are
+            loaded with a separate `selectinload` (`subqueryload` on older
+            SQLAlchemy) query. Paths which do not consist of relations only,
+            like dotted columns of composite or hybrid properties, are skipped.
+        """
+        joined = []
+        collections = []
+
+        for path in self.get_eager_load_paths():
+            model = self.model
+            is_collection = False
+
+            for attribute in path.split('.'):
+                prop = getattr(getattr(model, attribute, None), 'property', None)
+
+                if prop is None or not hasattr(prop, 'direction'):
+                    break
+
+                if prop.direction.name != 'MANYTOONE':
+                    is_collection = True
+
+                model = prop.mapper.class_
+            else:
+                if is_collection:
+                    collections.append(path)
+                elif path not in joined:
+                    joined.append(path)
+
+        return joined, collections
+
+    def _apply_eager_loads(self, query, joins):
+        """
+            Apply planned eager loading to the list query.
+
+            :param query:
+                Query
+            :param joins:
+                Names of the tables already joined to the query
+        """
+        # Loader options for a dotted path only apply to its last hop, so
+        # every hop of the path gets an option.
+        joined = _path_hops(self._eager_joins)
+
+        for path in joined:
+            prop = getattr(self.model, path.split('.')[0]).property
+
+            if ('.' not in path and
+                    prop.target.name in joins and
+                    self._single_relation_to(prop.target)):
+                query = query.options(contains_eager(path))
+            else:
+                query = query.options(joinedload(path))
+
+        for path in _path_hops(self._eager_collections):
+            if path not in joined:
+                query = query.options(collectionload(path))
+
+        return query
+
+    def _single_relation_to(self, table):
+        """
+            Check if there is only one relation from the model to the table,
+            so explicit join against the table can be reused for loading.
+        """
+        count = 0
+
+        for p in self._get_model_iterator():
+            if hasattr(p, 'direction') and p.target is table:
+                count += 1
+
+        return count == 1
+
+    def get_query_counter(self):
+        """
+            Return query counter for the session engine.
+        """
+        if self._query_counter is None:
+            engine = self.session.get_bind(self.model.__mapper__)
+            self._query_counter = tools.QueryCounter(engine)
+
+        return self._query_counter
+
     # Database-related API
     def get_query(self):
         """
@@ -720,6 +863,8 @@ class ModelView(BaseModelView):
         for j in self._auto_joins:
             query = query.options(joinedload(j))
 
+        query = self._apply_eager_loads(query, joins)
+
         # Sorting
         if sort_column is not None:
             if sort_column in self._sortable_columns:
@@ -744,6 +889,35 @@ class ModelView(BaseModelView):
 
         return count, query
 
+    def get_export_data(self, sort_column, sort_desc, search, filters):
+        """
+            Return models for the export. Rows are fetched in batches of
+            `export_batch_size` through a server-side cursor where the
+            database driver supports it.
+
+            :param sort_column:
+                Sort column name
+            :param sort_desc:
+                Descending or ascending sort
+            :param search:
+                Search query
+            :param filters:
+                List of filter tuples
+        """
+        count, query = self.get_list(None, sort_column, sort_desc,
+                                     search, filters, execute=False)
+
+        query = query.limit(None).offset(None)
+
+        # Collections can not be eager loaded while streaming
+        joined = _path_hops(self._eager_joins)
+
+        for path in _path_hops(self._eager_collections):
+            if path not in joined:
+                query = query.options(lazyload(path))
+
+        return query.execution_options(stream_results=True).yield_per(self.export_batch_size)
+
     def get_one(self, id):
         """
             Return a single model by its id.
@@ -866,3 +1040,22 @@ class ModelView(BaseModelView):
                 raise
 
             flash(gettext('Failed to delete models. %(error)s', error=str(ex)), 'error')
+
+
+def _path_hops(paths):
+    """
+        Return every hop of the dotted paths, parents first. For example,
+        ``['a.b', 'a.c']`` becomes ``['a', 'a.b', 'a.c']``.
+    """
+    hops = []
+
+    for path in paths:
+        parts = path.split('.')
+
+        for i in range(1, len(parts) + 1):
+            hop = '.'.join(parts[:i])
+
+            if hop not in hops:
+                hops.append(hop)
+
+    return hops
@@ -1,5 +1,4 @@
 from flask import g, request
-from wtforms.validators import DataRequired, InputRequired
 
 from ._compat import string_types
 
@@ -22,6 +21,10 @@ def is_required_form_field(field):
         :param field:
             WTForms field to check
     """
+    # imported here so that applications without model views do not
+    # have to load WTForms on startup
+    from wtforms.validators import DataRequired, InputRequired
+
     for validator in field.validators:
         if isinstance(validator, (DataRequired, InputRequired)):
             return True
@@ -0,0 +1,66 @@
+DEFAULT_PAGE_SIZE = 10
+
+
+class AjaxModelLoader(object):
+    """
+        Ajax related model loader. Override this to implement custom loading behavior.
+    """
+    def __init__(self, name, options):
+        """
+            Constructor.
+
+            :param name:
+                Field name
+            :param options:
+                Dictionary with loader options. `page_size` limits the number
+                of models returned for one lookup.
+        """
+        self.name = name
+        self.options = options
+        self.page_size = options.get('page_size', DEFAULT_PAGE_SIZE)
+
+    def format(self, model):
+        """
+            Return (id, name) tuple from the model.
+        """
+        raise NotImplementedError()
+
+    def get_one(self, pk):
+        """
+            Find model by its primary key. Returns `None` if the model
+            does not exist.
+
+            :param pk:
+                Primary key value
+        """
+        raise NotImplementedError()
+
+    def get_many(self, pks):
+        """
+            Find models by their primary keys. Models that do not exist
+            are left out of the result.
+
+            :param pks:
+                List of primary key values
+        """
+        result = []
+
+        for pk in pks:
+            model = self.get_one(pk)
+            if model is not None:
+                result.append(model)
+
+        return result
+
+    def get_list(self, term, offset=0, limit=DEFAULT_PAGE_SIZE):
+        """
+            Return models that match the search `term`.
+
+            :param term:
+                Search term
+            :param offset:
+                Offset
+            :param limit:
+                Limit
+        """
+        raise NotImplementedError()
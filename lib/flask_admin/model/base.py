@@ -1,19 +1,25 @@
+import csv
+import logging
 import warnings
 
-from flask import request, url_for, redirect, flash
+from flask import (request, url_for, redirect, flash, abort, json,
+                   Response, stream_with_context)
 
-from jinja2 import contextfunction
+from jinja2 import contextfunction, Markup
+
+from werkzeug.urls import url_quote_plus
 
 from flask.ext.admin.babel import gettext
 
 from flask.ext.admin.base import BaseView, expose
 from flask.ext.admin.form import BaseForm
 from flask.ext.admin.model import filters, typefmt
+from flask.ext.admin.model.ajax import DEFAULT_PAGE_SIZE
 from flask.ext.admin.actions import ActionsMixin
 from flask.ext.admin.helpers import get_form_data, validate_form_on_submit
 from flask.ext.admin.tools import rec_getattr
 from flask.ext.admin._backwards import ObsoleteAttr
-from flask.ext.admin._compat import iteritems, as_unicode
+from flask.ext.admin._compat import iteritems, as_unicode, text_type, PY2
 from .helpers import prettify_name
 
 
@@ -45,6 +51,9 @@ class BaseModelView(BaseView, ActionsMixin):
     can_delete = True
     """Is model deletion allowed"""
 
+    can_export = False
+    """Is model list export allowed"""
+
     # Templates
     list_template = 'admin/model/list.html'
     """Default list view template"""
@@ -245,6 +254,29 @@ class BaseModelView(BaseView, ActionsMixin):
         Controls if the primary key should be displayed in the list view.
     """
 
+    column_eager_load_hints = None
+    """
+        Dictionary of related model paths used by list column formatters.
+
+        Related models referenced by dotted `column_list` entries are loaded
+        together with the list automatically. If a column formatter reads
+        related models, list them here so they are loaded in the same way
+        instead of one query per row.
+
+        Example::
+
+            class MyModelView(BaseModelView):
+                column_formatters = dict(author=lambda v, c, m, p: m.author.city.name)
+                column_eager_load_hints = dict(author=('author.city',))
+    """
+
+    debug_list_queries = False
+    """
+        If set to `True`, logs the number of data store queries issued
+        while rendering each list view page. Only works with the backends
+        that can count queries.
+    """
+
     form = None
     """
         Form class. Override if you want to use custom form for your model.
@@ -338,6 +370,27 @@ class BaseModelView(BaseView, ActionsMixin):
                 }
     """
 
+    form_ajax_refs = None
+    """
+        Use AJAX for foreign key model loading.
+
+        Should contain dictionary, where key is field name and value is either a dictionary which
+        configures AJAX lookups or backend-specific `AjaxModelLoader` class.
+
+        For example, it can look like::
+
+            class MyModelView(BaseModelView):
+                form_ajax_refs = {
+                    'user': {
+                        'fields': ('first_name', 'last_name', 'email'),
+                        'page_size': 10
+                    }
+                }
+
+        Only the selected models are loaded when the form is rendered, the
+        choices are looked up through the `ajax_lookup` endpoint.
+    """
+
     form_extra_fields = None
     """
         Dictionary of additional fields.
@@ -373,6 +426,33 @@ class BaseModelView(BaseView, ActionsMixin):
                 action_disallowed_list = ['delete']
     """
 
+    # Export
+    export_types = ('csv', 'json')
+    """
+        Collection of the export formats available through `export_view`.
+
+        Only ``csv`` and ``json`` are supported out of the box.
+    """
+
+    column_export_list = None
+    """
+        Collection of the model field names for the export. If set to `None`,
+        the list view columns will be exported.
+
+        For example::
+
+            class MyModelView(BaseModelView):
+                can_export = True
+                column_export_list = ('name', 'email', 'created_at')
+    """
+
+    export_batch_size = 500
+    """
+        Number of rows fetched from the data source at once while exporting.
+        Backends use it to size server-side cursors, so memory usage stays
+        constant regardless of the number of exported rows.
+    """
+
     # Various settings
     page_size = 20
     """
@@ -428,11 +508,16 @@ class BaseModelView(BaseView, ActionsMixin):
         self._list_columns = self.get_list_columns()
         self._sortable_columns = self.get_sortable_columns()
 
+        # Export
+        self._export_columns = self.get_export_columns()
+
         # Labels
         if self.column_labels is None:
             self.column_labels = {}
 
         # Forms
+        self._form_ajax_refs = self._process_ajax_references()
+
         self._create_form_class = self.get_create_form()
         self._edit_form_class = self.get_edit_form()
 
@@ -482,6 +567,10 @@ class BaseModelView(BaseView, ActionsMixin):
             self._filter_groups = None
             self._filter_types = None
 
+        # List row rendering
+        self._list_value_getters = [self._get_list_value_getter(c)
+                                    for c, _ in self._list_columns]
+
     # Primary key
     def get_pk_value(self, model):
         """
@@ -531,6 +620,41 @@ class BaseModelView(BaseView, ActionsMixin):
 
         return [(c, self.get_column_name(c)) for c in columns]
 
+    def get_export_columns(self):
+        """
+            Returns a list of the model field names for the export. If
+            `column_export_list` was set, returns it. Otherwise returns the
+            list view columns.
+        """
+        if self.column_export_list is None:
+            return self._list_columns
+
+        return [(c, self.get_column_name(c)) for c in self.column_export_list]
+
+    def get_eager_load_paths(self):
+        """
+            Returns a list of dotted related model paths touched by the list
+            view: parents of dotted `column_list` entries and paths from
+            `column_eager_load_hints`.
+
+            For example, ``user.city.name`` column will produce ``user.city``.
+        """
+        hints = self.column_eager_load_hints or {}
+        paths = []
+
+        for name, _ in self._list_columns:
+            if '.' in name:
+                paths.append(name.rsplit('.', 1)[0])
+
+            paths.extend(hints.get(name, ()))
+
+        result = []
+        for path in paths:
+            if path not in result:
+                result.append(path)
+
+        return result
+
     def scaffold_sortable_columns(self):
         """
             Returns dictionary of sortable columns. Must be implemented in
@@ -620,6 +744,21 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplemented('Please implement scaffold_form method')
 
+    def _process_ajax_references(self):
+        """
+            Process `form_ajax_refs` and return dictionary of `AjaxModelLoader`
+            instances keyed by their names. Backends that support AJAX
+            lookups override this method.
+        """
+        return {}
+
+    def _get_ajax_loader(self, name):
+        """
+            Return the `AjaxModelLoader` used by the `ajax_lookup` view for
+            the field `name`, or `None` if there is no such loader.
+        """
+        return self._form_ajax_refs.get(name)
+
     def get_form(self):
         """
             Get form class.
@@ -718,6 +857,51 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplemented('Please implement get_list method')
 
+    def get_export_data(self, sort_field, sort_desc, search, filters):
+        """
+            Return an iterable over all models that match the search and
+            filters, sorted the same way as the list view.
+
+            The default implementation walks through the list view pages one
+            by one. Backends should override it to stream rows from a single
+            query instead.
+
+            :param sort_field:
+                Sort column name or None.
+            :param sort_desc:
+                If set to True, sorting is in descending order.
+            :param search:
+                Search query
+            :param filters:
+                List of filter tuples.
+        """
+        page = 0
+
+        while True:
+            count, data = self.get_list(page, sort_field, sort_desc,
+                                        search, filters)
+
+            num = 0
+            for model in data:
+                num += 1
+                yield model
+
+            # without a page size the list holds all models at once
+            if not self.page_size or num < self.page_size:
+                break
+
+            page += 1
+
+    def get_query_counter(self):
+        """
+            Return a query counter for `debug_list_queries` or `None` if
+            backend can not count issued queries.
+
+            Counter is an object with `start()` method and `stop()` method
+            which returns number of queries issued since `start()`.
+        """
+        return None
+
     def get_one(self, id):
         """
             Return one model by its id.
@@ -884,7 +1068,7 @@ class BaseModelView(BaseView, ActionsMixin):
         return page, sort, sort_desc, search, filters
 
     def _get_url(self, view=None, page=None, sort=None, sort_desc=None,
-                 search=None, filters=None):
+                 search=None, filters=None, **kwargs):
         """
             Generate page URL with current page, sort column and
             other parameters.
@@ -901,6 +1085,8 @@ class BaseModelView(BaseView, ActionsMixin):
                 Search query
             :param filters:
                 List of active filters
+            :param kwargs:
+                Additional view arguments
         """
         if not search:
             search = None
@@ -908,7 +1094,7 @@ class BaseModelView(BaseView, ActionsMixin):
         if not page:
             page = None
 
-        kwargs = dict(page=page, sort=sort, desc=sort_desc, search=search)
+        kwargs.update(page=page, sort=sort, desc=sort_desc, search=search)
 
         if filters:
             for i, flt in enumerate(filters):
@@ -967,12 +1153,187 @@ class BaseModelView(BaseView, ActionsMixin):
 
         return value
 
+    def _get_list_value_getter(self, name):
+        """
+            Return a function which takes a template context and a model and
+            returns the value to be displayed in the list view, same as
+            `get_list_value` does. Formatters and lookups are resolved once,
+            so the function can be called for each row cheaply.
+
+            :param name:
+                Field name
+        """
+        # Respect overridden get_list_value
+        if getattr(self.get_list_value, '__func__', None) is not BaseModelView.__dict__['get_list_value']:
+            get_list_value = self.get_list_value
+
+            def getter(context, model):
+                return get_list_value(context, model, name)
+
+            return getter
+
+        column_fmt = self.column_formatters.get(name)
+        if column_fmt is not None:
+            def getter(context, model):
+                return column_fmt(self, context, model, name)
+
+            return getter
+
+        get_field_value = self._get_field_value
+
+        choices_map = self._column_choices_map.get(name)
+        if choices_map:
+            def getter(context, model):
+                value = get_field_value(model, name)
+                return choices_map.get(value) or value
+
+            return getter
+
+        type_formatters = self.column_type_formatters
+
+        def getter(context, model):
+            value = get_field_value(model, name)
+
+            type_fmt = type_formatters.get(type(value))
+            if type_fmt is not None:
+                value = type_fmt(self, value)
+
+            return value
+
+        return getter
+
+    @contextfunction
+    def get_list_rows(self, context, data):
+        """
+            Render list view rows in one batch.
+
+            Returns list of ``(model, pk, values)`` tuples, where `values` is
+            a list of the displayed values for the list columns.
+
+            :param context:
+                :py:class:`jinja2.runtime.Context`
+            :param data:
+                Models to render
+        """
+        get_pk_value = self.get_pk_value
+        getters = self._list_value_getters
+
+        return [(model,
+                 get_pk_value(model),
+                 [getter(context, model) for getter in getters])
+                for model in data]
+
+    def _get_row_url(self, view, return_url):
+        """
+            Return a function which generates URL of the `view` for the model
+            primary key. URL is generated once and the primary key is appended
+            to it for each row.
+
+            :param view:
+                View name
+            :param return_url:
+                Return URL
+        """
+        base_url = url_for(view, url=return_url)
+        base_url += '&id=' if '?' in base_url else '?id='
+
+        def row_url(pk):
+            return base_url + url_quote_plus(text_type(pk))
+
+        return row_url
+
+    def get_export_value(self, model, name):
+        """
+            Returns the value to be written to the export file.
+
+            Uses the same `column_formatters` and `column_type_formatters` as
+            the list view, except for `None`, which is exported as an empty
+            string, and booleans, which are exported as `True` and `False`.
+            As there is no template context while exporting, column
+            formatters receive `None` as the context. HTML markup returned by
+            formatters is stripped.
+
+            :param model:
+                Model instance
+            :param name:
+                Field name
+        """
+        column_fmt = self.column_formatters.get(name)
+        if column_fmt is not None:
+            value = column_fmt(self, None, model, name)
+        else:
+            value = self._get_field_value(model, name)
+
+            choices_map = self._column_choices_map.get(name)
+            if choices_map:
+                value = choices_map.get(value) or value
+            elif isinstance(value, bool):
+                return as_unicode(value)
+            elif value is not None:
+                type_fmt = self.column_type_formatters.get(type(value))
+                if type_fmt is not None:
+                    value = type_fmt(self, value)
+
+        if value is None:
+            return u''
+
+        if isinstance(value, Markup):
+            return value.striptags()
+
+        return as_unicode(value)
+
+    def _export_csv(self, data, columns):
+        """
+            Generate CSV rows, one chunk per row.
+        """
+        class Echo(object):
+            def write(self, value):
+                return value
+
+        writer = csv.writer(Echo())
+
+        def encode(values):
+            if PY2:
+                return [as_unicode(v).encode('utf-8') for v in values]
+
+            return [as_unicode(v) for v in values]
+
+        yield writer.writerow(encode(c[1] for c in columns))
+
+        for model in data:
+            yield writer.writerow(encode(self.get_export_value(model, c[0])
+                                         for c in columns))
+
+    def _export_json(self, data, columns):
+        """
+            Generate a JSON array of objects, one chunk per row.
+        """
+        yield '['
+
+        separator = ''
+        for model in data:
+            row = dict((c[0], self.get_export_value(model, c[0]))
+                       for c in columns)
+
+            yield separator + json.dumps(row)
+            separator = ','
+
+        yield ']'
+
     # Views
     @expose('/')
     def index_view(self):
         """
             List view
         """
+        # Count queries if asked to
+        query_counter = None
+        if self.debug_list_queries:
+            query_counter = self.get_query_counter()
+
+            if query_counter is not None:
+                query_counter.start()
+
         # Grab parameters from URL
         page, sort_idx, sort_desc, search, filters = self._get_extra_args()
 
@@ -1020,50 +1381,95 @@ class BaseModelView(BaseView, ActionsMixin):
             return self._get_url('.index_view', page, column, desc,
                                  search, filters)
 
+        def export_url(export_type):
+            return self._get_url('.export_view', None, sort_idx, sort_desc,
+                                 search, filters, export_type=export_type)
+
+        return_url = self._get_url('.index_view', page, sort_idx, sort_desc,
+                                   search, filters)
+
         # Actions
         actions, actions_confirmation = self.get_actions_list()
 
-        return self.render(self.list_template,
-                               data=data,
-                               # List
-                               list_columns=self._list_columns,
-                               sortable_columns=self._sortable_columns,
-                               # Stuff
-                               enumerate=enumerate,
-                               get_pk_value=self.get_pk_value,
-                               get_value=self.get_list_value,
-                               return_url=self._get_url('.index_view',
-                                                        page,
-                                                        sort_idx,
-                                                        sort_desc,
-                                                        search,
-                                                        filters),
-                               # Pagination
-                               count=count,
-                               pager_url=pager_url,
-                               num_pages=num_pages,
-                               page=page,
-                               # Sorting
-                               sort_column=sort_idx,
-                               sort_desc=sort_desc,
-                               sort_url=sort_url,
-                               # Search
-                               search_supported=self._search_supported,
-                               clear_search_url=self._get_url('.index_view',
-                                                              None,
-                                                              sort_idx,
-                                                              sort_desc),
-                               search=search,
-                               # Filters
-                               filters=self._filters,
-                               filter_groups=self._filter_groups,
-                               filter_types=self._filter_types,
-                               filter_data=filters_data,
-                               active_filters=filters,
-
-                               # Actions
-                               actions=actions,
-                               actions_confirmation=actions_confirmation)
+        result = self.render(self.list_template,
+                             data=data,
+                             # List
+                             list_columns=self._list_columns,
+                             sortable_columns=self._sortable_columns,
+                             # Stuff
+                             enumerate=enumerate,
+                             get_pk_value=self.get_pk_value,
+                             get_value=self.get_list_value,
+                             get_list_rows=self.get_list_rows,
+                             edit_url=self._get_row_url('.edit_view', return_url),
+                             delete_url=self._get_row_url('.delete_view', return_url),
+                             return_url=return_url,
+                             # Pagination
+                             count=count,
+                             pager_url=pager_url,
+                             num_pages=num_pages,
+                             page=page,
+                             # Sorting
+                             sort_column=sort_idx,
+                             sort_desc=sort_desc,
+                             sort_url=sort_url,
+                             # Export
+                             export_types=self.export_types if self.can_export else None,
+                             export_url=export_url,
+                             # Search
+                             search_supported=self._search_supported,
+                             clear_search_url=self._get_url('.index_view',
+                                                            None,
+                                                            sort_idx,
+                                                            sort_desc),
+                             search=search,
+                             # Filters
+                             filters=self._filters,
+                             filter_groups=self._filter_groups,
+                             filter_types=self._filter_types,
+                             filter_data=filters_data,
+                             active_filters=filters,
+
+                             # Actions
+                             actions=actions,
+                             actions_confirmation=actions_confirmation)
+
+        if query_counter is not None:
+            logging.info('%s: list page %s issued %d queries',
+                         self.endpoint, page, query_counter.stop())
+
+        return result
+
+    @expose('/export/<export_type>/')
+    def export_view(self, export_type):
+        """
+            Export model list view. Applies the same search, filters and
+            sorting as the list view and streams all matching rows.
+        """
+        if not self.can_export or export_type not in self.export_types:
+            abort(404)
+
+        page, sort_idx, sort_desc, search, filters = self._get_extra_args()
+
+        sort_column = self._get_column_by_idx(sort_idx)
+        if sort_column is not None:
+            sort_column = sort_column[0]
+
+        data = self.get_export_data(sort_column, sort_desc, search, filters)
+
+        if export_type == 'csv':
+            gen = self._export_csv(data, self._export_columns)
+            mimetype = 'text/csv'
+        else:
+            gen = self._export_json(data, self._export_columns)
+            mimetype = 'application/json'
+
+        filename = '%s.%s' % (self.endpoint, export_type)
+
+        return Response(stream_with_context(gen),
+                        mimetype=mimetype,
+                        headers={'Content-Disposition':
+                                 'attachment; filename=%s' % filename})
 
     @expose('/new/', methods=('GET', 'POST'))
     def create_view(self):
@@ -1153,3 +1559,25 @@ class BaseModelView(BaseView, ActionsMixin):
             Mass-model action view.
         """
         return self.handle_action()
+
+    @expose('/ajax/lookup/')
+    def ajax_lookup(self):
+        """
+            Look up models for AJAX enabled select fields. Returns a JSON
+            array of ``[pk, label]`` pairs.
+        """
+        name = request.args.get('name')
+        query = request.args.get('query')
+        offset = request.args.get('offset', 0, type=int)
+        limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+
+        loader = self._get_ajax_loader(name)
+
+        if not loader:
+            abort(404)
+
+        offset = max(offset, 0)
+        limit = max(min(limit, loader.page_size), 0)
+
+        data = [loader.format(m) for m in loader.get_list(query, offset, limit)]
+        return Response(json.dumps(data), mimetype='application/json')
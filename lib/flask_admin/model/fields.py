@@ -1,9 +1,10 @@
 import itertools
 
-from wtforms.fields import FieldList, FormField
+from wtforms.fields import FieldList, FormField, SelectFieldBase
+from wtforms.validators import ValidationError
 
 from flask.ext.admin._compat import iteritems
-from .widgets import InlineFieldListWidget, InlineFormWidget
+from .widgets import InlineFieldListWidget, InlineFormWidget, AjaxSelect2Widget
 
 
 class InlineFieldList(FieldList):
@@ -93,3 +94,116 @@ class InlineFormField(FormField):
         Inline version of the ``FormField`` widget.
     """
     widget = InlineFormWidget()
+
+
+class AjaxSelectField(SelectFieldBase):
+    """
+        Ajax Model Select Field.
+
+        Only the selected model is loaded, by its primary key, when the form
+        is rendered or submitted. The choices are looked up by the browser
+        through the `ajax_lookup` endpoint of the view.
+    """
+    widget = AjaxSelect2Widget()
+
+    separator = ','
+
+    def __init__(self, loader, label=None, validators=None, allow_blank=False, blank_text=u'', **kwargs):
+        super(AjaxSelectField, self).__init__(label, validators, **kwargs)
+        self.loader = loader
+
+        self.allow_blank = allow_blank
+        self.blank_text = blank_text
+        self._invalid_formdata = False
+
+    def _get_data(self):
+        if self._formdata:
+            model = self.loader.get_one(self._formdata)
+
+            if model is None:
+                self._invalid_formdata = True
+
+            self._set_data(model)
+
+        return self._data
+
+    def _set_data(self, data):
+        self._data = data
+        self._formdata = None
+
+    data = property(_get_data, _set_data)
+
+    def _format_item(self, item):
+        value = self.loader.format(item)
+        return (value[0], value[1], True)
+
+    def iter_choices(self):
+        if self.allow_blank:
+            yield (u'__None', self.blank_text, self.data is None)
+
+        if self.data is not None:
+            yield self._format_item(self.data)
+
+    def process_formdata(self, valuelist):
+        if valuelist:
+            if self.allow_blank and valuelist[0] in (u'__None', u''):
+                self.data = None
+            else:
+                self._data = None
+                self._formdata = valuelist[0]
+
+    def pre_validate(self, form):
+        # Loading the data flags unknown primary keys
+        data = self._get_data()
+
+        if self._invalid_formdata or (data is None and not self.allow_blank):
+            raise ValidationError(self.gettext(u'Not a valid choice'))
+
+
+class AjaxSelectMultipleField(AjaxSelectField):
+    """
+        Ajax-enabled model multi-select field.
+
+        Submitted primary keys are loaded with a single `get_many` call of
+        the loader.
+    """
+    widget = AjaxSelect2Widget(multiple=True)
+
+    def __init__(self, loader, label=None, validators=None, default=None, **kwargs):
+        if default is None:
+            default = []
+
+        super(AjaxSelectMultipleField, self).__init__(loader, label, validators, default=default, **kwargs)
+
+    def _get_data(self):
+        formdata = self._formdata
+        if formdata:
+            data = self.loader.get_many(formdata)
+
+            if len(data) != len(formdata):
+                self._invalid_formdata = True
+
+            self._set_data(data)
+
+        return self._data
+
+    def _set_data(self, data):
+        self._data = data
+        self._formdata = None
+
+    data = property(_get_data, _set_data)
+
+    def iter_choices(self):
+        for item in self.data:
+            yield self._format_item(item)
+
+    def process_formdata(self, valuelist):
+        self._formdata = set()
+
+        for field in valuelist:
+            for n in field.split(self.separator):
+                if n:
+                    self._formdata.add(n)
+
+        if not self._formdata:
+            self._set_data([])
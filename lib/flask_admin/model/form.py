@@ -23,6 +23,18 @@ class InlineFormAdmin(object):
     """
     _defaults = ['form_columns', 'form_excluded_columns', 'form_args']
 
+    bulk_save = False
+    """
+        Write inserted, changed and deleted inline rows with one statement
+        per kind instead of one per row. Disabled by default.
+
+        Only used by the SQLAlchemy backend. The rows are written without
+        the ORM: mapper events, relationship cascades and defaults set by
+        the ORM are skipped, so only enable it for plain models. Relations
+        it can not handle this way (many-to-many, versioned or inherited
+        models, cascading deletes) are still saved through the session.
+    """
+
     def __init__(self, model, **kwargs):
         """
             Constructor
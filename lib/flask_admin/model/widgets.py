@@ -1,3 +1,7 @@
+from flask import json, url_for
+from wtforms.widgets import HTMLString, html_params
+
+from flask.ext.admin._compat import as_unicode
 from flask.ext.admin.form import RenderTemplateWidget
 
 
@@ -9,3 +13,50 @@ class InlineFieldListWidget(RenderTemplateWidget):
 class InlineFormWidget(RenderTemplateWidget):
     def __init__(self):
         super(InlineFormWidget, self).__init__('admin/model/inline_form.html')
+
+
+class AjaxSelect2Widget(object):
+    """
+        `Select2 <https://github.com/ivaynberg/select2>`_ styled widget that
+        loads its choices from the `ajax_lookup` endpoint of the view.
+
+        Only the selected models are rendered into the page. You must include
+        select2.js, form.js and select2 stylesheet for it to work.
+    """
+    def __init__(self, multiple=False):
+        self.multiple = multiple
+
+    def __call__(self, field, **kwargs):
+        kwargs.setdefault('data-role', 'select2-ajax')
+        kwargs.setdefault('data-url', url_for('.ajax_lookup', name=field.loader.name))
+        kwargs.setdefault('data-page-size', field.loader.page_size)
+
+        allow_blank = getattr(field, 'allow_blank', False)
+        if allow_blank and not self.multiple:
+            kwargs['data-allow-blank'] = u'1'
+
+        kwargs.setdefault('id', field.id)
+        kwargs.setdefault('type', 'hidden')
+
+        if self.multiple:
+            result = []
+            ids = []
+
+            for value in field.data:
+                data = field.loader.format(value)
+                result.append(data)
+                ids.append(as_unicode(data[0]))
+
+            separator = getattr(field, 'separator', ',')
+
+            kwargs['value'] = separator.join(ids)
+            kwargs['data-json'] = json.dumps(result)
+            kwargs['data-multiple'] = u'1'
+        else:
+            data = field.loader.format(field.data)
+
+            if data:
+                kwargs['value'] = data[0]
+                kwargs['data-json'] = json.dumps(data)
+
+        return HTMLString('<input %s>' % html_params(name=field.name, **kwargs))
@@ -1,10 +1,77 @@
 (function() {
     var AdminForm = function() {
+      // Select2 with choices loaded from the ajax_lookup view
+      function processAjaxWidget($el) {
+        var multiple = $el.attr('data-multiple') == '1';
+        var pageSize = parseInt($el.attr('data-page-size'), 10) || 10;
+
+        var opts = {
+          width: 'resolve',
+          minimumInputLength: 1,
+          ajax: {
+            url: $el.attr('data-url'),
+            data: function(term, page) {
+              return {
+                query: term,
+                offset: (page - 1) * pageSize,
+                limit: pageSize
+              };
+            },
+            results: function(data, page) {
+              var results = [];
+
+              for (var k in data) {
+                var v = data[k];
+
+                results.push({id: v[0], text: v[1]});
+              }
+
+              return {
+                results: results,
+                more: results.length == pageSize
+              };
+            }
+          },
+          initSelection: function(element, callback) {
+            var value = $el.attr('data-json');
+            var result = null;
+
+            if (value) {
+              value = JSON.parse(value);
+
+              if (multiple) {
+                result = [];
+
+                for (var k in value) {
+                  var v = value[k];
+                  result.push({id: v[0], text: v[1]});
+                }
+              } else {
+                result = {id: value[0], text: value[1]};
+              }
+            }
+
+            callback(result);
+          }
+        };
+
+        if ($el.attr('data-allow-blank')) {
+          opts['allowClear'] = true;
+        }
+
+        opts['multiple'] = multiple;
+
+        $el.select2(opts);
+      }
+
       this.applyStyle = function(el, name) {
         switch (name) {
             case 'select2':
                 $(el).select2({width: 'resolve'});
                 break;
+            case 'select2-ajax':
+                processAjaxWidget($(el));
+                break;
             case 'select2blank':
                 $(el).select2({allowClear: true, width: 'resolve'});
                 break;
@@ -64,6 +131,9 @@
         $('[data-role=select2]', parent).select2({width: 'resolve'});
         $('[data-role=select2blank]', parent).select2({allowClear: true, width: 'resolve'});
         $('[data-role=select2tags]', parent).select2({tags: [], tokenSeparators: [','], width: 'resolve'});
+        $('[data-role=select2-ajax]', parent).each(function() {
+          processAjaxWidget($(this));
+        });
         $('[data-role=datepicker]', parent).datepicker();
         $('[data-role=datetimepicker]', parent).datepicker({displayTime: true});
       };
@@ -1,5 +1,8 @@
 from nose.tools import eq_, ok_
+import os
 import os.path as op
+import shutil
+import tempfile
 
 from flask.ext.admin.contrib import fileadmin
 
@@ -26,3 +29,33 @@ def test_file_admin():
     ok_('dummy.txt' in rv.data.decode('utf-8'))
 
     # TODO: Check actions, etc
+
+
+def test_listing_cache():
+    path = tempfile.mkdtemp()
+
+    try:
+        os.mkdir(op.join(path, 'b_dir'))
+        for name in ('c.txt', 'a.txt'):
+            with open(op.join(path, name), 'w') as f:
+                f.write('data')
+
+        # Pretend directory was modified long ago, so listing is cached
+        os.utime(path, (0, 0))
+
+        view = fileadmin.FileAdmin(path, '/files/', name='Files')
+
+        listing = view._get_listing(path)
+        eq_(listing, [('b_dir', True), ('a.txt', False), ('c.txt', False)])
+        ok_(view._get_listing(path) is listing)
+
+        eq_(view._get_file_size(op.join(path, 'a.txt')), 4)
+        eq_(view._get_file_size(op.join(path, 'missing.txt')), 0)
+
+        # Modification time change invalidates the listing
+        os.remove(op.join(path, 'c.txt'))
+        os.utime(path, (1, 1))
+
+        eq_(view._get_listing(path), [('b_dir', True), ('a.txt', False)])
+    finally:
+        shutil.rmtree(path)
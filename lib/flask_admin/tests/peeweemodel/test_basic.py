@@ -150,6 +150,58 @@ def test_default_sort():
     eq_(data[2].test1, 'c')
 
 
+def test_eager_loads():
+    app, db, admin = setup()
+    M1, _ = create_models(db)
+
+    class Model3(peewee.Model):
+        name = peewee.CharField(max_length=20)
+        model1 = peewee.ForeignKeyField(M1, null=True)
+
+        class Meta:
+            database = db
+
+    Model3.create_table()
+
+    for i in range(5):
+        m1 = M1('m1-%d' % i, 'x')
+        m1.save()
+        Model3.create(name='m3-%d' % i, model1=m1)
+    Model3.create(name='m3-none')
+
+    view = CustomModelView(Model3, column_list=('name', 'model1.test1'),
+                           column_searchable_list=('name',),
+                           column_filters=('name',))
+    admin.add_view(view)
+
+    eq_(view._eager_models, [M1])
+
+    queries = []
+    execute_sql = db.execute_sql
+
+    def counting_execute_sql(sql, *args, **kwargs):
+        queries.append(sql)
+        return execute_sql(sql, *args, **kwargs)
+
+    db.execute_sql = counting_execute_sql
+
+    count, data = view.get_list(0, None, None, None, [])
+    eq_(count, 6)
+    values = dict((m.name, m.model1 and m.model1.test1) for m in data)
+    eq_(len(queries), 2)
+    eq_(values['m3-1'], 'm1-1')
+    eq_(values['m3-none'], None)
+
+    count, data = view.get_list(0, None, None, 'm3-2', [(0, 'm3-2')])
+    eq_(count, 1)
+    eq_([m.model1.test1 for m in data], ['m1-2'])
+
+    client = app.test_client()
+    rv = client.get('/admin/model3view/')
+    eq_(rv.status_code, 200)
+    ok_(u'm1-4' in rv.data.decode('utf-8'))
+
+
 def test_extra_fields():
     app, db, admin = setup()
 
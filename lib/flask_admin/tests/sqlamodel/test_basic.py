@@ -2,9 +2,13 @@ from nose.tools import eq_, ok_, raises
 
 from wtforms import fields
 
+from flask import json
+
 from flask.ext.admin import form
 from flask.ext.admin._compat import iteritems
+from flask.ext.admin.model.fields import AjaxSelectField
 from flask.ext.admin.contrib.sqla import ModelView
+from flask.ext.admin.contrib.sqla.fields import QuerySelectField
 
 from . import setup
 
@@ -497,6 +501,116 @@ def test_relations():
     pass
 
 
+def test_ajax_refs():
+    app, db, admin = setup()
+    M1, M2 = create_models(db)
+
+    db.session.add_all([M1('first'), M1('second'), M1('third')])
+    db.session.commit()
+
+    view = CustomModelView(M2, db.session,
+                           form_ajax_refs={'model1': {'fields': ('test1',)}})
+    admin.add_view(view)
+
+    ok_('model1' in view._form_ajax_refs)
+    eq_(view._create_form_class.model1.field_class, AjaxSelectField)
+
+    client = app.test_client()
+
+    rv = client.get('/admin/model2view/ajax/lookup/?name=model1&query=ir')
+    eq_(rv.status_code, 200)
+    data = json.loads(rv.data.decode('utf-8'))
+    eq_([pk for pk, label in data], [1, 3])
+
+    rv = client.get('/admin/model2view/ajax/lookup/?name=model1&offset=1&limit=1')
+    eq_([pk for pk, label in json.loads(rv.data.decode('utf-8'))], [2])
+
+    rv = client.get('/admin/model2view/ajax/lookup/?name=model1&offset=-1&limit=-1')
+    eq_(json.loads(rv.data.decode('utf-8')), [])
+
+    rv = client.get('/admin/model2view/ajax/lookup/?name=model1&offset=-5&limit=1')
+    eq_([pk for pk, label in json.loads(rv.data.decode('utf-8'))], [1])
+
+    rv = client.get('/admin/model2view/ajax/lookup/?name=missing')
+    eq_(rv.status_code, 404)
+
+    rv = client.post('/admin/model2view/new/',
+                     data=dict(string_field='test', model1='2'))
+    eq_(rv.status_code, 302)
+
+    model = db.session.query(M2).first()
+    eq_(model.model1.test1, 'second')
+
+    rv = client.get('/admin/model2view/edit/?id=%s' % model.id)
+    data = rv.data.decode('utf-8')
+    ok_('data-role="select2-ajax"' in data)
+    ok_('data-page-size="10"' in data)
+    ok_('value="2"' in data)
+
+    rv = client.post('/admin/model2view/new/',
+                     data=dict(string_field='test', model1='100'))
+    eq_(db.session.query(M2).count(), 1)
+
+    # Values which are not valid for the primary key type are not queried
+    loader = view._form_ajax_refs['model1']
+    eq_(loader.get_one(u'abc'), None)
+    eq_([m.test1 for m in loader.get_many([u'abc', u'2'])], ['second'])
+
+    rv = client.post('/admin/model2view/new/',
+                     data=dict(string_field='test', model1='abc'))
+    eq_(rv.status_code, 200)
+    ok_(u'Not a valid choice' in rv.data.decode('utf-8'))
+    eq_(db.session.query(M2).count(), 1)
+
+
+def test_ajax_threshold():
+    app, db, admin = setup()
+    M1, M2 = create_models(db)
+
+    # Rows are counted when the form is used, not when it is scaffolded
+    view = CustomModelView(M2, db.session, form_ajax_threshold=1)
+    admin.add_view(view)
+
+    view2 = CustomModelView(M2, db.session, form_ajax_threshold=2,
+                            endpoint='small')
+    admin.add_view(view2)
+
+    view3 = CustomModelView(M2, db.session, form_ajax_threshold=1,
+                            endpoint='fresh')
+    admin.add_view(view3)
+
+    # Disabled by default
+    view4 = CustomModelView(M2, db.session, endpoint='default')
+    admin.add_view(view4)
+
+    db.session.add_all([M1('first'), M1('second')])
+    db.session.commit()
+
+    eq_(view._form_ajax_refs, {})
+    eq_(view._create_form_class.model1.field_class, AjaxSelectField)
+    eq_(view2._create_form_class.model1.field_class, QuerySelectField)
+    eq_(view4._create_form_class.model1.field_class, QuerySelectField)
+
+    client = app.test_client()
+    rv = client.get('/admin/model2view/new/')
+    ok_('data-role="select2-ajax"' in rv.data.decode('utf-8'))
+
+    rv = client.get('/admin/model2view/ajax/lookup/?name=model1')
+    eq_(len(json.loads(rv.data.decode('utf-8'))), 2)
+
+    # Only relations which switched to AJAX can be looked up
+    rv = client.get('/admin/small/ajax/lookup/?name=model1')
+    eq_(rv.status_code, 404)
+
+    rv = client.get('/admin/default/ajax/lookup/?name=model1')
+    eq_(rv.status_code, 404)
+
+    # Lookups work before the form was used
+    rv = client.get('/admin/fresh/ajax/lookup/?name=model1')
+    eq_(rv.status_code, 200)
+    eq_(len(json.loads(rv.data.decode('utf-8'))), 2)
+
+
 def test_on_model_change_delete():
     app, db, admin = setup()
     Model1, _ = create_models(db)
@@ -568,6 +682,109 @@ def test_default_sort():
     eq_(data[2].test1, 'c')
 
 
+def test_export():
+    app, db, admin = setup()
+    M1, _ = create_models(db)
+
+    db.session.add_all([M1('c', bool_field=True), M1('b'), M1('a')])
+    db.session.commit()
+
+    view = CustomModelView(M1, db.session, can_export=True,
+                           column_list=('test1', 'bool_field'),
+                           column_searchable_list=('test1',),
+                           export_batch_size=2)
+    admin.add_view(view)
+
+    client = app.test_client()
+
+    rv = client.get('/admin/model1view/export/csv/?sort=0')
+    eq_(rv.status_code, 200)
+    eq_(rv.data.decode('utf-8').splitlines(),
+        ['Test1,Bool Field', 'a,False', 'b,False', 'c,True'])
+
+    rv = client.get('/admin/model1view/export/csv/?search=c')
+    eq_(rv.data.decode('utf-8').splitlines(), ['Test1,Bool Field', 'c,True'])
+
+    rv = client.get('/admin/model1view/export/json/?sort=0&desc=1')
+    data = rv.data.decode('utf-8')
+    ok_(data.startswith('[') and data.endswith(']'))
+    ok_(data.index('"c"') < data.index('"a"'))
+
+
+def test_eager_loads():
+    app, db, admin = setup()
+    M1, M2 = create_models(db)
+
+    for i in range(5):
+        db.session.add(M2('m2-%d' % i, model1=M1('m1-%d' % i)))
+    db.session.commit()
+
+    view = CustomModelView(M2, db.session, column_list=('string_field', 'model1.test1'),
+                           column_auto_select_related=False,
+                           endpoint='eager')
+    admin.add_view(view)
+
+    eq_(view._eager_joins, ['model1'])
+    eq_(view._eager_collections, [])
+
+    counter = view.get_query_counter()
+
+    with app.test_request_context():
+        counter.start()
+        count, data = view.get_list(0, None, None, None, None)
+        values = [view.get_list_value(None, m, 'model1.test1') for m in data]
+        eq_(counter.stop(), 2)
+
+    eq_(sorted(values), ['m1-%d' % i for i in range(5)])
+
+    # Paths which are not relations are skipped
+    view2 = CustomModelView(M2, db.session, column_list=('string_field',),
+                            column_eager_load_hints=dict(
+                                string_field=('string_field.upper', 'model1')),
+                            endpoint='eager2')
+    eq_(view2._eager_joins, ['model1'])
+
+    view.debug_list_queries = True
+
+    client = app.test_client()
+    rv = client.get('/admin/eager/')
+    eq_(rv.status_code, 200)
+    ok_(u'm1-4' in rv.data.decode('utf-8'))
+
+
+def test_eager_loads_two_hops():
+    app, db, admin = setup()
+    M1, M2 = create_models(db)
+
+    class Model3(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        model2_id = db.Column(db.Integer, db.ForeignKey(M2.id))
+        model2 = db.relationship(M2)
+
+    db.create_all()
+
+    for i in range(5):
+        m2 = M2('m2-%d' % i, model1=M1('m1-%d' % i))
+        db.session.add(Model3(model2=m2))
+    db.session.commit()
+
+    view = CustomModelView(Model3, db.session, column_list=('model2.model1.test1',),
+                           column_auto_select_related=False)
+    admin.add_view(view)
+
+    eq_(view._eager_joins, ['model2.model1'])
+
+    counter = view.get_query_counter()
+
+    with app.test_request_context():
+        counter.start()
+        count, data = view.get_list(0, None, None, None, None)
+        values = [view.get_list_value(None, m, 'model2.model1.test1') for m in data]
+        eq_(counter.stop(), 2)
+
+    eq_(sorted(values), ['m1-%d' % i for i in range(5)])
+
+
 def test_extra_fields():
     app, db, admin = setup()
 
@@ -2,6 +2,7 @@
 from nose.tools import eq_, ok_, raises
 
 from wtforms import fields
+from sqlalchemy import event
 
 from flask.ext.admin.contrib.sqla import ModelView
 from flask.ext.admin.contrib.sqla.fields import InlineModelFormList
@@ -93,3 +94,221 @@ def test_inline_form():
     eq_(rv.status_code, 302)
     eq_(User.query.count(), 0)
     eq_(UserInfo.query.count(), 0)
+
+
+def test_inline_form_shared_choices():
+    app, db, admin = setup()
+    client = app.test_client()
+
+    class Category(db.Model):
+        __tablename__ = 'category'
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String)
+
+        def __unicode__(self):
+            return self.name
+
+        __str__ = __unicode__
+
+    class User(db.Model):
+        __tablename__ = 'users'
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String)
+
+    class UserInfo(db.Model):
+        __tablename__ = 'user_info'
+        id = db.Column(db.Integer, primary_key=True)
+        key = db.Column(db.String, nullable=False)
+        user_id = db.Column(db.Integer, db.ForeignKey(User.id))
+        user = db.relationship(User, backref=db.backref('info', cascade="all, delete-orphan", single_parent=True))
+        category_id = db.Column(db.Integer, db.ForeignKey(Category.id))
+        category = db.relationship(Category)
+
+    db.create_all()
+
+    class UserModelView(ModelView):
+        inline_models = (UserInfo,)
+
+    view = UserModelView(User, db.session)
+    admin.add_view(view)
+
+    categories = [Category(name=u'c%d' % i) for i in range(3)]
+    user = User(name=u'user')
+    for i in range(10):
+        user.info.append(UserInfo(key=u'k%d' % i, category=categories[i % 3]))
+    db.session.add(user)
+    db.session.commit()
+
+    ids = [info.id for info in user.info]
+    category_id = categories[0].id
+    db.session.remove()
+
+    data = {'name': u'changed'}
+    for n, pk in enumerate(ids):
+        data['info-%d-id' % n] = str(pk)
+        data['info-%d-key' % n] = u'key%d' % n
+        data['info-%d-category' % n] = str(category_id)
+    data['del-info-0'] = 'on'
+
+    statements = []
+
+    # Full category list queries, lazy loads of single categories excluded
+    def on_execute(conn, cursor, statement, *args):
+        if 'FROM category' in statement and 'WHERE' not in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', on_execute)
+
+    rv = client.get('/admin/userview/edit/?id=%s' % user.id)
+    eq_(rv.status_code, 200)
+    eq_(len(statements), 1)
+
+    del statements[:]
+    rv = client.post('/admin/userview/edit/?id=%s' % user.id, data=data)
+    eq_(rv.status_code, 302)
+    eq_(len(statements), 1)
+
+    eq_(UserInfo.query.count(), 9)
+    eq_(set(i.category_id for i in UserInfo.query), set([category_id]))
+    eq_(sorted(i.key for i in UserInfo.query), [u'key%d' % n for n in range(1, 10)])
+
+
+def test_inline_form_bulk_save():
+    app, db, admin = setup()
+    client = app.test_client()
+
+    class User(db.Model):
+        __tablename__ = 'users'
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String)
+
+    class UserInfo(db.Model):
+        __tablename__ = 'user_info'
+        id = db.Column(db.Integer, primary_key=True)
+        key = db.Column(db.String, nullable=False)
+        val = db.Column(db.String)
+        user_id = db.Column(db.Integer, db.ForeignKey(User.id))
+        user = db.relationship(User, backref=db.backref('info', cascade="all, delete-orphan", single_parent=True))
+
+    db.create_all()
+
+    class UserModelView(ModelView):
+        inline_models = ((UserInfo, dict(bulk_save=True)),)
+
+    view = UserModelView(User, db.session)
+    admin.add_view(view)
+
+    user = User(name=u'user')
+    for i in range(10):
+        user.info.append(UserInfo(key=u'k%d' % i, val=u'v%d' % i))
+    db.session.add(user)
+    db.session.commit()
+
+    user_id = user.id
+    ids = [info.id for info in user.info]
+    db.session.remove()
+
+    data = {'name': u'changed'}
+    for n, pk in enumerate(ids):
+        data['info-%d-id' % n] = str(pk)
+        data['info-%d-key' % n] = u'key%d' % n
+        data['info-%d-val' % n] = u'v%d' % n
+    data['del-info-0'] = 'on'
+    data['del-info-1'] = 'on'
+    for n in range(10, 13):
+        data['info-%d-key' % n] = u'key%d' % n
+
+    statements = []
+
+    def on_execute(conn, cursor, statement, *args):
+        if 'user_info' in statement and not statement.startswith('SELECT'):
+            statements.append(statement.split()[0])
+
+    event.listen(db.engine, 'before_cursor_execute', on_execute)
+
+    rv = client.post('/admin/userview/edit/?id=%s' % user_id, data=data)
+    eq_(rv.status_code, 302)
+    eq_(sorted(statements), ['DELETE', 'INSERT', 'UPDATE'])
+
+    infos = UserInfo.query.order_by(UserInfo.id).all()
+    eq_([i.key for i in infos], [u'key%d' % n for n in range(2, 13)])
+    eq_(set(i.user_id for i in infos), set([user_id]))
+    eq_(infos[0].val, u'v2')
+    eq_(infos[-1].val, u'')
+
+    # Without the relationship loaded, only the submitted rows are queried
+    first_id = infos[0].id
+    del statements[:]
+    data = {'name': u'changed',
+            'info-0-id': str(first_id), 'info-0-key': u'first',
+            'info-1-key': u'new'}
+
+    with app.test_request_context(method='POST', data=data):
+        user = User.query.get(user_id)
+        form = view.edit_form()
+        form.info.populate_obj(user, 'info')
+        ok_('info' not in user.__dict__)
+        db.session.commit()
+
+    eq_(sorted(statements), ['INSERT', 'UPDATE'])
+    eq_(UserInfo.query.get(first_id).key, u'first')
+    eq_(UserInfo.query.filter_by(key=u'new').one().user_id, user_id)
+    eq_(UserInfo.query.count(), 12)
+
+    # By default the rows are saved through the session
+    class PlainModelView(ModelView):
+        inline_models = (UserInfo,)
+
+    view = PlainModelView(User, db.session, endpoint='plain')
+    admin.add_view(view)
+
+    infos = UserInfo.query.order_by(UserInfo.id).all()[:2]
+    data = {'name': u'changed'}
+    for n, info in enumerate(infos):
+        data['info-%d-id' % n] = str(info.id)
+        data['info-%d-key' % n] = u'plain%d' % n
+    db.session.remove()
+
+    del statements[:]
+    rv = client.post('/admin/plain/edit/?id=%s' % user_id, data=data)
+    eq_(rv.status_code, 302)
+    eq_(statements, ['UPDATE', 'UPDATE'])
+
+
+def test_inline_form_bulk_save_without_backref():
+    app, db, admin = setup()
+    client = app.test_client()
+
+    class UserInfo(db.Model):
+        __tablename__ = 'user_info'
+        id = db.Column(db.Integer, primary_key=True)
+        key = db.Column(db.String, nullable=False)
+        user_id = db.Column(db.Integer, db.ForeignKey('users.id'))
+        user = db.relationship('User')
+
+    class User(db.Model):
+        __tablename__ = 'users'
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String)
+        info = db.relationship(UserInfo)
+
+    db.create_all()
+
+    class UserModelView(ModelView):
+        inline_models = ((UserInfo, dict(bulk_save=True)),)
+
+    admin.add_view(UserModelView(User, db.session))
+
+    user = User(name=u'user')
+    db.session.add(user)
+    db.session.commit()
+    user_id = user.id
+    db.session.remove()
+
+    data = {'name': u'changed', 'info-0-key': u'first', 'info-1-key': u'second'}
+    rv = client.post('/admin/userview/edit/?id=%s' % user_id, data=data)
+    eq_(rv.status_code, 302)
+
+    infos = UserInfo.query.order_by(UserInfo.id).all()
+    eq_([i.key for i in infos], [u'first', u'second'])
+    eq_([i.user_id for i in infos], [user_id, user_id])
@@ -354,3 +354,104 @@ def test_menu_links():
     data = rv.data.decode('utf-8')
     ok_('TestMenuLink1' in data)
     ok_('TestMenuLink2' in data)
+
+
+def test_access_memoization():
+    app = Flask(__name__)
+    admin = base.Admin(app)
+
+    calls = []
+
+    class CountingView(MockView):
+        def is_accessible(self):
+            calls.append(self.endpoint)
+            return True
+
+    admin.add_view(CountingView(name='Test 1', category='Test', endpoint='test1'))
+    admin.add_view(CountingView(name='Test 2', endpoint='test2'))
+
+    client = app.test_client()
+
+    # View and its menu item are checked once
+    rv = client.get('/admin/test1/')
+    eq_(rv.status_code, 200)
+    eq_(calls, ['test1'])
+
+    rv = client.get('/admin/')
+    eq_(rv.status_code, 200)
+    eq_(sorted(calls), ['test1', 'test1', 'test2'])
+
+    # Every request checks accessibility again
+    rv = client.get('/admin/')
+    eq_(sorted(calls), ['test1', 'test1', 'test1', 'test2', 'test2'])
+
+
+def test_menu_cache():
+    app = Flask(__name__)
+    admin = base.Admin(app)
+
+    view = MockView(name='TestMenuItem', endpoint='test1')
+    admin.add_view(view)
+
+    roles = ['user']
+
+    @admin.menu_role
+    def menu_role():
+        return roles[0]
+
+    client = app.test_client()
+
+    rv = client.get('/admin/')
+    ok_('TestMenuItem' in rv.data.decode('utf-8'))
+
+    # Cached menu is rendered for the same role and view
+    view.visible = False
+    rv = client.get('/admin/')
+    ok_('TestMenuItem' in rv.data.decode('utf-8'))
+
+    roles[0] = 'guest'
+    rv = client.get('/admin/')
+    ok_('TestMenuItem' not in rv.data.decode('utf-8'))
+
+    # Menu is not shared between script roots
+    roles[0] = 'user'
+    rv = client.get('/admin/', base_url='http://localhost/app')
+    ok_('TestMenuItem' not in rv.data.decode('utf-8'))
+
+    rv = client.get('/admin/')
+    ok_('TestMenuItem' in rv.data.decode('utf-8'))
+
+    # Without SERVER_NAME the Host header is not part of the key
+    rv = client.get('/admin/', base_url='http://other.example.com/')
+    ok_('TestMenuItem' in rv.data.decode('utf-8'))
+
+    # Least recently used menus are dropped
+    admin.menu_cache_size = 2
+    for root in ('a', 'b', 'c'):
+        client.get('/admin/', base_url='http://localhost/' + root)
+    eq_(len(admin._menu_cache), 2)
+    eq_([key[3] for key in admin._menu_cache], ['/b', '/c'])
+
+
+def test_menu_cache_server_name():
+    app = Flask(__name__)
+    app.config['SERVER_NAME'] = 'example.com'
+    admin = base.Admin(app)
+
+    admin.add_view(MockView(name='TestMenuItem', endpoint='test1'))
+
+    @admin.menu_role
+    def menu_role():
+        return 'user'
+
+    client = app.test_client()
+
+    # The host is checked by routing and becomes part of the key
+    rv = client.get('/admin/', base_url='http://example.com/')
+    eq_(rv.status_code, 200)
+    ok_('TestMenuItem' in rv.data.decode('utf-8'))
+    eq_([key[2] for key in admin._menu_cache], ['example.com'])
+
+    rv = client.get('/admin/', base_url='http://other.example.com/')
+    eq_(rv.status_code, 404)
+    eq_(len(admin._menu_cache), 1)
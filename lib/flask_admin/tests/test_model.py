@@ -197,6 +197,77 @@ def test_permissions():
     eq_(rv.status_code, 302)
 
 
+def test_export():
+    app, admin = setup()
+
+    view = MockModelView(Model, column_list=['col1', 'col3'],
+                         column_formatters=dict(col3=lambda v, c, m, p: m.col3 * 2))
+    admin.add_view(view)
+
+    client = app.test_client()
+
+    rv = client.get('/admin/modelview/export/csv/')
+    eq_(rv.status_code, 404)
+
+    view.can_export = True
+
+    rv = client.get('/admin/modelview/')
+    ok_('/admin/modelview/export/csv/' in rv.data.decode('utf-8'))
+
+    rv = client.get('/admin/modelview/export/csv/')
+    eq_(rv.status_code, 200)
+    eq_(rv.mimetype, 'text/csv')
+    eq_(rv.data.decode('utf-8').splitlines(),
+        ['Col1,Col3', '1,6', '1,6'])
+
+    rv = client.get('/admin/modelview/export/json/')
+    eq_(rv.status_code, 200)
+    eq_(rv.mimetype, 'application/json')
+    eq_(rv.data.decode('utf-8').count('"col3": "6"'), 2)
+
+    rv = client.get('/admin/modelview/export/xml/')
+    eq_(rv.status_code, 404)
+
+    # unpaged views return all models with the first page
+    view.page_size = None
+    rv = client.get('/admin/modelview/export/csv/')
+    eq_(rv.data.decode('utf-8').splitlines(),
+        ['Col1,Col3', '1,6', '1,6'])
+
+    model = Model(1, c1=True, c2=None)
+    eq_(view.get_export_value(model, 'col1'), u'True')
+    eq_(view.get_export_value(model, 'col2'), u'')
+    model.col1 = False
+    eq_(view.get_export_value(model, 'col1'), u'False')
+
+
+def test_list_rows():
+    app, admin = setup()
+
+    view = MockModelView(Model, column_list=['col1', 'col2', 'col3'],
+                         column_choices=dict(col2=[(2, 'two')]),
+                         column_formatters=dict(col3=lambda v, c, m, p: m.col3 * 2))
+    admin.add_view(view)
+
+    model = Model(5, c1=None)
+    rows = view.get_list_rows(None, [model])
+
+    eq_(rows, [(model, 5, ['', 'two', 6])])
+    eq_(rows[0][2], [view.get_list_value(None, model, c)
+                     for c in ('col1', 'col2', 'col3')])
+
+    class CustomValueView(MockModelView):
+        def get_list_value(self, context, model, name):
+            return 'custom'
+
+    view = CustomValueView(Model, column_list=['col1'], endpoint='custom')
+    eq_(view.get_list_rows(None, [model]), [(model, 5, ['custom'])])
+
+    client = app.test_client()
+    rv = client.get('/admin/modelview/')
+    ok_('/admin/modelview/edit/?url=%2Fadmin%2Fmodelview%2F&amp;id=1' in rv.data.decode('utf-8'))
+
+
 def test_templates():
     app, admin = setup()
 
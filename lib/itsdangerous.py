@@ -238,9 +238,17 @@ class HMACAlgorithm(SigningAlgorithm):
         if digest_method is None:
             digest_method = self.default_digest_method
         self.digest_method = digest_method
+        self._mac = None
 
     def get_signature(self, key, value):
-        mac = hmac.new(key, msg=value, digestmod=self.digest_method)
+        # The keyed HMAC state is prepared once per key and copied for
+        # every signature instead of hashing the padded key each time.
+        cached = self._mac
+        if cached is None or cached[0] != key:
+            cached = self._mac = (key, hmac.new(key,
+                                                digestmod=self.digest_method))
+        mac = cached[1].copy()
+        mac.update(value)
         return mac.digest()
 
 
@@ -293,6 +301,19 @@ class Signer(object):
         if algorithm is None:
             algorithm = HMACAlgorithm(self.digest_method)
         self.algorithm = algorithm
+        self._derived_key = None
+
+    def _get_key(self):
+        """Returns the result of :meth:`derive_key`.  The derived key is
+        remembered until the secret key, salt or derivation settings of
+        the signer change.
+        """
+        params = (self.secret_key, self.salt, self.key_derivation,
+                  self.digest_method)
+        cached = self._derived_key
+        if cached is None or cached[0] != params:
+            cached = self._derived_key = (params, self.derive_key())
+        return cached[1]
 
     def derive_key(self):
         """This method is called to derive the key.  If you're unhappy with
@@ -319,7 +340,7 @@ class Signer(object):
     def get_signature(self, value):
         """Returns the signature for the given value"""
         value = want_bytes(value)
-        key = self.derive_key()
+        key = self._get_key()
         sig = self.algorithm.get_signature(key, value)
         return base64_encode(sig)
 
@@ -329,7 +350,7 @@ class Signer(object):
 
     def verify_signature(self, value, sig):
         """Verifies the signature for the given value."""
-        key = self.derive_key()
+        key = self._get_key()
         sig = base64_decode(sig)
         return self.algorithm.verify_signature(key, value, sig)
 
@@ -493,6 +514,7 @@ class Serializer(object):
             signer = self.default_signer
         self.signer = signer
         self.signer_kwargs = signer_kwargs or {}
+        self._signer = None
 
     def load_payload(self, payload, serializer=None):
         """Loads the encoded object.  This function raises :class:`BadPayload`
@@ -527,7 +549,16 @@ class Serializer(object):
         """
         if salt is None:
             salt = self.salt
-        return self.signer(self.secret_key, salt=salt, **self.signer_kwargs)
+        if salt != self.salt:
+            return self.signer(self.secret_key, salt=salt, **self.signer_kwargs)
+        # Signers are stateless apart from their key caches, so the one for
+        # the default salt is reused across dumps and loads calls.
+        params = (self.secret_key, salt)
+        cached = self._signer
+        if cached is None or cached[0] != params:
+            cached = self._signer = (params, self.signer(
+                self.secret_key, salt=salt, **self.signer_kwargs))
+        return cached[1]
 
     def dumps(self, obj, salt=None):
         """Returns a signed string serialized with the internal serializer.
@@ -41,7 +41,7 @@ __version__ = '0.9.3'
 all_by_module = {
     'werkzeug.debug':       ['DebuggedApplication'],
     'werkzeug.local':       ['Local', 'LocalManager', 'LocalProxy',
-                             'LocalStack', 'release_local'],
+                             'LocalStack', 'release_local', 'bind_proxies'],
     'werkzeug.serving':     ['run_simple'],
     'werkzeug.test':        ['Client', 'EnvironBuilder', 'create_environ',
                              'run_wsgi_app'],
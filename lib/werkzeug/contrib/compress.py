@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+    werkzeug.contrib.compress
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A middleware that compresses responses with ``gzip`` or ``deflate`` if
+    the client accepts it.  The body is compressed chunk by chunk while the
+    application produces it, so streamed responses are never buffered::
+
+        from werkzeug.contrib.compress import CompressionMiddleware
+        app = CompressionMiddleware(app, compress_level=6)
+
+    Only responses with a textual mimetype are compressed.  Small responses
+    and responses that already carry a ``Content-Encoding`` are passed
+    through unchanged.
+
+    .. versionadded:: 0.9.4
+
+    :copyright: (c) 2013 by the Werkzeug Team, see AUTHORS for more details.
+    :license: BSD, see LICENSE for more details.
+"""
+import re
+import zlib
+
+from werkzeug.http import parse_accept_header, parse_options_header, \
+     parse_cache_control_header, unquote_etag, quote_etag
+from werkzeug.wsgi import ClosingIterator
+from werkzeug.datastructures import Headers
+
+
+_weak_etag_re = re.compile(r'(?i)W/(")')
+
+#: the mimetypes that are compressed by default.  Subtypes ending in
+#: ``+xml`` or ``+json`` are compressed as well.
+default_mimetypes = frozenset([
+    'text/html', 'text/plain', 'text/css', 'text/xml', 'text/csv',
+    'text/javascript', 'application/javascript', 'application/x-javascript',
+    'application/json', 'application/xml', 'application/rss+xml',
+    'application/atom+xml', 'image/svg+xml'
+])
+
+
+class CompressionMiddleware(object):
+    """Compresses the responses of `app` with the best content coding the
+    client accepts according to its ``Accept-Encoding`` header.  ``gzip``
+    is preferred over ``deflate`` if both have the same quality.
+
+    A response is compressed if its status is ``200``, its mimetype is in
+    `mimetypes`, it has no ``Content-Encoding`` or ``Content-Range`` and
+    its ``Cache-Control`` does not forbid transformations.  If the
+    response has a ``Content-Length`` smaller than `minimum_size` it is
+    sent as it is.  The ``Content-Length`` of compressed responses is
+    removed because it is not known before the body was sent.
+
+    Responses that could be compressed get ``Accept-Encoding`` added to
+    their ``Vary`` header, also if this particular client did not ask for
+    compression, so that caches keep the variants apart.  A strong
+    ``ETag`` of a compressed response is turned into a weak one, because
+    the compressed bytes depend on the compression level.  Weak tags in
+    incoming ``If-None-Match`` headers are passed to the application as
+    strong tags so that it can still answer with ``304 Not Modified``.
+
+    :param app: the WSGI application to wrap.
+    :param compress_level: the zlib compression level from ``1`` (fast) to
+                           ``9`` (small).
+    :param minimum_size: responses with a smaller ``Content-Length`` are not
+                         compressed.
+    :param mimetypes: the mimetypes that may be compressed.  Defaults to
+                      :data:`default_mimetypes`.
+    :param flush_streams: if enabled, the compressed data of every chunk
+                          of a response without ``Content-Length`` is
+                          flushed to the client immediately.  This costs
+                          a few bytes per chunk but keeps streamed
+                          responses responsive.
+    """
+
+    #: the supported content codings and their zlib window bits.
+    encodings = {
+        'gzip':     16 + zlib.MAX_WBITS,
+        'deflate':  zlib.MAX_WBITS
+    }
+
+    def __init__(self, app, compress_level=6, minimum_size=500,
+                 mimetypes=None, flush_streams=True):
+        self.app = app
+        self.compress_level = compress_level
+        self.minimum_size = minimum_size
+        if mimetypes is None:
+            mimetypes = default_mimetypes
+        self.mimetypes = frozenset(mimetypes)
+        self.flush_streams = flush_streams
+
+    def get_encoding(self, environ):
+        """Returns the content coding that should be used for the response
+        to `environ` or `None` if the client does not accept any of the
+        :attr:`encodings`.
+        """
+        value = environ.get('HTTP_ACCEPT_ENCODING')
+        if not value:
+            return None
+        accept = parse_accept_header(value)
+        gzip_quality = accept.quality('gzip')
+        deflate_quality = accept.quality('deflate')
+        if gzip_quality <= 0 and deflate_quality <= 0:
+            return None
+        if gzip_quality >= deflate_quality:
+            return 'gzip'
+        return 'deflate'
+
+    def is_compressible(self, status, headers):
+        """Checks if the response with the given `status` and `headers`
+        could be compressed, ignoring its size.
+        """
+        if not status.startswith('200') or \
+           'content-encoding' in headers or \
+           'content-range' in headers:
+            return False
+        mimetype = parse_options_header(headers.get('content-type'))[0]
+        mimetype = mimetype.lower()
+        if mimetype not in self.mimetypes and \
+           not mimetype.endswith(('+xml', '+json')):
+            return False
+        cache_control = headers.get('cache-control')
+        if cache_control and \
+           parse_cache_control_header(cache_control).no_transform:
+            return False
+        return True
+
+    def make_compressor(self, encoding):
+        """Creates the zlib compression object for `encoding`."""
+        return zlib.compressobj(self.compress_level, zlib.DEFLATED,
+                                self.encodings[encoding])
+
+    def __call__(self, environ, start_response):
+        encoding = self.get_encoding(environ)
+        if encoding is not None and 'HTTP_IF_NONE_MATCH' in environ:
+            environ['HTTP_IF_NONE_MATCH'] = _weak_etag_re.sub(
+                r'\1', environ['HTTP_IF_NONE_MATCH'])
+        # whether the response was started, its compressor and whether
+        # every chunk is flushed.  A list so that the nested functions
+        # can update it.
+        state = [False, None, False]
+
+        def _start_response(status, headers, exc_info=None):
+            headers = Headers(headers)
+            compressor = None
+            flush = False
+            if self.is_compressible(status, headers):
+                length = headers.get('content-length', type=int)
+                if length is None or length >= self.minimum_size:
+                    _add_vary(headers)
+                    if encoding is not None and \
+                       environ.get('REQUEST_METHOD') != 'HEAD':
+                        compressor = self.make_compressor(encoding)
+                        flush = self.flush_streams and length is None
+                        headers['Content-Encoding'] = encoding
+                        headers.pop('content-length', None)
+                        _weaken_etag(headers)
+            elif encoding is not None and status.startswith('304'):
+                _weaken_etag(headers)
+            state[:] = [True, compressor, flush]
+            write = start_response(status, headers.to_wsgi_list(), exc_info)
+
+            def _write(data):
+                compressor = state[1]
+                if compressor is None:
+                    return write(data)
+                # data passed to the write callable has to be sent before
+                # the call returns.
+                write(compressor.compress(data) +
+                      compressor.flush(zlib.Z_SYNC_FLUSH))
+            return _write
+
+        app_iter = self.app(environ, _start_response)
+        # responses that are not compressed are passed through as they are
+        # so that the server can still use its file wrapper for them.
+        if state[0] and state[1] is None:
+            return app_iter
+        return ClosingIterator(self._compress_iter(app_iter, state),
+                               getattr(app_iter, 'close', None))
+
+    def _compress_iter(self, app_iter, state):
+        for item in app_iter:
+            compressor, flush = state[1:]
+            if compressor is None:
+                yield item
+                continue
+            data = compressor.compress(item)
+            if flush:
+                data += compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        compressor = state[1]
+        if compressor is not None:
+            yield compressor.flush()
+
+
+def _add_vary(headers):
+    """Adds ``Accept-Encoding`` to the ``Vary`` header."""
+    vary = headers.get('vary')
+    if not vary:
+        headers['Vary'] = 'Accept-Encoding'
+    elif vary.strip() != '*' and 'accept-encoding' not in \
+         [x.strip().lower() for x in vary.split(',')]:
+        headers['Vary'] = vary + ', Accept-Encoding'
+
+
+def _weaken_etag(headers):
+    """Turns a strong ``ETag`` header into a weak one."""
+    etag = headers.get('etag')
+    if etag:
+        etag, weak = unquote_etag(etag)
+        if not weak:
+            headers['ETag'] = 'W/' + quote_etag(etag)
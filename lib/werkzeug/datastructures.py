@@ -861,8 +861,16 @@ class Headers(object):
     .. versionchanged:: 0.9
        The :meth:`linked` function was removed without replacement as it
        was an API that does not support the changes to the encoding model.
+
+    .. versionchanged:: 0.9.4
+       Lookups by name use an index of the lowercased keys that is built
+       on the first lookup and dropped when the headers are modified.
     """
 
+    #: maps lowercased keys to the positions of their items in `_list`.
+    #: `None` if it has to be rebuilt before the next lookup.
+    _index = None
+
     def __init__(self, defaults=None):
         self._list = []
         if defaults is not None:
@@ -879,10 +887,9 @@ class Headers(object):
                 return self.__class__(self._list[key])
         if not isinstance(key, string_types):
             raise exceptions.BadRequestKeyError(key)
-        ikey = key.lower()
-        for k, v in self._list:
-            if k.lower() == ikey:
-                return v
+        positions = self._get_index().get(key.lower())
+        if positions:
+            return self._list[positions[0]][1]
         # micro optimization: if we are in get mode we will catch that
         # exception one stack level down so we can raise a standard
         # key error instead of our special one.
@@ -890,6 +897,15 @@ class Headers(object):
             raise KeyError()
         raise exceptions.BadRequestKeyError(key)
 
+    def _get_index(self):
+        index = self._index
+        if index is None:
+            index = {}
+            for idx, (key, _) in enumerate(self._list):
+                index.setdefault(key.lower(), []).append(idx)
+            self._index = index
+        return index
+
     def __eq__(self, other):
         return other.__class__ is self.__class__ and \
                set(other._list) == set(self._list)
@@ -952,18 +968,17 @@ class Headers(object):
         :return: a :class:`list` of all the values for the key.
         :param as_bytes: return bytes instead of unicode strings.
         """
-        ikey = key.lower()
         result = []
-        for k, v in self:
-            if k.lower() == ikey:
-                if as_bytes:
-                    v = v.encode('latin1')
-                if type is not None:
-                    try:
-                        v = type(v)
-                    except ValueError:
-                        continue
-                result.append(v)
+        for idx in self._get_index().get(key.lower(), ()):
+            v = self._list[idx][1]
+            if as_bytes:
+                v = v.encode('latin1')
+            if type is not None:
+                try:
+                    v = type(v)
+                except ValueError:
+                    continue
+            result.append(v)
         return result
 
     def get_all(self, name):
@@ -1006,8 +1021,12 @@ class Headers(object):
     def __delitem__(self, key, _index_operation=True):
         if _index_operation and isinstance(key, (integer_types, slice)):
             del self._list[key]
+            self._index = None
             return
         key = key.lower()
+        if key not in self._get_index():
+            return
+        self._index = None
         new = []
         for k, v in self._list:
             if k.lower() != key:
@@ -1031,8 +1050,10 @@ class Headers(object):
         :return: an item.
         """
         if key is None:
+            self._index = None
             return self._list.pop()
         if isinstance(key, integer_types):
+            self._index = None
             return self._list.pop(key)
         try:
             rv = self[key]
@@ -1084,6 +1105,8 @@ class Headers(object):
             _value = _options_header_vkw(_value, kw)
         _value = _unicodify_header_value(_value)
         self._validate_value(_value)
+        if self._index is not None:
+            self._index.setdefault(_key.lower(), []).append(len(self._list))
         self._list.append((_key, _value))
 
     def _validate_value(self, value):
@@ -1104,6 +1127,7 @@ class Headers(object):
     def clear(self):
         """Clears all headers."""
         del self._list[:]
+        self._index = None
 
     def set(self, _key, _value, **kw):
         """Remove all header tuples for `key` and add a new one.  The newly
@@ -1124,11 +1148,17 @@ class Headers(object):
             _value = _options_header_vkw(_value, kw)
         _value = _unicodify_header_value(_value)
         self._validate_value(_value)
-        if not self._list:
+        ikey = _key.lower()
+        positions = self._get_index().get(ikey)
+        if not positions:
+            self._index[ikey] = [len(self._list)]
             self._list.append((_key, _value))
             return
+        if len(positions) == 1:
+            self._list[positions[0]] = (_key, _value)
+            return
+        self._index = None
         listiter = iter(self._list)
-        ikey = _key.lower()
         for idx, (old_key, old_value) in enumerate(listiter):
             if old_key.lower() == ikey:
                 # replace first ocurrence
@@ -1163,6 +1193,7 @@ class Headers(object):
                 self._list[key] = value[0]
             else:
                 self._list[key] = value
+            self._index = None
         else:
             self.set(key, value)
 
@@ -1268,6 +1299,22 @@ class EnvironHeaders(ImmutableHeadersMixin, Headers):
             return _unicodify_header_value(self.environ[key])
         return _unicodify_header_value(self.environ['HTTP_' + key])
 
+    def getlist(self, key, type=None, as_bytes=False):
+        # there is no index as the environment can change, scan it instead.
+        ikey = key.lower()
+        result = []
+        for k, v in self:
+            if k.lower() == ikey:
+                if as_bytes:
+                    v = v.encode('latin1')
+                if type is not None:
+                    try:
+                        v = type(v)
+                    except ValueError:
+                        continue
+                result.append(v)
+        return result
+
     def __len__(self):
         # the iter is necessary because otherwise list calls our
         # len which would call list again and so forth.
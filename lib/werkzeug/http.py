@@ -646,8 +646,19 @@ def parse_etags(value):
 
 
 def generate_etag(data):
-    """Generate an etag for some data."""
-    return md5(data).hexdigest()
+    """Generate an etag for some data.
+
+    .. versionchanged:: 0.9.4
+       `data` can also be an iterable of bytestrings that is hashed chunk
+       by chunk without joining it first.  The result is the same as for
+       the joined data.
+    """
+    if isinstance(data, (bytes, bytearray, text_type)):
+        return md5(data).hexdigest()
+    h = md5()
+    for chunk in data:
+        h.update(chunk)
+    return h.hexdigest()
 
 
 def parse_date(value):
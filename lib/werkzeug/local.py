@@ -9,6 +9,7 @@
     :license: BSD, see LICENSE for more details.
 """
 from functools import update_wrapper
+from threading import local as _thread_local
 from werkzeug.wsgi import ClosingIterator
 from werkzeug._compat import PY2, implements_bool
 
@@ -22,6 +23,26 @@ except ImportError:
         from thread import get_ident
     except ImportError:
         from _thread import get_ident
+    _thread_idents = True
+else:
+    _thread_idents = False
+
+
+def bind_proxies(*proxies):
+    """Looks up the current objects of the given bindable
+    :class:`LocalProxy` objects and binds them to the proxies in the current
+    context while the returned context manager is active.  This is useful
+    if the proxies are used a lot for a while, like in a template::
+
+        with bind_proxies(request, user):
+            rv = template.render(context)
+
+    While they are bound the proxies keep returning the same objects, also
+    if another object becomes the current one in the meantime.
+
+    .. versionadded:: 0.9.4
+    """
+    return _ProxyBinding(proxies)
 
 
 def release_local(local):
@@ -47,6 +68,33 @@ def release_local(local):
     local.__release_local__()
 
 
+class _ProxyBinding(object):
+    """The context manager returned by :func:`bind_proxies`."""
+
+    def __init__(self, proxies):
+        for proxy in proxies:
+            if object.__getattribute__(proxy, '_LocalProxy__bound') is None:
+                raise TypeError('%s is not bindable' %
+                                object.__getattribute__(proxy, '__name__'))
+        self.proxies = proxies
+
+    def __enter__(self):
+        ident = get_ident()
+        objects = [proxy._get_current_object() for proxy in self.proxies]
+        for proxy, obj in zip(self.proxies, objects):
+            bound = object.__getattribute__(proxy, '_LocalProxy__bound')
+            bound.setdefault(ident, []).append(obj)
+
+    def __exit__(self, exc_type, exc_value, tb):
+        ident = get_ident()
+        for proxy in self.proxies:
+            bound = object.__getattribute__(proxy, '_LocalProxy__bound')
+            stack = bound[ident]
+            stack.pop()
+            if not stack:
+                del bound[ident]
+
+
 class Local(object):
     __slots__ = ('__storage__', '__ident_func__')
 
@@ -85,6 +133,11 @@ class Local(object):
             raise AttributeError(name)
 
 
+class _StackCache(_thread_local):
+    """The stack of a :class:`LocalStack` for the current thread."""
+    stack = None
+
+
 class LocalStack(object):
     """This class works similar to a :class:`Local` but keeps a stack
     of objects instead.  This is best explained with an example::
@@ -109,19 +162,32 @@ class LocalStack(object):
     By calling the stack without arguments it returns a proxy that resolves to
     the topmost item on the stack.
 
+    If the contexts are threads the stack of the current thread is also
+    kept in a :class:`threading.local`, which makes looking up the
+    topmost item a lot faster.  That is not possible with greenlets or a
+    custom ident function.
+
     .. versionadded:: 0.6.1
+
+    .. versionchanged:: 0.9.4
+       The stack of the current thread is cached in a thread local.
     """
 
     def __init__(self):
         self._local = Local()
+        self._cache = _thread_idents and _StackCache() or None
 
     def __release_local__(self):
         self._local.__release_local__()
+        if self._cache is not None:
+            self._cache.stack = None
 
     def _get__ident_func__(self):
         return self._local.__ident_func__
     def _set__ident_func__(self, value):
         object.__setattr__(self._local, '__ident_func__', value)
+        # the contexts are not threads anymore
+        self._cache = None
     __ident_func__ = property(_get__ident_func__, _set__ident_func__)
     del _get__ident_func__, _set__ident_func__
 
@@ -138,6 +204,8 @@ class LocalStack(object):
         rv = getattr(self._local, 'stack', None)
         if rv is None:
             self._local.stack = rv = []
+        if self._cache is not None:
+            self._cache.stack = rv
         rv.append(obj)
         return rv
 
@@ -150,6 +218,8 @@ class LocalStack(object):
             return None
         elif len(stack) == 1:
             release_local(self._local)
+            if self._cache is not None:
+                self._cache.stack = None
             return stack[-1]
         else:
             return stack.pop()
@@ -159,6 +229,12 @@ class LocalStack(object):
         """The topmost item on the stack.  If the stack is empty,
         `None` is returned.
         """
+        cache = self._cache
+        if cache is not None:
+            stack = cache.stack
+            if stack:
+                return stack[-1]
+            return None
         try:
             return self._local.stack[-1]
         except (AttributeError, IndexError):
@@ -279,26 +355,46 @@ class LocalProxy(object):
 
         session = LocalProxy(lambda: get_current_request().session)
 
+    If `bindable` is enabled the object of the proxy can be looked up once
+    and bound to it in the current context for a while with
+    :func:`bind_proxies`, every operation on the proxy then skips the
+    lookup.
+
     .. versionchanged:: 0.6.1
        The class can be instanciated with a callable as well now.
+
+    .. versionchanged:: 0.9.4
+       The `bindable` parameter was added.
     """
-    __slots__ = ('__local', '__dict__', '__name__')
+    __slots__ = ('__local', '__dict__', '__name__', '__lookup', '__bound')
 
-    def __init__(self, local, name=None):
+    def __init__(self, local, name=None, bindable=False):
         object.__setattr__(self, '_LocalProxy__local', local)
         object.__setattr__(self, '__name__', name)
+        if hasattr(local, '__release_local__'):
+            def lookup():
+                try:
+                    return getattr(local, name)
+                except AttributeError:
+                    raise RuntimeError('no object bound to %s' % name)
+        else:
+            lookup = local
+        object.__setattr__(self, '_LocalProxy__lookup', lookup)
+        # context ident -> stack of bound objects
+        object.__setattr__(self, '_LocalProxy__bound',
+                           {} if bindable else None)
 
     def _get_current_object(self):
         """Return the current object.  This is useful if you want the real
         object behind the proxy at a time for performance reasons or because
         you want to pass the object into a different context.
         """
-        if not hasattr(self.__local, '__release_local__'):
-            return self.__local()
-        try:
-            return getattr(self.__local, self.__name__)
-        except AttributeError:
-            raise RuntimeError('no object bound to %s' % self.__name__)
+        bound = self.__bound
+        if bound:
+            stack = bound.get(get_ident())
+            if stack:
+                return stack[-1]
+        return self.__lookup()
 
     @property
     def __dict__(self):
@@ -13,10 +13,12 @@ import hmac
 import hashlib
 import posixpath
 import codecs
+import binascii
+from time import time
 from struct import Struct
 from random import SystemRandom
-from operator import xor
-from itertools import starmap
+from threading import Lock
+from collections import OrderedDict
 
 from werkzeug._compat import range_type, PY2, text_type, izip, to_bytes, \
      string_types, to_native
@@ -28,6 +30,7 @@ DEFAULT_PBKDF2_ITERATIONS = 1000
 
 _pack_int = Struct('>I').pack
 _builtin_safe_str_cmp = getattr(hmac, 'compare_digest', None)
+_builtin_pbkdf2_hmac = getattr(hashlib, 'pbkdf2_hmac', None)
 _sys_rng = SystemRandom()
 _os_alt_seps = list(sep for sep in [os.path.sep, os.path.altsep]
                     if sep not in (None, '/'))
@@ -87,22 +90,53 @@ def pbkdf2_bin(data, salt, iterations=DEFAULT_PBKDF2_ITERATIONS,
         hashfunc = _hash_funcs[hashfunc]
     elif not hashfunc:
         hashfunc = hashlib.sha1
+    data = to_bytes(data)
     salt = to_bytes(salt)
-    mac = hmac.HMAC(to_bytes(data), None, hashfunc)
+
+    if _builtin_pbkdf2_hmac is not None:
+        name = _get_hash_name(hashfunc)
+        if name is not None:
+            try:
+                return _builtin_pbkdf2_hmac(name, data, salt, iterations,
+                                            keylen or None)
+            except ValueError:
+                # OpenSSL does not know the digest, derive it ourselves.
+                pass
+    return _pbkdf2_bin_python(data, salt, iterations, keylen, hashfunc)
+
+
+def _get_hash_name(hashfunc):
+    """Returns the hashlib name of `hashfunc` or `None` if it does not
+    look like a hashlib constructor.
+    """
+    try:
+        return hashfunc().name
+    except Exception:
+        return None
+
+
+def _pbkdf2_bin_python(data, salt, iterations, keylen, hashfunc):
+    """Pure Python PBKDF2 used if :func:`hashlib.pbkdf2_hmac` is missing
+    or does not support the hash function.  The blocks are XORed as
+    integers instead of byte by byte.
+    """
+    mac = hmac.HMAC(data, None, hashfunc)
     if not keylen:
         keylen = mac.digest_size
+    hexlen = mac.digest_size * 2
     def _pseudorandom(x, mac=mac):
         h = mac.copy()
         h.update(x)
-        return bytearray(h.digest())
-    buf = bytearray()
+        return h.digest()
+    buf = []
     for block in range_type(1, -(-keylen // mac.digest_size) + 1):
-        rv = u = _pseudorandom(salt + _pack_int(block))
+        u = _pseudorandom(salt + _pack_int(block))
+        rv = int(binascii.hexlify(u), 16)
         for i in range_type(iterations - 1):
-            u = _pseudorandom(bytes(u))
-            rv = bytearray(starmap(xor, izip(rv, u)))
-        buf.extend(rv)
-    return bytes(buf[:keylen])
+            u = _pseudorandom(u)
+            rv ^= int(binascii.hexlify(u), 16)
+        buf.append(binascii.unhexlify(('%0*x' % (hexlen, rv)).encode('ascii')))
+    return b''.join(buf)[:keylen]
 
 
 def safe_str_cmp(a, b):
@@ -207,7 +241,66 @@ def generate_password_hash(password, method='pbkdf2:sha1', salt_length=8):
     return '%s$%s$%s' % (actual_method, salt, h)
 
 
-def check_password_hash(pwhash, password):
+class PasswordHashCache(object):
+    """A bounded cache of successful password verifications that can be
+    passed to :func:`check_password_hash`.  This is useful for API keys
+    or HTTP basic auth where the same credentials are checked on every
+    request and the PBKDF2 derivation would otherwise dominate::
+
+        verify_cache = PasswordHashCache(maxsize=1000, timeout=300)
+
+        if check_password_hash(user.pwhash, password, cache=verify_cache):
+            ...
+
+    Neither the password nor the hash is stored.  Entries are keyed by an
+    HMAC of both under a random key that only lives in this process, and
+    only successful checks are remembered.  Entries expire after `timeout`
+    seconds and the least recently used entry is dropped once `maxsize`
+    entries are stored.
+
+    .. versionadded:: 0.9.4
+
+    :param maxsize: the maximum number of remembered verifications.
+    :param timeout: the number of seconds an entry is valid.
+    """
+
+    def __init__(self, maxsize=1024, timeout=300):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._key = os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def _get_key(self, pwhash, password):
+        msg = to_bytes(pwhash, 'utf-8') + b'\x00' + to_bytes(password, 'utf-8')
+        return hmac.HMAC(self._key, msg, hashlib.sha256).digest()
+
+    def lookup(self, pwhash, password):
+        """Returns `True` if the combination was verified recently."""
+        key = self._get_key(pwhash, password)
+        with self._lock:
+            expires = self._entries.pop(key, None)
+            if expires is None or expires < time():
+                return False
+            self._entries[key] = expires
+        return True
+
+    def remember(self, pwhash, password):
+        """Remembers a successful verification."""
+        key = self._get_key(pwhash, password)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = time() + self.timeout
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forgets all remembered verifications."""
+        with self._lock:
+            self._entries.clear()
+
+
+def check_password_hash(pwhash, password, cache=None):
     """check a password against a given salted and hashed password value.
     In order to support unsalted legacy passwords this method supports
     plain text passwords, md5 and sha1 hashes (both salted and unsalted).
@@ -217,11 +310,18 @@ def check_password_hash(pwhash, password):
     :param pwhash: a hashed string like returned by
                    :func:`generate_password_hash`
     :param password: the plaintext password to compare against the hash
+    :param cache: an optional :class:`PasswordHashCache` that remembers
+                  successful checks so they can skip the derivation.
     """
     if pwhash.count('$') < 2:
         return False
+    if cache is not None and cache.lookup(pwhash, password):
+        return True
     method, salt, hashval = pwhash.split('$', 2)
-    return safe_str_cmp(_hash_internal(method, salt, password)[0], hashval)
+    rv = safe_str_cmp(_hash_internal(method, salt, password)[0], hashval)
+    if rv and cache is not None:
+        cache.remember(pwhash, password)
+    return rv
 
 
 def safe_join(directory, filename):
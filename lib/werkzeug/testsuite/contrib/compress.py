@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+    werkzeug.testsuite.compress
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Tests the response compression middleware.
+
+    :copyright: (c) 2013 by Armin Ronacher.
+    :license: BSD, see LICENSE for more details.
+"""
+import zlib
+import unittest
+
+from werkzeug.testsuite import WerkzeugTestCase
+
+from werkzeug.test import Client
+from werkzeug.wrappers import Request, Response, BaseResponse
+from werkzeug.contrib.compress import CompressionMiddleware
+
+
+page = b'<p>' + b'Hello World! ' * 200 + b'</p>'
+
+
+@Request.application
+def page_app(request):
+    response = Response(page, mimetype='text/html')
+    response.set_etag('page')
+    return response.make_conditional(request)
+
+
+@Request.application
+def image_app(request):
+    return Response(page, mimetype='image/png')
+
+
+@Request.application
+def small_app(request):
+    return Response(b'<p>small</p>', mimetype='text/html')
+
+
+@Request.application
+def streaming_app(request):
+    return Response((('line %d\n' % x).encode('ascii') for x in range(100)),
+                    mimetype='text/plain')
+
+
+class CompressionMiddlewareTestCase(WerkzeugTestCase):
+
+    def test_negotiation(self):
+        mw = CompressionMiddleware(page_app)
+        get = lambda x: mw.get_encoding({'HTTP_ACCEPT_ENCODING': x})
+        self.assert_equal(mw.get_encoding({}), None)
+        self.assert_equal(get('gzip, deflate'), 'gzip')
+        self.assert_equal(get('deflate'), 'deflate')
+        self.assert_equal(get('gzip;q=0.5, deflate'), 'deflate')
+        self.assert_equal(get('*'), 'gzip')
+        self.assert_equal(get('gzip;q=0, identity'), None)
+        self.assert_equal(get('br'), None)
+
+    def test_gzip_response(self):
+        c = Client(CompressionMiddleware(page_app), BaseResponse)
+        rv = c.get('/', headers={'Accept-Encoding': 'gzip'})
+        self.assert_equal(rv.headers['Content-Encoding'], 'gzip')
+        self.assert_equal(rv.headers['Vary'], 'Accept-Encoding')
+        self.assert_not_in('Content-Length', rv.headers)
+        self.assert_equal(rv.headers['ETag'], 'W/"page"')
+        data = rv.get_data()
+        self.assert_true(len(data) < len(page))
+        self.assert_equal(zlib.decompress(data, 16 + zlib.MAX_WBITS), page)
+
+        rv = c.get('/', headers={'Accept-Encoding': 'gzip',
+                                 'If-None-Match': 'W/"page"'})
+        self.assert_equal(rv.status_code, 304)
+        self.assert_equal(rv.headers['ETag'], 'W/"page"')
+
+    def test_deflate_response(self):
+        c = Client(CompressionMiddleware(page_app), BaseResponse)
+        rv = c.get('/', headers={'Accept-Encoding': 'deflate'})
+        self.assert_equal(rv.headers['Content-Encoding'], 'deflate')
+        self.assert_equal(zlib.decompress(rv.get_data()), page)
+
+    def test_uncompressed_responses(self):
+        c = Client(CompressionMiddleware(page_app), BaseResponse)
+        rv = c.get('/')
+        self.assert_not_in('Content-Encoding', rv.headers)
+        self.assert_equal(rv.headers['Vary'], 'Accept-Encoding')
+        self.assert_equal(rv.headers['ETag'], '"page"')
+        self.assert_equal(rv.get_data(), page)
+
+        for app in image_app, small_app:
+            c = Client(CompressionMiddleware(app), BaseResponse)
+            rv = c.get('/', headers={'Accept-Encoding': 'gzip'})
+            self.assert_not_in('Content-Encoding', rv.headers)
+            self.assert_not_in('Vary', rv.headers)
+
+    def test_streaming_response(self):
+        mw = CompressionMiddleware(streaming_app)
+        app_iter, status, headers = Client(mw).get(
+            '/', headers={'Accept-Encoding': 'gzip'})
+        chunks = list(app_iter)
+        app_iter.close()
+        self.assert_equal(headers['Content-Encoding'], 'gzip')
+        # every chunk of the application is flushed on its own
+        self.assert_equal(len(chunks), 101)
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self.assert_equal(decompressor.decompress(chunks[0]), b'line 0\n')
+        self.assert_equal(decompressor.decompress(b''.join(chunks[1:])),
+                          ''.join('line %d\n' % x for x in range(1, 100))
+                          .encode('ascii'))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(CompressionMiddlewareTestCase))
+    return suite
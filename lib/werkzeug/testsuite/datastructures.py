@@ -621,6 +621,36 @@ class HeadersTestCase(WerkzeugTestCase):
         self.assert_equal(h.get('x-foo-poo', as_bytes=True), b'bleh')
         self.assert_equal(h.get('x-whoops', as_bytes=True), b'\xff')
 
+    def test_lookup_index(self):
+        h = self.storage_class([('X-Foo', '1'), ('Set-Cookie', 'a=1')])
+        self.assert_equal(h['x-foo'], '1')
+        h.add('set-cookie', 'b=2')
+        h.add('X-Bar', '2')
+        self.assert_equal(h.getlist('Set-Cookie'), ['a=1', 'b=2'])
+        self.assert_equal(h['x-bar'], '2')
+
+        h.set('X-FOO', '3')
+        self.assert_equal(h['x-foo'], '3')
+        self.assert_equal(h[0], ('X-FOO', '3'))
+        h.set('Set-Cookie', 'c=3')
+        self.assert_equal(h.getlist('set-cookie'), ['c=3'])
+        self.assert_equal(h['x-bar'], '2')
+
+        del h[0]
+        self.assert_true('x-foo' not in h)
+        self.assert_equal(h['set-cookie'], 'c=3')
+        h[0] = ('X-Baz', '4')
+        self.assert_true('set-cookie' not in h)
+        self.assert_equal(h['x-baz'], '4')
+        h.remove('x-baz')
+        h.remove('x-missing')
+        self.assert_equal(h.pop(), ('X-Bar', '2'))
+        self.assert_true('x-bar' not in h)
+        h.add('X-Bar', '5')
+        self.assert_equal(h.getlist('x-bar'), ['5'])
+        h.clear()
+        self.assert_equal(h.get('x-bar'), None)
+
 
 class EnvironHeadersTestCase(WerkzeugTestCase):
     storage_class = datastructures.EnvironHeaders
@@ -669,6 +699,7 @@ class EnvironHeadersTestCase(WerkzeugTestCase):
 
         self.assert_equal(h.get('x-foo', as_bytes=True), b'\xff')
         self.assert_equal(h.get('x-foo'), u'\xff')
+        self.assert_equal(h.getlist('X-Foo'), [u'\xff'])
 
 
 class HeaderSetTestCase(WerkzeugTestCase):
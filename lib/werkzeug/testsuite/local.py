@@ -152,6 +152,60 @@ class LocalTestCase(WerkzeugTestCase):
         stack.pop()
         assert stack.top is None
 
+    def test_local_stack_threads(self):
+        ls = local.LocalStack()
+        ls.push(42)
+        tops = []
+        def push_pop():
+            tops.append(ls.top)
+            ls.push(23)
+            tops.append(ls.top)
+            ls.pop()
+            tops.append(ls.top)
+        thread = Thread(target=push_pop)
+        thread.start()
+        thread.join()
+        assert tops == [None, 23, None]
+        assert ls.top == 42
+
+        mgr = local.LocalManager([ls])
+        mgr.cleanup()
+        assert ls.top is None
+        ls.push(23)
+        assert ls.top == 23
+        ls.pop()
+        assert ls.top is None
+
+    def test_bind_proxies(self):
+        value = [42]
+        proxy = local.LocalProxy(lambda: value[0], bindable=True)
+        with local.bind_proxies(proxy):
+            value[0] = 23
+            assert proxy == 42
+            # binding again keeps the bound object
+            with local.bind_proxies(proxy):
+                assert proxy == 42
+                # other threads look up their own object
+                values = []
+                thread = Thread(target=lambda: values.append(proxy + 0))
+                thread.start()
+                thread.join()
+                assert values == [23]
+                value[0] = 1
+            assert proxy == 42
+        assert proxy == 1
+
+        unbound = local.LocalProxy(lambda: value[0])
+        self.assert_raises(TypeError, local.bind_proxies, unbound)
+
+        # nothing is bound if one of the proxies is unbound
+        loc = local.Local()
+        missing = local.LocalProxy(loc, 'missing', bindable=True)
+        binding = local.bind_proxies(proxy, missing)
+        self.assert_raises(RuntimeError, binding.__enter__)
+        value[0] = 2
+        assert proxy == 2
+
 
 def suite():
     suite = unittest.TestSuite()
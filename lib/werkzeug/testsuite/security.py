@@ -14,7 +14,8 @@ import unittest
 from werkzeug.testsuite import WerkzeugTestCase
 
 from werkzeug.security import check_password_hash, generate_password_hash, \
-     safe_join, pbkdf2_hex
+     safe_join, pbkdf2_hex, PasswordHashCache
+from werkzeug import security
 
 
 class SecurityTestCase(WerkzeugTestCase):
@@ -90,6 +91,36 @@ class SecurityTestCase(WerkzeugTestCase):
         check('X' * 65, 'pass phrase exceeds block size', 1200, 32,
               '9ccad6d468770cd51b10e6a68721be611a8b4d282601db3b36be9246915ec82a')
 
+    def test_pbkdf2_python_fallback(self):
+        for hashfunc in 'sha1', 'sha256', 'md5':
+            for iterations, keylen in (1, None), (2, 20), (50, 70):
+                expected = security.pbkdf2_bin('password', 'salt', iterations,
+                                               keylen, hashfunc)
+                rv = security._pbkdf2_bin_python(
+                    b'password', b'salt', iterations, keylen,
+                    security._hash_funcs[hashfunc])
+                self.assert_equal(rv, expected)
+
+    def test_password_hash_cache(self):
+        cache = PasswordHashCache(maxsize=2)
+        hashes = [generate_password_hash('secret%d' % x) for x in range(3)]
+
+        assert check_password_hash(hashes[0], 'secret0', cache=cache)
+        assert cache.lookup(hashes[0], 'secret0')
+        assert not cache.lookup(hashes[0], 'secret1')
+        assert not check_password_hash(hashes[0], 'secret1', cache=cache)
+        assert not cache.lookup(hashes[0], 'secret1')
+
+        assert check_password_hash(hashes[1], 'secret1', cache=cache)
+        assert check_password_hash(hashes[2], 'secret2', cache=cache)
+        assert not cache.lookup(hashes[0], 'secret0')
+        assert cache.lookup(hashes[2], 'secret2')
+
+        cache.timeout = -1
+        cache.clear()
+        assert check_password_hash(hashes[1], 'secret1', cache=cache)
+        assert not cache.lookup(hashes[1], 'secret1')
+
 
 def suite():
     suite = unittest.TestSuite()
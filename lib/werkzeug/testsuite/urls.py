@@ -58,6 +58,24 @@ class URLsTestCase(WerkzeugTestCase):
         x = urls.url_decode(b'%C3%9Ch=H%C3%A4nsel', decode_keys=True)
         self.assert_strict_equal(x[u'Üh'], u'Hänsel')
 
+    def test_url_decoding_unescaped_pairs(self):
+        x = urls.url_decode(b'a=1&b+c=d+e&f=g%26h&\xc3\xa4=%C3%A4&i&j=')
+        self.assert_equal(sorted(x.items(multi=True)), sorted([
+            ('a', u'1'), ('b c', u'd e'), ('f', u'g&h'),
+            (urls.url_unquote(b'%C3%A4'), u'\xe4'), ('i', u''), ('j', u'')]))
+        self.assert_strict_equal(x['a'], u'1')
+        for key in x:
+            if key in ('a', 'i', 'j'):
+                self.assert_true(isinstance(key, str))
+        x = urls.url_decode(u'a=1&b=%C3%A4&c=\xe4')
+        self.assert_strict_equal(x['a'], u'1')
+        self.assert_strict_equal(x['b'], u'\xe4')
+        self.assert_strict_equal(x['c'], u'\xe4')
+        x = urls.url_decode(b'a=\xff')
+        self.assert_strict_equal(x['a'], u'\ufffd')
+        self.assert_raises(UnicodeError, urls.url_decode, b'a=\xff',
+                           errors='strict')
+
     def test_url_bytes_decoding(self):
         x = urls.url_decode(b'foo=42&bar=23&uni=H%C3%A4nsel', charset=None)
         self.assert_strict_equal(x[b'foo'], b'42')
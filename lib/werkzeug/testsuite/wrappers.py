@@ -352,6 +352,24 @@ class WrappersTestCase(WerkzeugTestCase):
         request = wrappers.Request({'HTTP_USER_AGENT': 'foo'})
         assert not request.user_agent
 
+    def test_user_agent_parser_cache(self):
+        from werkzeug.useragents import UserAgentParser
+        parser = UserAgentParser()
+        parser.cache_size = 2
+        chrome = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/30.0.1599.101 Safari/537.36')
+        rv = parser(chrome)
+        self.assert_equal(rv, ('linux', 'chrome', '30.0.1599.101', None))
+        self.assert_true(parser(chrome) is rv)
+        parser('curl/7.30.0')
+        parser(chrome)
+        parser('Lynx/2.8.8dev.3')
+        self.assert_equal(list(parser._cache), ['Mozilla/5.0 (X11; Linux x86_64) '
+            'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/30.0.1599.101 '
+            'Safari/537.36', 'Lynx/2.8.8dev.3'])
+        self.assert_equal(parser('Lynx/2.8.8dev.3'),
+                          (None, 'lynx', '2.8.8dev.3', None))
+
     def test_stream_wrapping(self):
         class LowercasingStream(object):
             def __init__(self, stream):
@@ -446,6 +464,41 @@ class WrappersTestCase(WerkzeugTestCase):
         response.make_conditional(env)
         self.assert_equal(response.content_length, 999)
 
+    def test_etag_response_mixin_streaming(self):
+        consumed = []
+        def generate():
+            consumed.append(True)
+            yield u'Hello '
+            yield u'World'
+
+        response = wrappers.Response(generate())
+        response.add_etag()
+        self.assert_equal(response.get_etag(),
+                          ('b10a8db164e0754105b7a99be72e3fe5', False))
+        self.assert_equal(response.response, [b'Hello ', b'World'])
+        self.assert_equal(wrappers.generate_etag([b'Hello ', b'World']),
+                          wrappers.generate_etag(b'Hello World'))
+
+        del consumed[:]
+        env = create_environ()
+        env['HTTP_IF_NONE_MATCH'] = '"rev-42"'
+        response = wrappers.Response(generate())
+        response.add_etag(version='rev-42')
+        self.assert_equal(response.get_etag(), ('rev-42', False))
+        response.make_conditional(env)
+        self.assert_equal(response.status_code, 304)
+        self.assert_true('content-length' not in response.headers)
+        resp = wrappers.Response.from_app(response, env)
+        self.assert_equal(resp.status_code, 304)
+        self.assert_equal(consumed, [])
+
+        response = wrappers.Response(generate())
+        response.add_etag(version='rev-43')
+        response.make_conditional(env)
+        self.assert_equal(response.status_code, 200)
+        self.assert_equal(response.content_length, 11)
+        self.assert_equal(consumed, [True])
+
     def test_etag_response_mixin_freezing(self):
         class WithFreeze(wrappers.ETagResponseMixin, wrappers.BaseResponse):
             pass
@@ -283,6 +283,8 @@ class BytesURL(_URLTuple, _URLMixin):
 def _unquote_to_bytes(string, unsafe=''):
     if isinstance(string, text_type):
         string = string.encode('utf-8')
+    if b'%' not in string:
+        return bytes(string)
     if isinstance(unsafe, text_type):
         unsafe = unsafe.encode('utf-8')
     unsafe = frozenset(bytearray(unsafe))
@@ -454,7 +456,7 @@ def url_unquote(string, charset='utf-8', errors='replace', unsafe=''):
     """
     rv = _unquote_to_bytes(string, unsafe)
     if charset is not None:
-        rv = rv.decode(charset, errors)
+        rv = text_type(rv, charset, errors)
     return rv
 
 
@@ -652,22 +654,35 @@ def url_decode_stream(stream, charset='utf-8', decode_keys=False,
 
 
 def _url_decode_impl(pair_iter, charset, decode_keys, include_empty, errors):
+    coerce_keys = charset is not None and PY2 and not decode_keys
+    literal_type = None
     for pair in pair_iter:
         if not pair:
             continue
-        s = make_literal_wrapper(pair)
-        equal = s('=')
+        # all pairs come from splitting the same string, so the literals
+        # only have to be created once.
+        if type(pair) is not literal_type:
+            literal_type = type(pair)
+            s = make_literal_wrapper(pair)
+            equal, empty, quoted = s('='), s(''), (s('%'), s('+'))
+            fast = isinstance(pair, bytes) and charset is not None
         if equal in pair:
             key, value = pair.split(equal, 1)
         else:
             if not include_empty:
                 continue
             key = pair
-            value = s('')
-        key = url_unquote_plus(key, charset, errors)
-        if charset is not None and PY2 and not decode_keys:
+            value = empty
+        # pairs without escapes only have to be decoded.
+        if fast and quoted[0] not in pair and quoted[1] not in pair:
+            key = text_type(key, charset, errors)
+            value = text_type(value, charset, errors)
+        else:
+            key = url_unquote_plus(key, charset, errors)
+            value = url_unquote_plus(value, charset, errors)
+        if coerce_keys:
             key = try_coerce_native(key)
-        yield key, url_unquote_plus(value, charset, errors)
+        yield key, value
 
 
 def url_encode(obj, charset='utf-8', encode_keys=False, sort=False, key=None,
@@ -12,10 +12,20 @@
     :license: BSD, see LICENSE for more details.
 """
 import re
+from threading import Lock
+from collections import OrderedDict
 
 
 class UserAgentParser(object):
-    """A simple user agent parser.  Used by the `UserAgent`."""
+    """A simple user agent parser.  Used by the `UserAgent`.
+
+    The same few user agent strings show up over and over again, so the
+    results are kept in a least recently used cache of `cache_size`
+    strings.
+
+    .. versionchanged:: 0.9.4
+       Added the cache.
+    """
 
     platforms = (
         ('iphone|ios', 'iphone'),
@@ -62,12 +72,32 @@ class UserAgentParser(object):
         r'(?:\(|\[|;)\s*(\b\w{2}\b(?:-\b\w{2}\b)?)\s*(?:\]|\)|;)'
     )
 
+    #: the number of parsed user agent strings that are remembered.
+    cache_size = 1000
+
     def __init__(self):
         self.platforms = [(b, re.compile(a, re.I)) for a, b in self.platforms]
         self.browsers = [(b, re.compile(self._browser_version_re % a))
                          for a, b in self.browsers]
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
 
     def __call__(self, user_agent):
+        cache = self._cache
+        with self._cache_lock:
+            rv = cache.pop(user_agent, None)
+            if rv is not None:
+                cache[user_agent] = rv
+                return rv
+        rv = self._parse(user_agent)
+        if self.cache_size:
+            with self._cache_lock:
+                cache[user_agent] = rv
+                while len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+        return rv
+
+    def _parse(self, user_agent):
         for platform, regex in self.platforms:
             match = regex.search(user_agent)
             if match is not None:
@@ -1399,19 +1399,44 @@ class ETagResponseMixin(object):
             # wsgiref.
             if 'date' not in self.headers:
                 self.headers['Date'] = http_date()
-            if 'content-length' not in self.headers:
-                length = self.calculate_content_length()
-                if length is not None:
-                    self.headers['Content-Length'] = length
             if not is_resource_modified(environ, self.headers.get('etag'), None,
                                         self.headers.get('last-modified')):
+                # the body is not sent, so a streamed response is not
+                # consumed just to calculate its length.
                 self.status_code = 304
+            elif 'content-length' not in self.headers:
+                length = self.calculate_content_length()
+                if length is not None:
+                    self.headers['Content-Length'] = length
         return self
 
-    def add_etag(self, overwrite=False, weak=False):
-        """Add an etag for the current response if there is none yet."""
+    def add_etag(self, overwrite=False, weak=False, version=None):
+        """Add an etag for the current response if there is none yet.
+
+        The etag is generated by hashing the encoded response chunk by
+        chunk.  A streamed response is buffered for that once.  If the
+        caller already knows something that changes whenever the body
+        changes, like a revision number or a modification timestamp, it
+        can be passed as `version` and is used as etag instead.  In that
+        case the response body is not touched, so :meth:`make_conditional`
+        can answer with ``304 Not Modified`` without ever running a
+        generator::
+
+            response = Response(generate_rows(), mimetype='text/csv')
+            response.add_etag(version='rows-%d' % last_change)
+            return response.make_conditional(request)
+
+        .. versionchanged:: 0.9.4
+           Added the `version` parameter.  The body is no longer joined
+           into a single string for hashing.
+        """
         if overwrite or 'etag' not in self.headers:
-            self.set_etag(generate_etag(self.get_data()), weak)
+            if version is not None:
+                etag = text_type(version)
+            else:
+                self._ensure_sequence()
+                etag = generate_etag(self.iter_encoded())
+            self.set_etag(etag, weak)
 
     def set_etag(self, etag, weak=False):
         """Set the etag, and override the old one if there was one."""
@@ -13,6 +13,11 @@ class ReferencePropertyField(fields.SelectFieldBase):
     A field for ``db.ReferenceProperty``. The list items are rendered in a
     select.
 
+    The items of `query` are only fetched once per field.  The submitted
+    key is looked up in them.  If `limit` cut the list off, the key is
+    checked with a keys only run of `query`, which keeps its filters
+    enforced, and the entity is then fetched by key.
+
     :param reference_class:
         A db.Model class which will be used to generate the default query
         to make the list of items. If this is not specified, The `query`
@@ -27,12 +32,15 @@ class ReferencePropertyField(fields.SelectFieldBase):
         to allow `None` to be chosen.
     :param blank_text:
         Use this to override the default blank option's label.
+    :param limit:
+        If set, at most this many items are fetched for the list.  The
+        selected item is listed even if the limit cuts it off.
     """
     widget = widgets.Select()
 
     def __init__(self, label=None, validators=None, reference_class=None,
                  label_attr=None, get_label=None, allow_blank=False,
-                 blank_text='', **kwargs):
+                 blank_text='', limit=None, **kwargs):
         super(ReferencePropertyField, self).__init__(label, validators,
                                                      **kwargs)
         if label_attr is not None:
@@ -47,16 +55,15 @@ class ReferencePropertyField(fields.SelectFieldBase):
 
         self.allow_blank = allow_blank
         self.blank_text = blank_text
+        self.limit = limit
+        self._object_list = None
         self._set_data(None)
         if reference_class is not None:
             self.query = reference_class.all()
 
     def _get_data(self):
         if self._formdata is not None:
-            for obj in self.query:
-                if str(obj.key()) == self._formdata:
-                    self._set_data(obj)
-                    break
+            self._set_data(self._get_object(self._formdata))
         return self._data
 
     def _set_data(self, data):
@@ -65,14 +72,49 @@ class ReferencePropertyField(fields.SelectFieldBase):
 
     data = property(_get_data, _set_data)
 
+    def _get_object(self, value):
+        """Returns the entity of the submitted key if it is a result of
+        `query`, otherwise `None`.
+        """
+        from google.appengine.ext import db
+        try:
+            key = db.Key(value)
+        except Exception:
+            return None
+        object_list = self._get_object_list()
+        for obj in object_list:
+            if obj.key() == key:
+                return obj
+        if self.limit is None or len(object_list) < self.limit:
+            return None
+        # the list was capped, a db.Query is changed in place by filter()
+        # so the rest of it is scanned for the key without the entities
+        for result in self.query.run(keys_only=True):
+            if result == key:
+                return db.get(key)
+        return None
+
+    def _get_object_list(self):
+        if self._object_list is None:
+            if self.limit is None:
+                self._object_list = list(self.query)
+            else:
+                self._object_list = self.query.fetch(self.limit)
+        return self._object_list
+
     def iter_choices(self):
         if self.allow_blank:
             yield ('__None', self.blank_text, self.data is None)
 
-        for obj in self.query:
-            key = str(obj.key())
-            label = self.get_label(obj)
-            yield (key, label, (self.data.key() == obj.key()) if self.data else False)
+        data_key = self.data.key() if self.data else None
+        object_list = self._get_object_list()
+        if data_key is not None and \
+           not any(obj.key() == data_key for obj in object_list):
+            # the list was capped before the selected item was reached
+            object_list = [self.data] + object_list
+        for obj in object_list:
+            key = obj.key()
+            yield (str(key), self.get_label(obj), key == data_key)
 
     def process_formdata(self, valuelist):
         if valuelist:
@@ -83,18 +125,20 @@ class ReferencePropertyField(fields.SelectFieldBase):
                 self._formdata = valuelist[0]
 
     def pre_validate(self, form):
-        if not self.allow_blank or self.data is not None:
-            for obj in self.query:
-                if str(self.data.key()) == str(obj.key()):
-                    break
-            else:
-                raise ValueError(self.gettext('Not a valid choice'))
+        if self.data is None and not self.allow_blank:
+            raise ValueError(self.gettext('Not a valid choice'))
 
 
 class KeyPropertyField(fields.SelectFieldBase):
     """
     A field for ``ndb.KeyProperty``. The list items are rendered in a select.
 
+    The options carry the urlsafe keys of the items, so keys with parents
+    can be selected as well.  The submitted key is checked with a keys only
+    query on `query` which keeps its filters enforced, and the entity is
+    then fetched by key.  The list items are fetched once, when the select
+    is rendered.
+
     :param reference_class:
         A db.Model class which will be used to generate the default query
         to make the list of items. If this is not specified, The `query`
@@ -109,36 +153,47 @@ class KeyPropertyField(fields.SelectFieldBase):
         to allow `None` to be chosen.
     :param blank_text:
         Use this to override the default blank option's label.
+    :param label_property:
+        The name of an indexed property the list items are labelled with.
+        If set, the list is fetched with a projection query on this
+        property, and it is used as the label unless `get_label` is given.
+        Entities without a value for the property are not listed.
+    :param limit:
+        If set, at most this many items are fetched for the list.  The
+        selected item is listed even if the limit cuts it off.
     """
     widget = widgets.Select()
 
     def __init__(self, label=None, validators=None, reference_class=None,
                  label_attr=None, get_label=None, allow_blank=False,
-                 blank_text=u'', **kwargs):
+                 blank_text=u'', label_property=None, limit=None, **kwargs):
         super(KeyPropertyField, self).__init__(label, validators,
                                                      **kwargs)
         if label_attr is not None:
             warnings.warn('label_attr= will be removed in WTForms 1.1, use get_label= instead.', DeprecationWarning)
             self.get_label = operator.attrgetter(label_attr)
         elif get_label is None:
-            self.get_label = lambda x: x
-        elif isinstance(get_label, basestring):
+            if label_property is not None:
+                self.get_label = operator.attrgetter(label_property)
+            else:
+                self.get_label = lambda x: x
+        elif isinstance(get_label, string_types):
             self.get_label = operator.attrgetter(get_label)
         else:
             self.get_label = get_label
 
         self.allow_blank = allow_blank
         self.blank_text = blank_text
+        self.label_property = label_property
+        self.limit = limit
+        self._object_list = None
         self._set_data(None)
         if reference_class is not None:
             self.query = reference_class.query()
 
     def _get_data(self):
         if self._formdata is not None:
-            for obj in self.query:
-                if str(obj.key.id()) == self._formdata:
-                    self._set_data(obj)
-                    break
+            self._set_data(self._get_object(self._formdata))
         return self._data
 
     def _set_data(self, data):
@@ -147,14 +202,44 @@ class KeyPropertyField(fields.SelectFieldBase):
 
     data = property(_get_data, _set_data)
 
+    def _get_object(self, value):
+        """Returns the entity of the submitted urlsafe key if it is a result
+        of `query`, otherwise `None`.
+        """
+        from google.appengine.ext import ndb
+        try:
+            key = ndb.Key(urlsafe=value)
+        except Exception:
+            # the decoding errors of the datastore are not exposed by ndb
+            return None
+        if self.query.kind is not None and key.kind() != self.query.kind:
+            return None
+        if self.query.filter(ndb.Model._key == key).get(keys_only=True) is None:
+            return None
+        return key.get()
+
+    def _get_object_list(self):
+        if self._object_list is None:
+            options = {}
+            if self.label_property is not None:
+                options['projection'] = [self.label_property]
+            self._object_list = self.query.fetch(self.limit, **options)
+        return self._object_list
+
     def iter_choices(self):
         if self.allow_blank:
             yield (u'__None', self.blank_text, self.data is None)
 
-        for obj in self.query:
-            key = str(obj.key.id())
+        data_key = self.data.key if self.data else None
+        object_list = self._get_object_list()
+        if data_key is not None and \
+           not any(obj.key == data_key for obj in object_list):
+            # the list was capped before the selected item was reached
+            object_list = [self.data] + object_list
+        for obj in object_list:
+            key = obj.key.urlsafe()
             label = self.get_label(obj)
-            yield (key, label, (self.data.key == obj.key) if self.data else False)
+            yield (key, label, obj.key == data_key)
 
     def process_formdata(self, valuelist):
         if valuelist:
@@ -165,13 +250,7 @@ class KeyPropertyField(fields.SelectFieldBase):
                 self._formdata = valuelist[0]
 
     def pre_validate(self, form):
-        if self.data is not None:
-            for obj in self.query:
-                if self.data.key == obj.key:
-                    break
-            else:
-                raise ValueError(self.gettext(u'Not a valid choice'))
-        elif not self.allow_blank:
+        if self.data is None and not self.allow_blank:
             raise ValueError(self.gettext(u'Not a valid choice'))
 
 
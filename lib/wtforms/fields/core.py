@@ -172,7 +172,10 @@ class Field(object):
 
         # Run validators
         if not stop_validation:
-            chain = itertools.chain(self.validators, extra_validators)
+            if extra_validators:
+                chain = itertools.chain(self.validators, extra_validators)
+            else:
+                chain = self.validators
             stop_validation = self._run_validation_chain(form, chain)
 
         # Call post_validate
@@ -238,10 +241,12 @@ class Field(object):
         """
         self.process_errors = []
         if data is _unset_value:
-            try:
-                data = self.default()
-            except TypeError:
-                data = self.default
+            data = self.default
+            if callable(data):
+                try:
+                    data = data()
+                except TypeError:
+                    data = self.default
 
         self.object_data = data
 
@@ -311,7 +316,11 @@ class UnboundField(object):
         self.creation_counter = UnboundField.creation_counter
 
     def bind(self, form, name, prefix='', translations=None, **kwargs):
-        return self.field_class(_form=form, _prefix=prefix, _name=name, _translations=translations, *self.args, **dict(self.kwargs, **kwargs))
+        if kwargs:
+            kwargs = dict(self.kwargs, **kwargs)
+        else:
+            kwargs = self.kwargs
+        return self.field_class(_form=form, _prefix=prefix, _name=name, _translations=translations, *self.args, **kwargs)
 
     def __repr__(self):
         return '<UnboundField(%s, %r, %r)>' % (self.field_class.__name__, self.args, self.kwargs)
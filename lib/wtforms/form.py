@@ -101,6 +101,11 @@ class BaseForm(object):
             else:
                 raise TypeError("formdata should be a multidict-type wrapper that supports the 'getlist' method")
 
+        if obj is None and not kwargs:
+            for field in itervalues(self._fields):
+                field.process(formdata)
+            return
+
         for name, field, in iteritems(self._fields):
             if obj is not None and hasattr(obj, name):
                 field.process(formdata, getattr(obj, name))
@@ -122,12 +127,11 @@ class BaseForm(object):
         """
         self._errors = None
         success = True
+        if not extra_validators:
+            extra_validators = {}
+        no_extra = tuple()
         for name, field in iteritems(self._fields):
-            if extra_validators is not None and name in extra_validators:
-                extra = extra_validators[name]
-            else:
-                extra = tuple()
-            if not field.validate(self, extra):
+            if not field.validate(self, extra_validators.get(name, no_extra)):
                 success = False
         return success
 
@@ -152,12 +156,17 @@ class FormMeta(type):
     If any fields are added/removed from the form, the list is cleared to be
     re-generated on the next instantiaton.
 
+    Together with the list, the inline ``validate_<fieldname>`` validators
+    of the form are collected into `_inline_validators`, so validation does
+    not have to look them up for every field of every instance.
+
     Any properties which begin with an underscore or are not `UnboundField`
     instances are ignored by the metaclass.
     """
     def __init__(cls, name, bases, attrs):
         type.__init__(cls, name, bases, attrs)
         cls._unbound_fields = None
+        cls._inline_validators = None
 
     def __call__(cls, *args, **kwargs):
         """
@@ -175,13 +184,21 @@ class FormMeta(type):
             # to ensure a stable sort.
             fields.sort(key=lambda x: (x[1].creation_counter, x[0]))
             cls._unbound_fields = fields
+
+            inline_validators = {}
+            for name, _ in fields:
+                inline = getattr(cls, 'validate_%s' % name, None)
+                if inline is not None:
+                    inline_validators[name] = (inline,)
+            cls._inline_validators = inline_validators
         return type.__call__(cls, *args, **kwargs)
 
     def __setattr__(cls, name, value):
         """
         Add an attribute to the class, clearing `_unbound_fields` if needed.
         """
-        if not name.startswith('_') and hasattr(value, '_formfield'):
+        if not name.startswith('_') and (hasattr(value, '_formfield') or
+                                         name.startswith('validate_')):
             cls._unbound_fields = None
         type.__setattr__(cls, name, value)
 
@@ -256,13 +273,7 @@ class Form(with_metaclass(FormMeta, BaseForm)):
         Validates the form by calling `validate` on each field, passing any
         extra `Form.validate_<fieldname>` validators to the field validator.
         """
-        extra = {}
-        for name in self._fields:
-            inline = getattr(self.__class__, 'validate_%s' % name, None)
-            if inline is not None:
-                extra[name] = [inline]
-
-        return super(Form, self).validate(extra)
+        return super(Form, self).validate(self._inline_validators)
 
 
 class WebobInputWrapper(object):
@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+import re
 from cgi import escape
 
 from wtforms.compat import text_type, string_types, iteritems
@@ -11,6 +12,21 @@ __all__ = (
 )
 
 
+_needs_escape = re.compile(r'[&<>"]').search
+
+_special_params = {'class_': 'class', 'class__': 'class_', 'for_': 'for'}
+
+
+def _escape(s, quote=False):
+    """
+    Like `cgi.escape`, but returns `s` itself if there is nothing to escape,
+    which is the case for most attribute values and labels.
+    """
+    if _needs_escape(s) is None:
+        return s
+    return escape(s, quote)
+
+
 def html_params(**kwargs):
     """
     Generate HTML parameters from inputted keyword arguments.
@@ -24,13 +40,13 @@ def html_params(**kwargs):
     True
     """
     params = []
-    for k,v in sorted(iteritems(kwargs)):
-        if k in ('class_', 'class__', 'for_'):
-            k = k[:-1]
+    for k in sorted(kwargs):
+        v = kwargs[k]
+        k = _special_params.get(k, k)
         if v is True:
             params.append(k)
         else:
-            params.append('%s="%s"' % (text_type(k), escape(text_type(v), quote=True)))
+            params.append('%s="%s"' % (text_type(k), _escape(text_type(v), True)))
     return ' '.join(params)
 
 
@@ -221,7 +237,7 @@ class TextArea(object):
     """
     def __call__(self, field, **kwargs): 
         kwargs.setdefault('id', field.id)
-        return HTMLString('<textarea %s>%s</textarea>' % (html_params(name=field.name, **kwargs), escape(text_type(field._value()))))
+        return HTMLString('<textarea %s>%s</textarea>' % (html_params(name=field.name, **kwargs), _escape(text_type(field._value()))))
 
 
 class Select(object):
@@ -243,8 +259,11 @@ class Select(object):
         if self.multiple:
             kwargs['multiple'] = True
         html = ['<select %s>' % html_params(name=field.name, **kwargs)]
-        for val, label, selected in field.iter_choices():
-            html.append(self.render_option(val, label, selected))
+        if getattr(self.render_option, '__func__', None) is _render_option:
+            html.extend(_render_options(field.iter_choices()))
+        else:
+            for val, label, selected in field.iter_choices():
+                html.append(self.render_option(val, label, selected))
         html.append('</select>')
         return HTMLString(''.join(html))
 
@@ -253,7 +272,25 @@ class Select(object):
         options = dict(kwargs, value=value)
         if selected:
             options['selected'] = True
-        return HTMLString('<option %s>%s</option>' % (html_params(**options), escape(text_type(label))))
+        return HTMLString('<option %s>%s</option>' % (html_params(**options), _escape(text_type(label))))
+
+
+_render_option = Select.render_option.__func__
+
+
+def _render_options(choices):
+    """
+    Renders `choices` the same way as `Select.render_option` without extra
+    attributes does, without building the attributes of every option
+    through `html_params`.
+    """
+    for value, label, selected in choices:
+        if value is True:
+            value = 'value'
+        else:
+            value = 'value="%s"' % _escape(text_type(value), True)
+        yield '<option %s%s>%s</option>' % (selected and 'selected ' or '',
+                                            value, _escape(text_type(label)))
 
 
 class Option(object):
@@ -2,7 +2,6 @@ from flask.app import Flask
 from flask.ext.admin.base import MenuLink
 import settings
 from todo_app.admin_views import AdminIndex
-from werkzeug.debug import DebuggedApplication
 from flask_admin import Admin
 from google.appengine.api import users
 
@@ -13,8 +12,15 @@ flask_app.config.from_object(settings)
 admin = Admin(flask_app, name='TODO', index_view=AdminIndex(url='/admin', name='Home'), )
 admin.add_link(MenuLink(name='Logout',url = users.create_logout_url('/')))
 
+
+@admin.menu_role
+def admin_menu_role():
+    return users.is_current_user_admin()
+
 if flask_app.config['DEBUG']:
     flask_app.debug = True
+    # the debugger is only loaded on the development server
+    from werkzeug.debug import DebuggedApplication
     app = DebuggedApplication(flask_app, evalex=True)
 
 app = flask_app
@@ -1,8 +1,27 @@
 import os
 import sys
+import threading
 sys.path.insert(1, os.path.join(os.path.abspath('.'), 'lib'))
-from google.appengine.ext import endpoints
-from todo_app.apis import TodoApi
 
 from main import app
-api = endpoints.api_server([TodoApi], restricted=False)
\ No newline at end of file
+
+_api_server = None
+_api_server_lock = threading.Lock()
+
+
+def get_api_server():
+    """Creates the Cloud Endpoints server on first use, so that instances
+    serving only the web app do not import the API and its messages."""
+    global _api_server
+    if _api_server is None:
+        with _api_server_lock:
+            if _api_server is None:
+                from google.appengine.ext import endpoints
+                from todo_app.apis import TodoApi
+                _api_server = endpoints.api_server([TodoApi],
+                                                   restricted=False)
+    return _api_server
+
+
+def api(environ, start_response):
+    return get_api_server()(environ, start_response)
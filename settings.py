@@ -27,4 +27,11 @@ CSRF_SESSION_KEY = SESSION_KEY
 
 CSRF_ENABLED = True
 
-
+# Keep all templates of the app and Flask-Admin in memory once warmed up
+TEMPLATES_CACHE_SIZE = 200
+
+# Templates precompiled with compile_templates.py
+TEMPLATES_PRECOMPILED_PATH = None
+_compiled_templates = os.path.join(os.path.dirname(__file__), 'compiled_templates.zip')
+if os.path.exists(_compiled_templates):
+    TEMPLATES_PRECOMPILED_PATH = _compiled_templates
@@ -0,0 +1,310 @@
+import base64
+import json
+import sys
+import types
+import unittest
+
+from wtforms import Form
+from wtforms.ext.appengine.fields import KeyPropertyField, \
+    ReferencePropertyField
+
+
+class DummyPostData(dict):
+    def getlist(self, key):
+        v = self[key]
+        if not isinstance(v, (list, tuple)):
+            v = [v]
+        return v
+
+
+class Datastore(object):
+    """Keeps the entities of the stubbed ndb module and counts the RPCs."""
+
+    def __init__(self):
+        self.entities = []
+        self.queries = 0
+        self.gets = 0
+
+
+class Key(object):
+    datastore = None
+
+    def __init__(self, *pairs, **kwargs):
+        if 'urlsafe' in kwargs:
+            try:
+                pairs = json.loads(base64.urlsafe_b64decode(
+                    str(kwargs['urlsafe'])))
+            except (TypeError, ValueError):
+                raise TypeError('Invalid key')
+        self.pairs = tuple(pairs)
+
+    def kind(self):
+        return self.pairs[-2]
+
+    def urlsafe(self):
+        return base64.urlsafe_b64encode(json.dumps(self.pairs))
+
+    def get(self):
+        self.datastore.gets += 1
+        for entity in self.datastore.entities:
+            if entity.key == self:
+                return entity
+
+    def __eq__(self, other):
+        return isinstance(other, Key) and self.pairs == other.pairs
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.pairs)
+
+
+class KeyFilter(object):
+    def __eq__(self, key):
+        return lambda entity: entity.key == key
+
+
+class Model(object):
+    _key = KeyFilter()
+
+
+class Query(object):
+    def __init__(self, datastore, kind, filters=()):
+        self.datastore = datastore
+        self.kind = kind
+        self.filters = filters
+
+    def filter(self, *filters):
+        return Query(self.datastore, self.kind, self.filters + filters)
+
+    def _run(self):
+        self.datastore.queries += 1
+        return [e for e in self.datastore.entities
+                if e.key.kind() == self.kind and
+                all(f(e) for f in self.filters)]
+
+    def fetch(self, limit=None, projection=None):
+        return self._run()[:limit]
+
+    def get(self, keys_only=False):
+        for entity in self._run():
+            return entity.key if keys_only else entity
+
+
+class Author(object):
+    def __init__(self, key, name):
+        self.key = key
+        self.name = name
+
+
+class DbKey(object):
+    """The key of the stubbed db module, encoded like the ndb keys."""
+
+    def __init__(self, encoded):
+        try:
+            self.pairs = tuple(json.loads(base64.urlsafe_b64decode(
+                str(encoded))))
+        except (TypeError, ValueError):
+            raise TypeError('Invalid key')
+
+    @classmethod
+    def from_path(cls, *pairs):
+        return cls(base64.urlsafe_b64encode(json.dumps(pairs)))
+
+    def kind(self):
+        return self.pairs[-2]
+
+    def __str__(self):
+        return base64.urlsafe_b64encode(json.dumps(self.pairs))
+
+    def __eq__(self, other):
+        return isinstance(other, DbKey) and self.pairs == other.pairs
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.pairs)
+
+
+class DbQuery(object):
+    def __init__(self, datastore, kind, filters=()):
+        self.datastore = datastore
+        self.kind = kind
+        self.filters = filters
+
+    def _run(self):
+        self.datastore.queries += 1
+        return [e for e in self.datastore.entities
+                if e.key().kind() == self.kind and
+                all(f(e) for f in self.filters)]
+
+    def __iter__(self):
+        return iter(self._run())
+
+    def fetch(self, limit):
+        return self._run()[:limit]
+
+    def run(self, keys_only=False):
+        for entity in self._run():
+            yield entity.key() if keys_only else entity
+
+
+class DbAuthor(object):
+    def __init__(self, key, name):
+        self._key = key
+        self.name = name
+
+    def key(self):
+        return self._key
+
+
+class StubbedAppEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.datastore = Datastore()
+        Key.datastore = self.datastore
+
+        def get(key):
+            self.datastore.gets += 1
+            for entity in self.datastore.entities:
+                if entity.key() == key:
+                    return entity
+
+        ndb = types.ModuleType('google.appengine.ext.ndb')
+        ndb.Key = Key
+        ndb.Model = Model
+        db = types.ModuleType('google.appengine.ext.db')
+        db.Key = DbKey
+        db.get = get
+        self.modules = {}
+        for name in ('google', 'google.appengine', 'google.appengine.ext',
+                     'google.appengine.ext.ndb', 'google.appengine.ext.db'):
+            self.modules[name] = sys.modules.get(name)
+            sys.modules[name] = types.ModuleType(name)
+        sys.modules['google.appengine.ext.ndb'] = ndb
+        sys.modules['google.appengine.ext'].ndb = ndb
+        sys.modules['google.appengine.ext.db'] = db
+        sys.modules['google.appengine.ext'].db = db
+
+    def tearDown(self):
+        for name, module in self.modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+class KeyPropertyFieldTestCase(StubbedAppEngineTestCase):
+    def setUp(self):
+        super(KeyPropertyFieldTestCase, self).setUp()
+
+        self.first = Author(Key('Author', 1), u'first')
+        self.second = Author(Key('Author', 2), u'second')
+        self.child = Author(Key('Group', 'a', 'Author', 1), u'child')
+        self.datastore.entities = [self.first, self.second, self.child]
+
+    def make_form(self, query=None, formdata=None, **kwargs):
+        class F(Form):
+            author = KeyPropertyField(get_label='name', **kwargs)
+        form = F(formdata)
+        form.author.query = query or Query(self.datastore, 'Author')
+        return form
+
+    def test_resolve_by_key(self):
+        form = self.make_form(formdata=DummyPostData(
+            author=self.child.key.urlsafe()))
+        self.assertTrue(form.validate())
+        self.assertTrue(form.author.data is self.child)
+        self.assertEqual(self.datastore.queries, 1)
+        self.assertEqual(self.datastore.gets, 1)
+
+        choices = list(form.author.iter_choices())
+        self.assertEqual(len(choices), 3)
+        self.assertEqual(choices[2], (self.child.key.urlsafe(), u'child', True))
+        list(form.author.iter_choices())
+        self.assertEqual(self.datastore.queries, 2)
+
+    def test_query_filters(self):
+        query = Query(self.datastore, 'Author',
+                      (lambda e: e.name != u'second',))
+        form = self.make_form(query, DummyPostData(
+            author=self.second.key.urlsafe()))
+        self.assertFalse(form.validate())
+        self.assertTrue(form.author.data is None)
+        self.assertEqual(self.datastore.gets, 0)
+
+    def test_invalid_keys(self):
+        for value in (u'garbage', Key('Book', 1).urlsafe(),
+                      Key('Author', 3).urlsafe()):
+            form = self.make_form(formdata=DummyPostData(author=value))
+            self.assertFalse(form.validate())
+
+        form = self.make_form(formdata=DummyPostData(author=u'__None'),
+                              allow_blank=True)
+        self.assertTrue(form.validate())
+
+    def test_limit(self):
+        form = self.make_form(formdata=DummyPostData(
+            author=self.child.key.urlsafe()), limit=1)
+        self.assertTrue(form.validate())
+        choices = list(form.author.iter_choices())
+        self.assertEqual([label for _, label, _ in choices],
+                         [u'child', u'first'])
+
+
+class ReferencePropertyFieldTestCase(StubbedAppEngineTestCase):
+    def setUp(self):
+        super(ReferencePropertyFieldTestCase, self).setUp()
+
+        self.authors = [DbAuthor(DbKey.from_path('Author', x), u'a%d' % x)
+                        for x in range(5)]
+        self.datastore.entities = list(self.authors)
+
+    def make_form(self, query=None, formdata=None, **kwargs):
+        class F(Form):
+            author = ReferencePropertyField(get_label='name', **kwargs)
+        form = F(formdata)
+        form.author.query = query or DbQuery(self.datastore, 'Author')
+        return form
+
+    def test_resolve_from_list(self):
+        form = self.make_form(formdata=DummyPostData(
+            author=str(self.authors[3].key())))
+        self.assertTrue(form.validate())
+        self.assertTrue(form.author.data is self.authors[3])
+        self.assertEqual(len(list(form.author.iter_choices())), 5)
+        self.assertEqual(self.datastore.queries, 1)
+        self.assertEqual(self.datastore.gets, 0)
+
+    def test_limit(self):
+        form = self.make_form(formdata=DummyPostData(
+            author=str(self.authors[3].key())), limit=2)
+        self.assertTrue(form.validate())
+        self.assertTrue(form.author.data is self.authors[3])
+        self.assertEqual(self.datastore.gets, 1)
+
+        choices = list(form.author.iter_choices())
+        self.assertEqual([label for _, label, _ in choices],
+                         [u'a3', u'a0', u'a1'])
+        self.assertEqual(choices[0][2], True)
+
+    def test_query_filters(self):
+        query = DbQuery(self.datastore, 'Author',
+                        (lambda e: e.name != u'a4',))
+        for limit in (None, 2):
+            form = self.make_form(query, DummyPostData(
+                author=str(self.authors[4].key())), limit=limit)
+            self.assertFalse(form.validate())
+            self.assertTrue(form.author.data is None)
+        self.assertEqual(self.datastore.gets, 0)
+
+    def test_invalid_keys(self):
+        for value in (u'garbage', str(DbKey.from_path('Book', 1))):
+            form = self.make_form(formdata=DummyPostData(author=value),
+                                  limit=2)
+            self.assertFalse(form.validate())
+
+        form = self.make_form(formdata=DummyPostData(author=u'__None'),
+                              allow_blank=True)
+        self.assertTrue(form.validate())
@@ -6,3 +6,11 @@ class IndexTestCase(AppengineTestCase):
         logging.info("Starting ")
         resp = self.app.get('/')
         self.assertEquals(resp.status,"200 OK","Error")
+
+
+class WarmupTestCase(AppengineTestCase):
+    def test_warmup(self):
+        from main import app
+        resp = self.app.get('/_ah/warmup')
+        self.assertEquals(resp.status,"200 OK","Error")
+        self.assertTrue(len(app.jinja_env.cache) > 0)
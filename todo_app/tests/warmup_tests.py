@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from flask import Flask
+from flask.templating import precompile_templates
+from flask_admin import Admin
+from todo_app.warmup import compile_templates
+
+
+def create_app():
+    app = Flask(__name__)
+    Admin(app)
+    return app
+
+
+class CompileTemplatesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_compile_templates(self):
+        app = create_app()
+        count = compile_templates(app)
+        self.assertTrue(count > 0)
+        self.assertEquals(len(app.jinja_env.cache), count)
+
+    def test_compile_precompiled_templates(self):
+        target = os.path.join(self.folder, 'compiled_templates.zip')
+        precompile_templates(create_app(), target)
+
+        app = create_app()
+        app.config['TEMPLATES_PRECOMPILED_PATH'] = target
+        app.config['TEMPLATES_CACHE_SIZE'] = 200
+        count = compile_templates(app)
+        self.assertTrue(count > 0)
+        self.assertEquals(len(app.jinja_env.cache), count)
+        self.assertEquals(app.jinja_env.cache.capacity, 200)
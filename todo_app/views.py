@@ -1,5 +1,6 @@
 from main import app
 from flask import render_template
+from todo_app.warmup import warmup as warmup_app
 
 # Flask views
 @app.route('/')
@@ -8,5 +9,5 @@ def index():
 
 @app.route('/_ah/warmup')
 def warmup():
-    #TODO: Warmup
+    warmup_app(app)
     return 'Warming Up...'
\ No newline at end of file
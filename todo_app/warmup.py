@@ -0,0 +1,59 @@
+import logging
+import time
+
+from werkzeug.exceptions import HTTPException
+
+
+def compile_templates(app):
+    """Loads every template into the Jinja2 cache, so that the first
+    requests do not have to compile them.  The cache has to be large enough
+    to hold them all, see TEMPLATES_CACHE_SIZE in settings.py."""
+    env = app.jinja_env
+    # the names come from the template folders, the loader of a precompiled
+    # bundle cannot list its templates
+    names = [name for name in app.create_global_jinja_loader().list_templates()
+             if name.endswith('.html') and not name.startswith('.')]
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+def prime_url_map(app):
+    """Sorts the URL rules and matches the index once, which the first
+    request would do otherwise."""
+    adapter = app.url_map.bind('localhost')
+    try:
+        adapter.match('/')
+    except HTTPException:
+        pass
+    return len(list(app.url_map.iter_rules()))
+
+
+def prime_api_messages():
+    """Creates the Cloud Endpoints server, which imports the API and
+    creates the ProtoRPC message classes of every API method."""
+    from run import get_api_server
+    from todo_app.apis import TodoApi
+    get_api_server()
+    methods = TodoApi.all_remote_methods()
+    for method in methods.values():
+        method.remote.request_type.all_fields()
+        method.remote.response_type.all_fields()
+    return len(methods)
+
+
+def warmup(app):
+    """Runs all warmup steps and returns a list of the steps, how long each
+    took and the number of items it warmed."""
+    steps = [('templates', lambda: compile_templates(app)),
+             ('url map', lambda: prime_url_map(app)),
+             ('api messages', prime_api_messages)]
+    result = []
+    for name, func in steps:
+        start = time.time()
+        count = func()
+        duration = time.time() - start
+        logging.info('Warmup of %s: %d in %.1f ms', name, count,
+                     duration * 1000)
+        result.append((name, duration, count))
+    return result